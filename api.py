@@ -0,0 +1,441 @@
+"""
+API HTTP somente leitura (JSON) sobre os mesmos dados do dashboard.
+
+As tabelas são as que o `NHLDataAnalyzer` carrega (snapshot da versão atual
+ou, sem ele, as funções `build_*` do `snapshot.py`), montadas uma vez por
+versão dos dados. Endpoints:
+
+- `GET /`: versão dos dados e lista de endpoints;
+- `GET /seasons`: temporadas disponíveis;
+- `GET /standings/{temporada}`: classificação da temporada (`division=`);
+- `GET /players`: estatísticas dos jogadores (`team=`, `position=`);
+- `GET /players/{id}` e `/players/{id}/seasons`: um jogador e o histórico;
+- `GET /leaders/{estatística}`: líderes (`position=`, `team=`, `min_games=`);
+- `GET /goalies`: estatísticas dos goleiros (`season=`, `team=`);
+- `GET /teams` e `/teams/{sigla}/roster`: resumo dos elencos e o elenco.
+
+As listas aceitam projeção (`fields=goals,points`), ordenação
+(`sort=-points,goals`) e paginação (`limit=`, `offset=`); colunas repetidas
+ou um `-` fora de `sort` dão 400.
+
+As respostas já serializadas ficam em um cache LRU em memória, com a versão
+dos dados na chave; o `ETag` de toda resposta 200 é a versão dos dados, então
+um `If-None-Match` com a versão atual recebe 304 (sem corpo) nas rotas
+válidas. Quando o manifesto muda de versão, as tabelas são recarregadas e o
+cache é esvaziado.
+
+Uso:
+    python api.py [--port 8000] [--cache-size 1024]
+    curl -i "http://127.0.0.1:8000/leaders/points?position=D&limit=5"
+"""
+
+import argparse
+import json
+import re
+import threading
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from roster import TeamRosterIndex
+from snapshot import (
+    build_goalie_table,
+    build_player_season_table,
+    build_player_table,
+    build_team_table,
+    read_snapshot,
+    source_version,
+)
+from storage import MANIFEST_PATH, load_manifest
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 1000
+DEFAULT_CACHE_SIZE = 1024
+
+# Colunas padrão da tabela de líderes (mais a estatística pedida)
+LEADER_FIELDS = [
+    "playerId",
+    "firstName",
+    "lastName",
+    "currentTeamAbbrev",
+    "position",
+    "gamesPlayed",
+]
+
+ENDPOINTS = [
+    "/seasons",
+    "/standings/{season}",
+    "/players",
+    "/players/{id}",
+    "/players/{id}/seasons",
+    "/leaders/{stat}",
+    "/goalies",
+    "/teams",
+    "/teams/{team}/roster",
+]
+
+STANDINGS_PATH = re.compile(r"^/standings/(\d{8})$")
+PLAYER_PATH = re.compile(r"^/players/(\d+)(/seasons)?$")
+LEADERS_PATH = re.compile(r"^/leaders/(\w+)$")
+ROSTER_PATH = re.compile(r"^/teams/([A-Za-z]{2,3})/roster$")
+
+
+class APIError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class DataStore:
+    """Tabelas do dashboard de uma versão dos dados (somente leitura)."""
+
+    def __init__(self, version):
+        snapshot = read_snapshot(version)
+
+        def frame(name, build):
+            if snapshot is not None and name in snapshot:
+                return snapshot.frame(name)
+            return build()
+
+        self.version = version
+        self.extracted_at = load_manifest().get("extracted_at")
+        teams = frame("teams", build_team_table)
+        self.players = frame("players", build_player_table)
+        player_seasons = frame("player_seasons", build_player_season_table)
+        self.goalies = frame("goalies", build_goalie_table)
+
+        self.standings = (
+            {}
+            if teams.empty
+            else {
+                season: df.sort_values(
+                    ["team_points", "pointPctg"], ascending=False, ignore_index=True
+                )
+                for season, df in teams.groupby("season")
+            }
+        )
+        self.player_rows = (
+            {}
+            if self.players.empty
+            else {
+                int(player_id): row
+                for row, player_id in enumerate(self.players["playerId"])
+            }
+        )
+        self.player_seasons = (
+            {}
+            if player_seasons.empty
+            else {
+                int(player_id): df.reset_index(drop=True)
+                for player_id, df in player_seasons.groupby("playerId")
+            }
+        )
+
+        self.rosters = None
+        if snapshot is not None and "roster_rows" in snapshot:
+            tables = {
+                name: snapshot.table(name)
+                for name in ("roster_rows", "roster_teams", "roster_summary")
+            }
+            self.rosters = TeamRosterIndex.from_tables(self.players, tables)
+        elif not self.players.empty:
+            self.rosters = TeamRosterIndex(self.players)
+
+
+def int_param(query, name, default, minimum=0, maximum=None):
+    """Parâmetro inteiro da query string, validado."""
+
+    value = query.get(name)
+    if value is None:
+        return default
+    try:
+        value = int(value)
+    except ValueError:
+        raise APIError(400, f"'{name}' deve ser um inteiro") from None
+    if value < minimum or (maximum is not None and value > maximum):
+        raise APIError(400, f"'{name}' fora do intervalo permitido")
+    return value
+
+
+def columns_param(query, name, frame, descending=False):
+    """Lista de colunas separadas por vírgula (`None` se ausente).
+
+    Com `descending`, cada coluna pode vir com o prefixo `-` (ordem
+    decrescente em `sort`). Colunas repetidas são recusadas.
+    """
+
+    value = query.get(name)
+    if not value:
+        return None
+    columns = [column.strip() for column in value.split(",") if column.strip()]
+    names = [column.lstrip("-") if descending else column for column in columns]
+    unknown = [column for column in names if column not in frame.columns]
+    if unknown:
+        raise APIError(400, f"colunas desconhecidas: {', '.join(unknown)}")
+    repeated = sorted({column for column in names if names.count(column) > 1})
+    if repeated:
+        raise APIError(400, f"colunas repetidas: {', '.join(repeated)}")
+    return columns
+
+
+def filter_rows(frame, query, filters, multi=()):
+    """Aplica os filtros de igualdade `parâmetro → coluna` presentes na query.
+
+    As colunas em `multi` guardam vários valores separados por vírgula (os
+    times de um jogador trocado, `TOR,BOS`) e filtram por pertinência.
+    """
+
+    for name, column in filters.items():
+        value = query.get(name)
+        if value is None:
+            continue
+        values = frame[column].astype(str)
+        if column in multi:
+            pattern = rf"(?:^|,)\s*{re.escape(value)}\s*(?:,|$)"
+            mask = values.str.contains(pattern, na=False)
+        else:
+            mask = values == value
+        frame = frame[mask]
+    return frame
+
+
+def frame_json(frame):
+    """Linhas de um DataFrame em JSON (`NaN` vira `null`)."""
+
+    if frame.empty:
+        return "[]"
+    return frame.to_json(orient="records", force_ascii=False, date_format="iso")
+
+
+def envelope(store, data, **meta):
+    """Resposta serializada: metadados mais `data` (JSON já pronto)."""
+
+    head = json.dumps({"version": store.version, **meta}, ensure_ascii=False)
+    return f'{head[:-1]}, "data": {data}}}'
+
+
+def page(store, frame, query, sort=None, fields=None):
+    """Ordena, pagina e projeta uma lista. `sort` e `fields` são os padrões."""
+
+    sort = columns_param(query, "sort", frame, descending=True) or sort
+    if sort:
+        frame = frame.sort_values(
+            [column.lstrip("-") for column in sort],
+            ascending=[not column.startswith("-") for column in sort],
+            kind="stable",
+        )
+    fields = columns_param(query, "fields", frame) or fields
+    limit = int_param(query, "limit", DEFAULT_LIMIT, 1, MAX_LIMIT)
+    offset = int_param(query, "offset", 0)
+
+    rows = frame.iloc[offset : offset + limit]
+    if fields:
+        rows = rows[fields]
+    return envelope(
+        store, frame_json(rows), total=len(frame), offset=offset, limit=limit
+    )
+
+
+def render(store, path, query):
+    """Corpo JSON da resposta de um endpoint (levanta `APIError`)."""
+
+    query = dict(query)
+
+    if path == "/":
+        return envelope(store, json.dumps(ENDPOINTS), extracted_at=store.extracted_at)
+
+    if path == "/seasons":
+        return envelope(store, json.dumps(sorted(store.standings)))
+
+    if match := STANDINGS_PATH.match(path):
+        season = match.group(1)
+        if season not in store.standings:
+            raise APIError(404, f"temporada {season} não encontrada")
+        teams = filter_rows(
+            store.standings[season], query, {"division": "divisionName"}
+        )
+        return page(store, teams, query)
+
+    if path == "/players":
+        players = filter_rows(
+            store.players,
+            query,
+            {"team": "currentTeamAbbrev", "position": "position"},
+        )
+        return page(store, players, query, sort=["-points"])
+
+    if match := PLAYER_PATH.match(path):
+        player_id = int(match.group(1))
+        if player_id not in store.player_rows:
+            raise APIError(404, f"jogador {player_id} não encontrado")
+        if match.group(2):
+            seasons = store.player_seasons.get(player_id)
+            if seasons is None:
+                raise APIError(404, f"jogador {player_id} sem histórico")
+            return page(store, seasons, query)
+        player = store.players.iloc[[store.player_rows[player_id]]]
+        fields = columns_param(query, "fields", player)
+        if fields:
+            player = player[fields]
+        return envelope(store, frame_json(player)[1:-1])
+
+    if match := LEADERS_PATH.match(path):
+        stat = match.group(1)
+        players = store.players
+        if stat not in players.columns or players[stat].dtype.kind not in "iuf":
+            raise APIError(404, f"estatística {stat} não encontrada")
+        players = filter_rows(
+            players, query, {"team": "currentTeamAbbrev", "position": "position"}
+        )
+        min_games = int_param(query, "min_games", 1)
+        players = players[players["gamesPlayed"] >= min_games]
+        players = players.assign(
+            rank=players[stat].rank(method="min", ascending=False).astype("Int64")
+        )
+        query.setdefault("limit", "10")
+        return page(
+            store,
+            players,
+            query,
+            sort=["-" + stat, "gamesPlayed"],
+            fields=list(dict.fromkeys(["rank", *LEADER_FIELDS, stat])),
+        )
+
+    if path == "/goalies":
+        if store.goalies.empty:
+            raise APIError(404, "sem dados de goleiros")
+        goalies = filter_rows(
+            store.goalies,
+            query,
+            {"season": "season", "team": "teamAbbrevs"},
+            multi={"teamAbbrevs"},
+        )
+        return page(store, goalies, query, sort=["-wins"])
+
+    if path == "/teams":
+        if store.rosters is None:
+            raise APIError(404, "sem dados de elencos")
+        return page(store, store.rosters.summary, query)
+
+    if match := ROSTER_PATH.match(path):
+        team = match.group(1).upper()
+        if store.rosters is None or team not in store.rosters:
+            raise APIError(404, f"time {team} não encontrado")
+        return page(store, store.rosters.roster(team), query)
+
+    raise APIError(404, "endpoint não encontrado")
+
+
+class DataAPI(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, cache_size=DEFAULT_CACHE_SIZE):
+        super().__init__(address, APIHandler)
+        self.lock = threading.Lock()
+        self.manifest_mtime = None
+        self.store = None
+        self.requests = 0
+        # Respostas serializadas; a chave inclui o `DataStore` (uma versão)
+        self.respond = lru_cache(maxsize=cache_size)(self._respond)
+        self.current()
+
+    def current(self):
+        """Dados da versão atual (recarregados quando o manifesto muda)."""
+
+        try:
+            mtime = MANIFEST_PATH.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        with self.lock:
+            self.requests += 1
+            if self.store is None or mtime != self.manifest_mtime:
+                self.manifest_mtime = mtime
+                version = source_version(load_manifest())
+                if self.store is None or version != self.store.version:
+                    self.store = DataStore(version)
+                    self.respond.cache_clear()
+            return self.store
+
+    @staticmethod
+    def _respond(store, path, query):
+        """`(status, corpo em bytes)` de uma requisição (em cache)."""
+
+        try:
+            return 200, render(store, path, query).encode("utf-8")
+        except APIError as e:
+            body = json.dumps({"error": str(e)}, ensure_ascii=False)
+            return e.status, body.encode("utf-8")
+
+
+class APIHandler(BaseHTTPRequestHandler):
+    # Conexões persistentes (keep-alive); toda resposta leva Content-Length.
+    # Sem o Nagle, o corpo (escrito depois dos cabeçalhos) sai na hora, em vez
+    # de esperar o ACK atrasado do cliente (~40 ms por resposta)
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        store = self.server.current()
+        etag = f'"{store.version}"'
+
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/") or "/"
+        query = tuple(sorted(parse_qsl(url.query)))
+        status, body = self.server.respond(store, path, query)
+
+        # 304 só para respostas válidas: rotas inexistentes e parâmetros
+        # inválidos respondem o erro mesmo com a versão atual no cabeçalho
+        tags = self.headers.get("If-None-Match", "").split(",")
+        tags = {tag.strip().removeprefix("W/") for tag in tags}
+        if status == 200 and (etag in tags or "*" in tags):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            return
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 200:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API de dados (somente leitura)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE,
+        help="respostas em cache (0 desliga o cache)",
+    )
+    args = parser.parse_args()
+
+    server = DataAPI((args.host, args.port), args.cache_size)
+    print(
+        f"🌐 API de dados em http://{args.host}:{args.port} "
+        f"(versão {server.store.version})"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        info = server.respond.cache_info()
+        print(
+            f"\n📊 {server.requests} requisições atendidas "
+            f"(cache: {info.hits} acertos, {info.misses} faltas)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,86 @@ App Streamlit para visualização de dados da NHL a partir de arquivos CSV.
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
 from datetime import datetime
 from pathlib import Path
 import base64
+import math
+
+from charts import MAX_SCATTER_POINTS, downsample, histogram
+from config import (
+    EVENTS_DIR,
+    PLAYER_ALL_PATH,
+    PLAYER_DIR,
+    PLAYER_RANKS_PATH,
+    PLAYER_SEASONS_PATH,
+    RACE_DIR,
+    TEAMS_DIR,
+    race_path,
+    schedule_path,
+    team_path,
+)
+from metrics import goalie_leaders, season_summary
+from playoffs import DEFAULT_SIMULATIONS, PlayoffSimulator, remaining_games, team_abbrev
+from race import RaceFrames, read_race
+from roster import TeamRosterIndex
+from games import read_games
+from search import PlayerSearchIndex
+from shotmap import GOAL_X, ShotMap
+from similarity import SimilarityIndex
+from snapshot import (
+    build_goalie_table,
+    build_player_rank_table,
+    build_player_season_table,
+    build_player_table,
+    build_team_rank_table,
+    build_team_table,
+    read_snapshot,
+    similarity_index,
+    source_files,
+    source_version,
+)
+from storage import load_manifest
+
+# Estatísticas com posição e percentil na temporada (`ranks.py`) → rótulo
+PLAYER_RANK_STATS = {
+    "points": "Pontos",
+    "goals": "Gols",
+    "assists": "Assistências",
+    "shots": "Chutes",
+    "shootingPctg": "Eficiência",
+    "powerPlayGoals": "Gols em PP",
+    "powerPlayPoints": "Pontos em PP",
+    "otGoals": "Gols em OT",
+    "gamesPlayed": "Jogos",
+}
+TEAM_RANK_STATS = {
+    "team_points": "Pontos",
+    "wins": "Vitórias",
+    "pointPctg": "Pctg de Pontos",
+    "goalFor": "Gols Marcados",
+    "goalAgainst": "Gols Sofridos",
+    "homeWins": "Vitórias em Casa",
+    "roadWins": "Vitórias Fora",
+}
+# Líderes entre os goleiros (`metrics.GOALIE_LEADER_STATS`) → rótulo
+GOALIE_LEADER_LABELS = {
+    "wins": "Vitórias",
+    "savePct": "% de Defesas",
+    "goalsAgainstAverage": "Média de Gols Sofridos",
+    "shutouts": "Shutouts",
+}
+
+# Estatísticas por jogo disponíveis nos histogramas → coluna dos totais
+PER_GAME_COLUMNS = {
+    "pointsPerGame": "points",
+    "goalsPerGame": "goals",
+    "assistsPerGame": "assists",
+    "shotsPerGame": "shots",
+}
 
 # Configuração da página
 st.set_page_config(
@@ -60,46 +136,530 @@ st.markdown(
 )
 
 
+# As tabelas ficam em `st.cache_resource`: um único objeto por processo,
+# compartilhado (sem cópia) por todas as sessões. Elas são somente leitura:
+# as páginas selecionam linhas com máscaras e índices e nunca alteram os
+# DataFrames. Só as duas versões mais recentes dos dados ficam em memória.
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_snapshot(data_version):
+    """Abre (memory-map) o snapshot da versão atual; `None` se desatualizado."""
+
+    return read_snapshot(data_version)
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_team_tables(data_dir, data_version):
+    """Carrega todas as temporadas dos times com as métricas derivadas.
+
+    Usa o snapshot quando ele é da versão atual; caso contrário, lê os CSVs e
+    calcula as métricas. Executado uma única vez por versão dos dados.
+    Retorna a tabela completa, um dicionário temporada → tabela e o resumo por
+    temporada.
+    """
+
+    snapshot = load_snapshot(data_version)
+    if snapshot is not None and "teams" in snapshot:
+        teams = snapshot.frame("teams")
+        summary = snapshot.frame("season_summary").set_index("season")
+    else:
+        teams = build_team_table(Path(data_dir))
+        if teams.empty:
+            return pd.DataFrame(), {}, pd.DataFrame()
+        summary = season_summary(teams)
+
+    by_season = {
+        season: df.reset_index(drop=True) for season, df in teams.groupby("season")
+    }
+    return teams, by_season, summary
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_player_table(file_path, data_version):
+    """Carrega os jogadores com as métricas derivadas (uma vez por versão)."""
+
+    snapshot = load_snapshot(data_version)
+    if snapshot is not None and "players" in snapshot:
+        return snapshot.frame("players")
+    return build_player_table(Path(file_path))
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_player_season_table(file_path, data_version):
+    """Carrega a tabela jogador-temporada (temporada regular da NHL)."""
+
+    snapshot = load_snapshot(data_version)
+    if snapshot is not None and "player_seasons" in snapshot:
+        return snapshot.frame("player_seasons")
+    return build_player_season_table(Path(file_path))
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_player_ranks(file_path, data_version):
+    """Posições e percentis dos jogadores, indexados por ID (uma vez por versão)."""
+
+    snapshot = load_snapshot(data_version)
+    if snapshot is not None and "player_ranks" in snapshot:
+        ranks = snapshot.frame("player_ranks")
+    else:
+        ranks = build_player_rank_table(Path(file_path))
+    if ranks.empty:
+        return ranks
+    return ranks.drop_duplicates("playerId", keep="last").set_index("playerId")
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_team_ranks(data_dir, data_version):
+    """Posições e percentis dos times, indexados por (temporada, time)."""
+
+    snapshot = load_snapshot(data_version)
+    if snapshot is not None and "team_ranks" in snapshot:
+        ranks = snapshot.frame("team_ranks")
+    else:
+        ranks = build_team_rank_table(Path(data_dir))
+    if ranks.empty:
+        return ranks
+    return ranks.set_index(["season", "team_name"]).sort_index()
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_goalie_leaders(data_dir, data_version):
+    """Líderes entre os goleiros de cada temporada (uma vez por versão)."""
+    snapshot = load_snapshot(data_version)
+    if snapshot is not None and "goalies" in snapshot:
+        goalies = snapshot.frame("goalies")
+    else:
+        goalies = build_goalie_table(Path(data_dir))
+    if goalies.empty:
+        return {}
+    return goalie_leaders(goalies)
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_player_seasons(file_path, data_version):
+    """Carrega o histórico jogador-temporada agrupado por jogador."""
+
+    seasons = load_player_season_table(file_path, data_version)
+    if seasons.empty:
+        return {}
+
+    return {
+        player_id: df.reset_index(drop=True)
+        for player_id, df in seasons.groupby("playerId")
+    }
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def load_scatter_points(file_path, player_file_path, data_version, max_points):
+    """Pontos da dispersão gols × chutes, já reduzidos no servidor.
+
+    Retorna os pontos a desenhar e o total de jogador-temporadas.
+    """
+
+    seasons = load_player_season_table(file_path, data_version)
+    if seasons.empty:
+        return pd.DataFrame(), 0
+
+    points = seasons[seasons["shots"] > 0]
+    players = load_player_table(player_file_path, data_version)
+    if not players.empty:
+        names = players.drop_duplicates("playerId", keep="last").set_index("playerId")
+        full_names = names["firstName"] + " " + names["lastName"]
+        points = points.assign(name=points["playerId"].map(full_names))
+    else:
+        points = points.assign(name=None)
+    points = points.assign(name=points["name"].fillna(points["playerId"].astype(str)))
+
+    return downsample(points, "shots", "goals", max_points), len(points)
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def load_player_histogram(file_path, data_version, column, min_games, bins):
+    """Histograma (contagens por faixa) de uma estatística das jogador-temporadas."""
+
+    seasons = load_player_season_table(file_path, data_version)
+    if seasons.empty:
+        return histogram([])
+
+    seasons = seasons[seasons["gamesPlayed"] >= min_games]
+    if column in PER_GAME_COLUMNS:
+        values = seasons[PER_GAME_COLUMNS[column]] / seasons["gamesPlayed"]
+    else:
+        values = seasons[column]
+    return histogram(values, bins)
+
+
+def race_figure(frames):
+    """Gráfico animado da corrida por pontos, montado dos arrays de `RaceFrames`.
+
+    Cada quadro só indexa os arrays já ordenados; as barras ficam em posições
+    fixas (1º, 2º, ...) e os times trocam de barra conforme a classificação.
+    """
+
+    palette = np.array(px.colors.qualitative.Alphabet, dtype=object)
+    colors = palette[frames.order % len(palette)]
+    positions = np.arange(1, frames.order.shape[1] + 1)
+    texts = frames.labels + " " + frames.points.astype(str)
+
+    def bars(index):
+        return go.Bar(
+            x=frames.points[index],
+            y=positions,
+            orientation="h",
+            text=texts[index],
+            textposition="outside",
+            marker_color=colors[index],
+            customdata=frames.games[index],
+            hovertemplate="%{text} pts · %{customdata} jogos<extra></extra>",
+        )
+
+    fig = go.Figure(
+        data=[bars(-1)],
+        frames=[
+            go.Frame(data=[bars(index)], name=date)
+            for index, date in enumerate(frames.dates)
+        ],
+    )
+
+    play = {"frame": {"duration": 80, "redraw": True}, "transition": {"duration": 0}}
+    fig.update_layout(
+        height=max(400, 22 * len(positions)),
+        xaxis={"range": [0, frames.max_points * 1.15], "title": "Pontos"},
+        yaxis={"autorange": "reversed", "showticklabels": False},
+        margin={"l": 10, "r": 10, "t": 10, "b": 10},
+        updatemenus=[
+            {
+                "type": "buttons",
+                "direction": "left",
+                "x": 0,
+                "y": -0.08,
+                "xanchor": "left",
+                "buttons": [
+                    {"label": "▶", "method": "animate", "args": [None, play]},
+                    {
+                        "label": "⏸",
+                        "method": "animate",
+                        "args": [[None], {"mode": "immediate"}],
+                    },
+                ],
+            }
+        ],
+        sliders=[
+            {
+                "active": len(frames.dates) - 1,
+                "currentvalue": {"prefix": "Data: "},
+                "x": 0.1,
+                "len": 0.9,
+                "steps": [
+                    {
+                        "label": date,
+                        "method": "animate",
+                        "args": [[date], {"mode": "immediate", **play}],
+                    }
+                    for date in frames.dates
+                ],
+            }
+        ],
+    )
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def load_race_figure(file_path, data_version):
+    """Gráfico da corrida por pontos de uma temporada (uma vez por versão)."""
+
+    race = read_race(Path(file_path))
+    if race is None:
+        return None
+    return race_figure(RaceFrames(race))
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def load_playoff_odds(teams_path, schedule_file_path, data_version, simulations):
+    """Chances de playoff de uma temporada (simuladas uma vez por versão).
+
+    A versão dos dados inclui a classificação e o calendário, então cada
+    snapshot da classificação é simulado uma única vez.
+    """
+
+    teams_path, schedule_file_path = Path(teams_path), Path(schedule_file_path)
+    if not teams_path.exists():
+        return None
+    games = None
+    if schedule_file_path.exists():
+        games = remaining_games(pd.read_csv(schedule_file_path, sep=";"))
+    try:
+        simulator = PlayoffSimulator(pd.read_csv(teams_path, sep=";"), games)
+    except ValueError:
+        # Temporadas em outro formato de divisões/conferências ou
+        # classificações antigas, sem as colunas usadas na simulação
+        return None
+    return simulator.run(simulations)
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def load_shot_map(season, data_version):
+    """Índice do mapa de chutes de uma temporada (montado uma vez por versão)."""
+
+    shot_map = ShotMap.for_season(season)
+    if not len(shot_map):
+        return None, {}
+
+    # Nomes dos jogadores dos lances (boxscores da mesma temporada)
+    players = read_games("player_games", [season], columns=["playerId", "name"])
+    names = dict(zip(players["playerId"].to_pylist(), players["name"].to_pylist()))
+    return shot_map, names
+
+
+def shot_map_figure(shot_map, shots, goals):
+    """Mapa de calor dos chutes na meia pista ofensiva (gol à direita)."""
+
+    fig = go.Figure(
+        go.Heatmap(
+            z=np.where(shots > 0, shots, np.nan),
+            x=shot_map.x_centers(),
+            y=shot_map.y_centers(),
+            customdata=goals,
+            colorscale="YlOrRd",
+            colorbar={"title": "Chutes"},
+            hovertemplate="%{z} chutes · %{customdata} gols<extra></extra>",
+        )
+    )
+    line = {"color": "#555", "width": 2}
+    fig.add_vline(x=GOAL_X, line={**line, "color": "#d62728"})
+    fig.add_vline(x=25, line={**line, "color": "#1f77b4"})
+    fig.add_shape(type="rect", x0=GOAL_X, x1=GOAL_X + 3.3, y0=-3, y1=3, line=line)
+    fig.update_layout(
+        height=480,
+        xaxis={"range": [0, 100], "title": "", "showticklabels": False},
+        yaxis={
+            "range": [-42.5, 42.5],
+            "scaleanchor": "x",
+            "title": "",
+            "showticklabels": False,
+        },
+        plot_bgcolor="white",
+        margin={"l": 10, "r": 10, "t": 10, "b": 10},
+    )
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def build_player_index(_player_data, data_version):
+    """Monta o índice de busca de jogadores uma única vez por versão dos dados.
+
+    Com o snapshot, as estruturas do índice já vêm prontas.
+    """
+
+    snapshot = load_snapshot(data_version)
+    if snapshot is not None and "search_tokens" in snapshot:
+        tables = {
+            name: snapshot.table(name)
+            for name in (
+                "search_tokens",
+                "search_grams",
+                "search_counts",
+                "search_ids",
+                "search_teams",
+            )
+        }
+        return PlayerSearchIndex.from_tables(_player_data, tables)
+    return PlayerSearchIndex(_player_data)
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def build_roster_index(_player_data, data_version):
+    """Monta o índice time → jogadores uma única vez por versão dos dados.
+
+    Com o snapshot, as linhas de cada time e o resumo já vêm prontos.
+    """
+
+    snapshot = load_snapshot(data_version)
+    if snapshot is not None and "roster_rows" in snapshot:
+        tables = {
+            name: snapshot.table(name)
+            for name in ("roster_rows", "roster_teams", "roster_summary")
+        }
+        return TeamRosterIndex.from_tables(_player_data, tables)
+    return TeamRosterIndex(_player_data)
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def build_similarity_index(_player_data, _player_seasons, data_version):
+    """Monta o índice de jogadores semelhantes uma única vez por versão.
+
+    Com o snapshot, os vetores já vêm prontos.
+    """
+
+    snapshot = load_snapshot(data_version)
+    if snapshot is not None and "similar_players" in snapshot:
+        return SimilarityIndex.from_table(snapshot.table("similar_players"))
+    return similarity_index(_player_data, _player_seasons)
+
+
 class NHLDataAnalyzer:
     def __init__(self):
-        self.data_dir_team = Path("data/teams")
+        self.data_dir_team = TEAMS_DIR
         self.data_dir_team.mkdir(parents=True, exist_ok=True)
 
-        self.data_dir_player = Path("data/player")
+        self.data_dir_player = PLAYER_DIR
         self.data_dir_player.mkdir(parents=True, exist_ok=True)
 
-    def load_all_data_team(self):
-        """Carrega todos os dados dos arquivos CSV."""
-        data_files = list(self.data_dir_team.glob("nhl_standings_*.csv"))
-        all_data = {}
+        self.manifest = load_manifest()
+        self.data_version = self.get_data_version()
 
-        for file_path in data_files:
-            try:
-                season = file_path.stem.replace("nhl_standings_", "")
-                df = pd.read_csv(file_path, sep=";")
+    def _data_files(self):
+        """Lista os arquivos consumidos pelo app."""
 
-                # Adicionar coluna de temporada se não existir
-                if "season" not in df.columns:
-                    df["season"] = season
+        return source_files()
 
-                all_data[season] = df
+    def get_data_version(self):
+        """Obtém a versão dos dados a partir do manifesto (ou dos arquivos)."""
 
-            except Exception as e:
-                print(f"Erro ao carregar {file_path}: {e}")
+        return source_version(self.manifest)
 
-        return all_data
+    def get_last_extraction(self):
+        """Obtém o horário da última extração registrada no manifesto."""
+
+        extracted_at = self.manifest.get("extracted_at")
+        if extracted_at:
+            return datetime.fromisoformat(extracted_at).astimezone()
+
+        files = self._data_files()
+        if not files:
+            return None
+        return datetime.fromtimestamp(max(f.stat().st_mtime for f in files))
+
+    def load_all_data_team(self):
+        """Carrega os dados dos times, por temporada, com as métricas derivadas."""
+
+        _, by_season, _ = load_team_tables(self.data_dir_team, self.data_version)
+        return by_season
+
+    def load_season_summary(self):
+        """Carrega o resumo por temporada (jogos, gols, média de gols)."""
+
+        _, _, summary = load_team_tables(self.data_dir_team, self.data_version)
+        return summary
 
     def load_all_data_player(self):
-        """Carrega todos os dados dos arquivos CSV."""
-        data_files = self.data_dir_player.glob("nhl_player_*.csv")
+        """Carrega os dados dos jogadores com as métricas derivadas."""
+
+        return load_player_table(PLAYER_ALL_PATH, self.data_version)
+
+    def load_player_history(self, player_id):
+        """Obtém o histórico temporada a temporada de um jogador."""
+
+        history = load_player_seasons(PLAYER_SEASONS_PATH, self.data_version)
+        return history.get(int(player_id), pd.DataFrame())
+
+    def load_player_ranks(self, player_id):
+        """Posições e percentis do jogador na temporada (`None` se ausente)."""
+
+        ranks = load_player_ranks(PLAYER_RANKS_PATH, self.data_version)
+        if ranks.empty or int(player_id) not in ranks.index:
+            return None
+        return ranks.loc[int(player_id)]
+
+    def load_team_ranks(self, season, team_name):
+        """Posições e percentis do time na temporada (`None` se ausente)."""
+
+        ranks = load_team_ranks(self.data_dir_team, self.data_version)
+        if ranks.empty or (season, team_name) not in ranks.index:
+            return None
+        return ranks.loc[(season, team_name)]
+
+    def load_goalie_leaders(self):
+        """Obtém os líderes entre os goleiros, por temporada (em cache por versão)."""
 
-        for file_path in data_files:
-            try:
-                df = pd.read_csv(file_path, sep=";")
-            except Exception as e:
-                print(f"Erro ao carregar {file_path}: {e}")
+        return load_goalie_leaders(self.data_dir_player, self.data_version)
 
-        return df
+    def load_scatter_points(self, max_points=MAX_SCATTER_POINTS):
+        """Obtém os pontos (reduzidos) da dispersão gols × chutes."""
+
+        return load_scatter_points(
+            PLAYER_SEASONS_PATH, PLAYER_ALL_PATH, self.data_version, max_points
+        )
+
+    def load_player_histogram(self, column, min_games=1, bins=30):
+        """Obtém o histograma de uma estatística das jogador-temporadas."""
+
+        return load_player_histogram(
+            PLAYER_SEASONS_PATH, self.data_version, column, min_games, bins
+        )
+
+    def race_seasons(self):
+        """Temporadas com a classificação dia a dia (mais recente primeiro)."""
+
+        return sorted(
+            (
+                path.stem.removeprefix("nhl_race_")
+                for path in RACE_DIR.glob("*.parquet")
+            ),
+            reverse=True,
+        )
+
+    def load_race_figure(self, season):
+        """Obtém o gráfico animado da corrida por pontos de uma temporada."""
+
+        return load_race_figure(race_path(season), self.data_version)
+
+    def load_playoff_odds(self, season, simulations=DEFAULT_SIMULATIONS):
+        """Obtém as chances de playoff de uma temporada (em cache por versão)."""
+
+        return load_playoff_odds(
+            team_path(season), schedule_path(season), self.data_version, simulations
+        )
+
+    def shot_seasons(self):
+        """Temporadas com os lances gravados (mais recente primeiro)."""
+
+        return sorted(
+            (path.name.removeprefix("season=") for path in EVENTS_DIR.glob("season=*")),
+            reverse=True,
+        )
+
+    def load_shot_map(self, season):
+        """Obtém o índice do mapa de chutes de uma temporada (e os nomes)."""
+
+        return load_shot_map(season, self.data_version)
+
+    def get_player_index(self):
+        """Obtém o índice de busca de jogadores (em cache por versão dos dados)."""
+
+        return build_player_index(self.load_all_data_player(), self.data_version)
+
+    def get_roster_index(self):
+        """Obtém o índice time → jogadores (em cache por versão dos dados)."""
+
+        return build_roster_index(self.load_all_data_player(), self.data_version)
+
+    def get_similarity_index(self):
+        """Obtém o índice de jogadores semelhantes (em cache por versão)."""
+
+        return build_similarity_index(
+            self.load_all_data_player(),
+            load_player_season_table(PLAYER_SEASONS_PATH, self.data_version),
+            self.data_version,
+        )
+
+    def load_similar_players(self, player, k=10):
+        """Jogador-temporadas mais parecidos com `player`, com nome e time."""
+
+        similar = self.get_similarity_index().nearest(player, k)
+        players = (
+            self.load_all_data_player()
+            .drop_duplicates("playerId", keep="last")
+            .set_index("playerId")
+        )
+        names = players["firstName"] + " " + players["lastName"]
+        similar["name"] = (
+            similar["playerId"].map(names).fillna(similar["playerId"].astype(str))
+        )
+        similar["position"] = similar["playerId"].map(players["position"])
+        similar["seasonLabel"] = similar["season"].str.replace(
+            r"^(\d{4})(\d{4})$", r"\1-\2", regex=True
+        )
+        return similar
 
     def get_latest_season_data(self):
         """Obtém os dados da temporada mais recente."""
@@ -115,17 +675,55 @@ class NHLDataAnalyzer:
     def merge_all_seasons(self):
         """Combina dados de todas as temporadas."""
 
-        all_data = self.load_all_data_team()
-        if not all_data:
-            return pd.DataFrame()
+        teams, _, _ = load_team_tables(self.data_dir_team, self.data_version)
+        return teams
 
-        merged_df = pd.DataFrame()
-        for season, df in all_data.items():
-            df_copy = df.copy()
-            df_copy["season"] = season
-            merged_df = pd.concat([merged_df, df_copy], ignore_index=True)
 
-        return merged_df
+def show_ranks(ranks, stats, group, group_label):
+    """Selos de líder e barras de percentil a partir das colunas de `ranks.py`.
+
+    `group` é o sufixo do agrupamento (ex.: "Position") e `group_label` o
+    rótulo exibido (ex.: "entre os C").
+    """
+
+    badges = [
+        f"🏆 Líder da liga em {label}"
+        for stat, label in stats.items()
+        if ranks.get(f"{stat}Rank") == 1
+    ] + [
+        f"🥇 1º {group_label} em {label}"
+        for stat, label in stats.items()
+        if ranks.get(f"{stat}{group}Rank") == 1 and ranks.get(f"{stat}Rank") != 1
+    ]
+    if badges:
+        st.markdown(" ".join(f"`{badge}`" for badge in badges))
+
+    def ordinal(value):
+        return "-" if pd.isna(value) else f"{value:.0f}º"
+
+    rows = pd.DataFrame(
+        {
+            "Estatística": list(stats.values()),
+            "Liga": [ordinal(ranks.get(f"{stat}Rank")) for stat in stats],
+            group_label[:1].upper() + group_label[1:]: [
+                ordinal(ranks.get(f"{stat}{group}Rank")) for stat in stats
+            ],
+            "Percentil": [ranks.get(f"{stat}{group}Pctl") for stat in stats],
+        }
+    )
+    st.dataframe(
+        rows,
+        width="stretch",
+        hide_index=True,
+        column_config={
+            "Percentil": st.column_config.ProgressColumn(
+                f"Percentil ({group_label})",
+                format="%.0f",
+                min_value=0,
+                max_value=100,
+            ),
+        },
+    )
 
 
 def create_download_link(df, filename):
@@ -160,7 +758,21 @@ def main():
         st.markdown("---")
 
         st.markdown("### 📊 Menu de Navegação")
-        page = st.radio("Selecione a página:", ["📋 Dados Completos", "🏒 Jogadores"])
+        page = st.radio(
+            "Selecione a página:",
+            [
+                "📋 Dados Completos",
+                "🏒 Jogadores",
+                "🔎 Buscar Jogador",
+                "📈 Análises",
+                "🏟️ Times",
+            ],
+            index=2
+            if "player" in st.query_params
+            else 4
+            if "team" in st.query_params
+            else 0,
+        )
 
         st.markdown("---")
         st.markdown("### 📁 Dados Carregados")
@@ -187,9 +799,11 @@ def main():
             """)
 
         st.markdown("---")
-        st.markdown(
-            f"**Última atualização:** {datetime.now().strftime('%d/%m/%Y %H:%M')}"
-        )
+        last_extraction = analyzer.get_last_extraction()
+        if last_extraction:
+            st.markdown(
+                f"**Última atualização:** {last_extraction.strftime('%d/%m/%Y %H:%M')}"
+            )
 
     # Página: Dados Completos
     if page == "📋 Dados Completos":
@@ -199,6 +813,21 @@ def main():
     elif page == "🏒 Jogadores":
         show_player_data(analyzer)
 
+    # Página: Busca de Jogadores
+    elif page == "🔎 Buscar Jogador":
+        if "player" in st.query_params:
+            show_player_detail(analyzer, st.query_params["player"])
+        else:
+            show_player_search(analyzer)
+
+    # Página: Análises
+    elif page == "📈 Análises":
+        show_analytics(analyzer)
+
+    # Página: Times (elenco de cada time)
+    elif page == "🏟️ Times":
+        show_team_detail(analyzer)
+
 
 def show_complete_data(analyzer):
     """Mostra todos os dados disponíveis."""
@@ -245,11 +874,10 @@ def show_complete_data(analyzer):
                 st.metric("Total de Jogos", f"{games_played:.0f}")
 
         with col_info3:
-            if "goalFor" in df.columns:
-                goals_for = df["goalFor"].sum()
-                avg_games_played = (df["gamesPlayed"].mean() * 32) / 2
-                avg_goals_for = goals_for / avg_games_played
-                st.metric("Média de Gols Marcados", f"{avg_goals_for:.2f}")
+            summary = analyzer.load_season_summary()
+            if selected_season in summary.index:
+                avg_goals = summary.loc[selected_season, "goalsPerGame"]
+                st.metric("Média de Gols Marcados", f"{avg_goals:.2f}")
 
         # Filtros interativos
         st.markdown("### 🔍 Filtros Avançados")
@@ -262,9 +890,11 @@ def show_complete_data(analyzer):
             "losses",
             "otLosses",
             "team_points",
-            "pointPctg",
+            "pointPctgPercent",
             "goalFor",
             "goalAgainst",
+            "goalDifferential",
+            "pointsAboveExpected",
         ]
 
         # Mapeamento de nomes legíveis
@@ -273,9 +903,11 @@ def show_complete_data(analyzer):
             "losses": "Derrotas",
             "otLosses": "Derrotas em OT",
             "team_points": "Pontos",
-            "pointPctg": "Percentual de Pontos",
+            "pointPctgPercent": "Percentual de Pontos",
             "goalFor": "Gols Marcados",
             "goalAgainst": "Gols Sofridos",
+            "goalDifferential": "Saldo de Gols",
+            "pointsAboveExpected": "Pontos Acima do Esperado",
         }
 
         with col_filter1:
@@ -303,8 +935,8 @@ def show_complete_data(analyzer):
 
             # Slider de valores
             if "filter_col" in locals():
-                min_val = int(df[filter_col].min())
-                max_val = int(df[filter_col].max())
+                min_val = math.floor(df[filter_col].min())
+                max_val = math.ceil(df[filter_col].max())
                 filter_range = st.slider(
                     f"Valores de {selected_display}",
                     min_val,
@@ -324,28 +956,34 @@ def show_complete_data(analyzer):
                 )
                 sort_asc = st.checkbox("Ordem Crescente", value=False)
 
-        # Aplicar filtros
-        filtered_df = df.copy()
+        # Aplicar filtros: máscara e índices sobre a tabela compartilhada
+        rows = np.arange(len(df))
 
         if "filter_col" in locals() and "filter_range" in locals():
-            filtered_df = filtered_df[
-                (filtered_df[filter_col] >= filter_range[0])
-                & (filtered_df[filter_col] <= filter_range[1])
-            ]
+            values = df[filter_col].to_numpy(dtype=float)
+            mask = (values >= filter_range[0]) & (values <= filter_range[1])
+            rows = rows[mask]
 
         if "sort_col" in locals():
-            filtered_df = filtered_df.sort_values(sort_col, ascending=sort_asc)
+            values = df[sort_col].to_numpy(dtype=float)[rows]
+            # Decrescente ordenando o negativo: os NaN continuam no final
+            order = np.argsort(values if sort_asc else -values, kind="stable")
+            rows = rows[order]
 
-        # Modificar a coluna pointPctg para formato percentual com duas casas decimais
-        filtered_df["pointPctg"] = round(filtered_df["pointPctg"] * 100, 2)
+        # Única materialização: as linhas exibidas
+        filtered_df = df.iloc[rows]
 
         # Exibir dados
         st.markdown(f"### 📊 Dados da Temporada {selected_season}")
-        st.dataframe(
+        st.caption("Selecione um time na tabela para ver o elenco.")
+        selection = st.dataframe(
             filtered_df,
             width="content",
             hide_index=True,
             height=800,
+            on_select="rerun",
+            selection_mode="single-row",
+            key="team_table",
             column_config={
                 "team_logo": st.column_config.ImageColumn("Logo", width="small"),
                 "team_name": st.column_config.TextColumn("Time", width="medium"),
@@ -354,7 +992,8 @@ def show_complete_data(analyzer):
                 "losses": st.column_config.NumberColumn("Derrotas", width="small"),
                 "otLosses": st.column_config.NumberColumn("Derrotas em OT"),
                 "team_points": st.column_config.NumberColumn("Pontos", width="small"),
-                "pointPctg": st.column_config.NumberColumn(
+                "pointPctg": None,
+                "pointPctgPercent": st.column_config.NumberColumn(
                     "Pctg Pontos", format="%.2f%%"
                 ),
                 "goalFor": st.column_config.NumberColumn("Gols Marcados"),
@@ -369,9 +1008,39 @@ def show_complete_data(analyzer):
                 "roadLosses": st.column_config.NumberColumn("Derrotas Fora"),
                 "roadOtLosses": st.column_config.NumberColumn("Derrotas em OT Fora"),
                 "roadGoalsFor": st.column_config.NumberColumn("Gols Marcados Fora"),
+                "goalDifferential": st.column_config.NumberColumn("Saldo de Gols"),
+                "pointsPerGame": st.column_config.NumberColumn(
+                    "Pontos por Jogo", format="%.2f"
+                ),
+                "goalsForPerGame": st.column_config.NumberColumn(
+                    "Gols Marcados por Jogo", format="%.2f"
+                ),
+                "goalsAgainstPerGame": st.column_config.NumberColumn(
+                    "Gols Sofridos por Jogo", format="%.2f"
+                ),
+                "homePointPctg": st.column_config.NumberColumn(
+                    "Pctg Pontos em Casa", format="%.2f%%"
+                ),
+                "roadPointPctg": st.column_config.NumberColumn(
+                    "Pctg Pontos Fora", format="%.2f%%"
+                ),
+                "pythagoreanWinPctg": st.column_config.NumberColumn(
+                    "Pctg Pitagórica", format="%.3f"
+                ),
+                "expectedPoints": st.column_config.NumberColumn("Pontos Esperados"),
+                "pointsAboveExpected": st.column_config.NumberColumn(
+                    "Pontos Acima do Esperado", format="%.1f"
+                ),
             },
         )
 
+        # Time selecionado → página do elenco
+        if selection.selection.rows:
+            team_logo = filtered_df.iloc[selection.selection.rows[0]]["team_logo"]
+            if abbrev := team_abbrev(team_logo):
+                st.query_params["team"] = abbrev
+                st.rerun()
+
         # Botões de ação
         col_action1 = st.columns(1)[0]
 
@@ -390,27 +1059,21 @@ def show_player_data(analyzer):
     player_data = analyzer.load_all_data_player()
 
     if "assists" in player_data.columns:
-        player_data["assists"] = pd.to_numeric(player_data["assists"], errors="coerce")
-        player_data["goals"] = pd.to_numeric(player_data["goals"], errors="coerce")
-        player_data["sweaterNumber"] = pd.to_numeric(
-            player_data["sweaterNumber"], errors="coerce"
-        )
-
         if not player_data["assists"].isnull().all():
-            # Ordenar por assists
-            player_data_assists = player_data.sort_values(by="assists", ascending=False)
-            player_data_assists = player_data_assists.reset_index(drop=True)
-            player_data_assists_top3 = player_data_assists.head(5)
+            # Top 5 em assists
+            player_data_assists_top3 = player_data.nlargest(5, "assists").reset_index(
+                drop=True
+            )
 
-            # Ordenar por goals
-            player_data_goals = player_data.sort_values(by="goals", ascending=False)
-            player_data_goals = player_data_goals.reset_index(drop=True)
-            player_data_goals_top3 = player_data_goals.head(5)
+            # Top 5 em goals
+            player_data_goals_top3 = player_data.nlargest(5, "goals").reset_index(
+                drop=True
+            )
 
-            # Ordenar por points
-            player_data_points = player_data.sort_values(by="points", ascending=False)
-            player_data_points = player_data_points.reset_index(drop=True)
-            player_data_points_top3 = player_data_points.head(5)
+            # Top 5 em points
+            player_data_points_top3 = player_data.nlargest(5, "points").reset_index(
+                drop=True
+            )
 
             # Layout de análise
             tab1 = st.tabs(["📊 2025-2026"])[0]
@@ -772,6 +1435,512 @@ def show_player_data(analyzer):
 
                         st.markdown("<hr>", unsafe_allow_html=True)
 
+    show_goalie_leaders(analyzer)
+
+
+def show_goalie_leaders(analyzer):
+    """Líderes entre os goleiros da temporada (tabelas prontas por versão)."""
+
+    leaders = analyzer.load_goalie_leaders()
+    if not leaders:
+        return
+
+    st.markdown("### 🧤 Líderes entre os Goleiros")
+    seasons = sorted(leaders, reverse=True)
+    season = st.selectbox(
+        "Temporada:",
+        seasons,
+        format_func=lambda s: f"{s[:4]}-{s[4:]}",
+        key="goalie_season",
+    )
+
+    formats = {"savePct": "%.3f", "goalsAgainstAverage": "%.2f"}
+    for column, (stat, label) in zip(
+        st.columns(len(GOALIE_LEADER_LABELS)), GOALIE_LEADER_LABELS.items()
+    ):
+        with column:
+            st.markdown(f"**🏆 {label}**")
+            st.dataframe(
+                leaders[season][stat][
+                    ["goalieFullName", "teamAbbrevs", "gamesPlayed", stat]
+                ],
+                width="stretch",
+                hide_index=True,
+                column_config={
+                    "goalieFullName": "Goleiro",
+                    "teamAbbrevs": "Time",
+                    "gamesPlayed": st.column_config.NumberColumn("J"),
+                    stat: st.column_config.NumberColumn(
+                        label, format=formats.get(stat, "%d")
+                    ),
+                },
+            )
+    st.caption(
+        "Média de gols sofridos e % de defesas só entre os goleiros com pelo "
+        "menos 25% dos jogos do goleiro que mais jogou na temporada."
+    )
+
+
+def show_player_search(analyzer):
+    """Busca de jogadores por nome, sigla do time ou ID."""
+
+    st.markdown(
+        "<h2 class='sub-header'>🔎 Buscar Jogador</h2>",
+        unsafe_allow_html=True,
+    )
+
+    index = analyzer.get_player_index()
+    query = st.text_input(
+        "Nome, time ou ID do jogador:", placeholder="ex.: McDavid, EDM, 8478402"
+    )
+
+    if not query:
+        st.info(f"{len(index)} jogadores disponíveis para busca.")
+        return
+
+    results = index.search(query, limit=20)
+    if results.empty:
+        st.warning("Nenhum jogador encontrado.")
+        return
+
+    for player in results.itertuples():
+        col_img, col_name, col_team, col_button = st.columns([0.5, 2, 1, 1])
+
+        with col_img:
+            st.image(player.headshot, width=50)
+        with col_name:
+            st.markdown(f"**{player.firstName} {player.lastName}** ({player.position})")
+        with col_team:
+            st.markdown(f"{player.currentTeamAbbrev} | {player.season}")
+        with col_button:
+            if st.button(
+                "Ver detalhes", key=f"player_{player.playerId}_{player.season}"
+            ):
+                st.query_params["player"] = str(player.playerId)
+                st.rerun()
+
+
+def show_player_detail(analyzer, player_id):
+    """Mostra os dados de um jogador."""
+
+    player_rows = analyzer.get_player_index().find_id(player_id)
+
+    if st.button("⬅️ Voltar para a busca"):
+        del st.query_params["player"]
+        st.rerun()
+
+    if player_rows.empty:
+        st.warning(f"Jogador {player_id} não encontrado.")
+        return
+
+    player = player_rows.iloc[-1]
+
+    col_img, col_info = st.columns([1, 3])
+
+    with col_img:
+        st.image(player["headshot"], width=200)
+
+    with col_info:
+        st.markdown(f"## {player['firstName']} {player['lastName']}")
+        st.markdown(
+            f"**Time:** {player['fullTeamName']} | "
+            f"**Posição:** {player['position']} | "
+            f"**Número:** {player['sweaterNumber']:.0f}"
+        )
+
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Jogos", player["gamesPlayed"])
+        col2.metric("Gols", player["goals"])
+        col3.metric("Assistências", player["assists"])
+        col4.metric("Pontos", player["points"])
+
+        col5, col6, col7, col8 = st.columns(4)
+        col5.metric("Chutes", player["shots"])
+        col6.metric("Eficiência", f"{player['shootingPctg'] * 100:.1f}%")
+        col7.metric("Pontos em PP", player["powerPlayPoints"])
+        col8.metric("Gols em OT", player["otGoals"])
+
+    # Posição na temporada (calculada na extração, só leitura das colunas)
+    ranks = analyzer.load_player_ranks(player["playerId"])
+    if ranks is not None:
+        st.markdown("### 🏅 Posição na Temporada")
+        show_ranks(
+            ranks, PLAYER_RANK_STATS, "Position", f"entre os {player['position']}"
+        )
+
+    # Histórico da carreira (temporada regular da NHL)
+    history = analyzer.load_player_history(player["playerId"])
+    if not history.empty:
+        st.markdown("### 📈 Carreira")
+        fig = px.line(
+            history,
+            x="seasonLabel",
+            y=["goals", "assists", "points"],
+            markers=True,
+            labels={"seasonLabel": "Temporada", "value": "Total", "variable": ""},
+        )
+        st.plotly_chart(fig, width="stretch")
+
+    # Vizinhos mais próximos nas estatísticas por jogo (índice por versão)
+    similar = analyzer.load_similar_players(player)
+    if not similar.empty:
+        st.markdown("### 🧬 Jogadores Semelhantes")
+        st.caption(
+            "Temporadas de outros jogadores com estatísticas por jogo mais "
+            "próximas das atuais (gols, assistências, chutes, power play, "
+            "prorrogação, eficiência e jogos)"
+        )
+        st.dataframe(
+            similar[
+                [
+                    "name",
+                    "position",
+                    "seasonLabel",
+                    "gamesPlayed",
+                    "goalsPerGame",
+                    "assistsPerGame",
+                    "shotsPerGame",
+                    "shootingPctg",
+                    "distance",
+                ]
+            ],
+            width="stretch",
+            hide_index=True,
+            column_config={
+                "name": "Jogador",
+                "position": "Posição",
+                "seasonLabel": "Temporada",
+                "gamesPlayed": st.column_config.NumberColumn("Jogos", format="%d"),
+                "goalsPerGame": st.column_config.NumberColumn(
+                    "Gols/Jogo", format="%.2f"
+                ),
+                "assistsPerGame": st.column_config.NumberColumn(
+                    "Assist./Jogo", format="%.2f"
+                ),
+                "shotsPerGame": st.column_config.NumberColumn(
+                    "Chutes/Jogo", format="%.2f"
+                ),
+                "shootingPctg": st.column_config.NumberColumn(
+                    "Eficiência", format="percent"
+                ),
+                "distance": st.column_config.NumberColumn("Distância", format="%.2f"),
+            },
+        )
+
+
+def show_team_detail(analyzer):
+    """Elenco de um time: resumo pré-agregado, artilheiros e jogadores."""
+
+    st.markdown(
+        "<h2 class='sub-header'>🏟️ Times</h2>",
+        unsafe_allow_html=True,
+    )
+
+    index = analyzer.get_roster_index()
+    summary = index.summary
+    if summary.empty:
+        st.warning("Nenhum jogador disponível para montar os elencos.")
+        return
+
+    teams = summary["team"].tolist()
+    names = dict(zip(summary["team"], summary["fullTeamName"]))
+    current = st.query_params.get("team")
+    team = st.selectbox(
+        "Time:",
+        teams,
+        index=teams.index(current) if current in teams else 0,
+        format_func=lambda abbrev: f"{names[abbrev]} ({abbrev})",
+    )
+    if team != current:
+        st.query_params["team"] = team
+
+    info = index.team_summary(team)
+    col_logo, col_info = st.columns([1, 4])
+    with col_logo:
+        st.image(info["teamLogo"], width=120)
+    with col_info:
+        st.markdown(f"## {info['fullTeamName']}")
+
+        # Campanha na classificação mais recente (tabela pequena: um time por linha)
+        ranks = None
+        standings = analyzer.get_latest_season_data()
+        if standings is not None:
+            record = standings[standings["team_logo"].map(team_abbrev) == team]
+            if not record.empty:
+                record = record.iloc[0]
+                st.markdown(
+                    f"**Campanha:** {record['wins']:.0f}V - {record['losses']:.0f}D"
+                    f" - {record['otLosses']:.0f}OT | "
+                    f"**Pontos:** {record['team_points']:.0f} | "
+                    f"**Divisão:** {record['divisionName']}"
+                )
+                ranks = analyzer.load_team_ranks(
+                    str(record["season"]), record["team_name"]
+                )
+
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Jogadores", int(info["players"]))
+        col2.metric("Gols do elenco", int(info["goals"]))
+        col3.metric("Pontos do elenco", int(info["points"]))
+        col4.metric("Pontos/jogo (média)", f"{info['pointsPerGame']:.2f}")
+
+    if ranks is not None:
+        st.markdown("### 🏅 Posição na Temporada")
+        show_ranks(ranks, TEAM_RANK_STATS, "Division", "na divisão")
+
+    roster = index.roster(team)
+
+    st.markdown("### ⭐ Maiores Pontuadores")
+    columns = st.columns(5)
+    for column, player in zip(columns, roster.head(5).itertuples()):
+        with column:
+            st.image(player.headshot, width=80)
+            st.markdown(f"**{player.firstName} {player.lastName}**")
+            st.caption(f"{player.points} pts ({player.goals} G, {player.assists} A)")
+
+    st.markdown("### 📋 Elenco")
+    st.caption("Selecione um jogador para ver os detalhes.")
+    selection = st.dataframe(
+        roster[
+            [
+                "headshot",
+                "firstName",
+                "lastName",
+                "position",
+                "sweaterNumber",
+                "gamesPlayed",
+                "goals",
+                "assists",
+                "points",
+                "pointsPerGame",
+                "shots",
+                "powerPlayPoints",
+            ]
+        ],
+        width="stretch",
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        key="roster_table",
+        column_config={
+            "headshot": st.column_config.ImageColumn("Foto", width="small"),
+            "firstName": "Nome",
+            "lastName": "Sobrenome",
+            "position": "Posição",
+            "sweaterNumber": st.column_config.NumberColumn("Número", format="%d"),
+            "gamesPlayed": "Jogos",
+            "goals": "Gols",
+            "assists": "Assistências",
+            "points": "Pontos",
+            "pointsPerGame": st.column_config.NumberColumn(
+                "Pontos/Jogo", format="%.2f"
+            ),
+            "shots": "Chutes",
+            "powerPlayPoints": "Pontos em PP",
+        },
+    )
+    if selection.selection.rows:
+        st.query_params["player"] = str(
+            roster.iloc[selection.selection.rows[0]]["playerId"]
+        )
+        st.rerun()
+
+
+def show_shot_map(analyzer, seasons):
+    """Mapa de calor dos chutes de uma temporada, por time ou jogador."""
+
+    st.markdown("### 🔥 Mapa de Chutes")
+    col_season, col_team, col_player = st.columns(3)
+    with col_season:
+        season = st.selectbox("Temporada:", seasons, key="shot_season")
+
+    shot_map, names = analyzer.load_shot_map(season)
+    if shot_map is None:
+        st.info("Sem lances de chute gravados nessa temporada.")
+        return
+
+    league = "Liga inteira"
+    with col_team:
+        team = st.selectbox(
+            "Time:",
+            [league, *sorted(team for team in shot_map.team_index if team)],
+            key="shot_team",
+        )
+    players = [] if team == league else shot_map.team_players(team)
+    with col_player:
+        player = st.selectbox(
+            "Jogador:",
+            [None, *players],
+            format_func=lambda p: "Todos" if p is None else names.get(p, str(p)),
+            key="shot_player",
+            disabled=not players,
+        )
+
+    if player is not None:
+        shots, goals = shot_map.player(player)
+    else:
+        shots, goals = shot_map.team(None if team == league else team)
+
+    total_shots, total_goals = int(shots.sum()), int(goals.sum())
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Tentativas de chute", f"{total_shots:,}")
+    col2.metric("Gols", f"{total_goals:,}")
+    col3.metric("Conversão", f"{total_goals / total_shots:.1%}" if total_shots else "-")
+    st.plotly_chart(shot_map_figure(shot_map, shots, goals), width="stretch")
+    st.caption(
+        "Chutes no gol, para fora, bloqueados e gols, com o ataque sempre "
+        "para a direita (gol em vermelho, linha azul à esquerda)."
+    )
+
+
+def show_analytics(analyzer):
+    """Gráficos interativos de times e jogadores."""
+
+    st.markdown(
+        "<h2 class='sub-header'>📈 Análises</h2>",
+        unsafe_allow_html=True,
+    )
+
+    # Pontos dos times ao longo das temporadas
+    teams = analyzer.merge_all_seasons()
+    if not teams.empty:
+        st.markdown("### 🏆 Pontos por Temporada")
+
+        latest = teams[teams["season"] == teams["season"].max()]
+        top_teams = latest.nlargest(8, "team_points")["team_name"].tolist()
+        selected_teams = st.multiselect(
+            "Times:", sorted(teams["team_name"].dropna().unique()), default=top_teams
+        )
+
+        lines = teams[teams["team_name"].isin(selected_teams)].sort_values("season")
+        fig = px.line(
+            lines,
+            x="season",
+            y="team_points",
+            color="team_name",
+            markers=True,
+            labels={"season": "Temporada", "team_points": "Pontos", "team_name": ""},
+        )
+        fig.update_xaxes(type="category")
+        st.plotly_chart(fig, width="stretch")
+
+    # Corrida por pontos: classificação dia a dia (quadros pré-calculados)
+    race_seasons = analyzer.race_seasons()
+    if race_seasons:
+        st.markdown("### 🏁 Corrida por Pontos")
+        race_season = st.selectbox("Temporada:", race_seasons, key="race_season")
+        fig = analyzer.load_race_figure(race_season)
+        if fig is not None:
+            st.plotly_chart(fig, width="stretch")
+
+    # Chances de playoff da temporada mais recente (Monte Carlo, em cache)
+    if not teams.empty:
+        odds = analyzer.load_playoff_odds(str(teams["season"].max()))
+        if odds is not None and odds["remaining"].any():
+            st.markdown("### 🎲 Chances de Playoff")
+            st.caption(
+                f"{DEFAULT_SIMULATIONS} simulações do restante da temporada "
+                "(força dos times pelos gols pró e contra)"
+            )
+            probabilities = {
+                "playoffProb": "Playoffs",
+                "divisionProb": "Líder da divisão",
+                "presidentsProb": "Presidents' Trophy",
+            }
+            columns = ["team_name", "divisionName", "team_points", "remaining"]
+            for conference, group in odds.groupby("conference"):
+                st.markdown(f"**{conference}**")
+                st.dataframe(
+                    group[columns + ["projectedPoints", *probabilities]],
+                    width="stretch",
+                    hide_index=True,
+                    column_config={
+                        "team_name": "Time",
+                        "divisionName": "Divisão",
+                        "team_points": "Pontos",
+                        "remaining": "Jogos restantes",
+                        "projectedPoints": st.column_config.NumberColumn(
+                            "Pontos projetados", format="%.1f"
+                        ),
+                        **{
+                            column: st.column_config.ProgressColumn(
+                                label, format="percent", min_value=0, max_value=1
+                            )
+                            for column, label in probabilities.items()
+                        },
+                    },
+                )
+
+    # Mapa de chutes: grades pré-agregadas por time e por jogador
+    shot_seasons = analyzer.shot_seasons()
+    if shot_seasons:
+        show_shot_map(analyzer, shot_seasons)
+
+    # Gols × chutes de todas as jogador-temporadas (WebGL)
+    points, total = analyzer.load_scatter_points()
+    if points.empty:
+        st.info("Histórico de jogadores indisponível para os gráficos de jogadores.")
+        return
+
+    st.markdown("### 🎯 Gols × Chutes")
+    if len(points) < total:
+        st.caption(
+            f"{len(points)} de {total} jogador-temporadas exibidas "
+            "(pontos próximos agrupados no servidor)."
+        )
+
+    fig = px.scatter(
+        points,
+        x="shots",
+        y="goals",
+        color="count",
+        color_continuous_scale="Viridis",
+        hover_name="name",
+        hover_data={"seasonLabel": True, "gamesPlayed": True, "count": True},
+        labels={
+            "shots": "Chutes",
+            "goals": "Gols",
+            "seasonLabel": "Temporada",
+            "gamesPlayed": "Jogos",
+            "count": "Jogador-temporadas",
+        },
+        render_mode="webgl",
+    )
+    fig.update_traces(marker={"size": 5, "opacity": 0.7})
+    st.plotly_chart(fig, width="stretch")
+
+    # Distribuições (contagens calculadas no servidor)
+    st.markdown("### 📊 Distribuições")
+
+    histogram_options = {
+        "Pontos por jogo": "pointsPerGame",
+        "Gols por jogo": "goalsPerGame",
+        "Assistências por jogo": "assistsPerGame",
+        "Chutes por jogo": "shotsPerGame",
+        "Pontos": "points",
+        "Gols": "goals",
+    }
+
+    col_stat, col_games = st.columns(2)
+    with col_stat:
+        selected_stat = st.selectbox("Estatística:", list(histogram_options))
+    with col_games:
+        min_games = st.slider("Mínimo de jogos:", 1, 82, 20)
+
+    bins = analyzer.load_player_histogram(
+        histogram_options[selected_stat], min_games=min_games
+    )
+    fig = px.bar(
+        bins,
+        x="mid",
+        y="count",
+        hover_data={"start": ":.2f", "end": ":.2f", "mid": False},
+        labels={"mid": selected_stat, "count": "Jogador-temporadas"},
+    )
+    fig.update_traces(marker_line_width=0)
+    fig.update_layout(bargap=0)
+    st.plotly_chart(fig, width="stretch")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,115 @@
+"""
+Arquivo das respostas brutas da API (append-only, comprimido).
+
+Cada resposta é guardada como uma linha JSON em
+`data/raw/{endpoint}/{AAAA-MM-DD}/part-NNNNN.jsonl.gz`. Cada execução abre
+partes novas (as antigas nunca são reescritas) e troca de parte quando a atual
+passa de `max_bytes` (não comprimidos), para que o reprocessamento possa
+dividir o trabalho entre processos por parte.
+"""
+
+import gzip
+import json
+import threading
+from datetime import datetime, timezone
+
+from config import RAW_DIR
+
+# Tamanho máximo (não comprimido) de cada parte
+MAX_PART_BYTES = 8 * 1024 * 1024
+
+
+class RawArchive:
+    def __init__(self, root=RAW_DIR, max_bytes=MAX_PART_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.parts = {}
+        self.lock = threading.Lock()
+
+    def _open_next_part(self, directory):
+        directory.mkdir(parents=True, exist_ok=True)
+        existing = sorted(directory.glob("part-*.jsonl.gz"))
+        number = int(existing[-1].name[5:10]) + 1 if existing else 0
+        # Criação exclusiva: processos simultâneos (ex.: shards da extração na
+        # mesma máquina) nunca sobrescrevem a parte um do outro
+        while True:
+            try:
+                return gzip.open(directory / f"part-{number:05d}.jsonl.gz", "xb")
+            except FileExistsError:
+                number += 1
+
+    def append(self, endpoint, key, payload):
+        """Guarda uma resposta bruta da API."""
+
+        if payload is None:
+            return
+
+        fetched_at = datetime.now(timezone.utc)
+        line = json.dumps(
+            {
+                "endpoint": endpoint,
+                "key": key,
+                "fetched_at": fetched_at.isoformat(timespec="seconds"),
+                "payload": payload,
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+        directory = self.root / endpoint / fetched_at.strftime("%Y-%m-%d")
+
+        with self.lock:
+            part = self.parts.get(directory)
+            if part is None or part["bytes"] >= self.max_bytes:
+                if part is not None:
+                    part["file"].close()
+                part = {
+                    "file": self._open_next_part(directory),
+                    "bytes": 0,
+                }
+                self.parts[directory] = part
+
+            part["file"].write(line + b"\n")
+            part["bytes"] += len(line) + 1
+
+    def close(self):
+        with self.lock:
+            for part in self.parts.values():
+                part["file"].close()
+            self.parts = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def list_parts(endpoint, date=None, root=RAW_DIR):
+    """Lista as partes de um endpoint (da data informada ou da mais recente)."""
+
+    endpoint_dir = root / endpoint
+    dates = sorted(path.name for path in endpoint_dir.glob("*") if path.is_dir())
+    if not dates:
+        return []
+
+    date = date or dates[-1]
+    return sorted((endpoint_dir / date).glob("part-*.jsonl.gz"))
+
+
+def list_all_parts(endpoint, root=RAW_DIR):
+    """Lista as partes de um endpoint de todas as datas, da mais antiga à mais
+    recente (e, em cada data, na ordem em que foram abertas).
+    """
+
+    return sorted((root / endpoint).glob("*/part-*.jsonl.gz"))
+
+
+def read_part(path):
+    """Lê as entradas de uma parte do arquivo."""
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
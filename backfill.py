@@ -0,0 +1,182 @@
+"""
+Backfill histórico da classificação dos times (um arquivo por temporada).
+
+As datas finais de cada temporada vêm dos metadados da API, em vez de uma
+lista mantida à mão: `/standings-season` informa o início e o fim da
+classificação de cada temporada e, se faltar o fim, o `regularSeasonEndDate`
+de `/schedule/{data}` completa. As temporadas são buscadas em paralelo pelo
+limitador adaptativo do host (`throttle.py`) e gravadas em `data/teams/` no
+mesmo layout do `extract_team.py`.
+
+O backfill pode ser interrompido e executado de novo: cada temporada é
+publicada e registrada no manifesto (`backfill`) assim que chega. Temporadas
+encerradas que já estão gravadas com o mesmo conteúdo (hash do arquivo igual
+ao registrado) são puladas sem nenhuma requisição; a temporada em andamento é
+sempre buscada de novo.
+
+Uso:
+    python backfill.py [--from 19171918] [--to 20252026] [--force]
+"""
+
+import argparse
+import sys
+from datetime import date as Date
+from datetime import datetime, timezone
+
+import requests
+
+from archive import RawArchive
+from config import team_path
+from extract_team import SimpleNHLExtractor
+from pipeline import parallel_map
+from ranks import rank_teams
+from storage import dataset_hash, load_manifest, record_backfill, save_records
+
+
+def fetch_json(extractor, path):
+    """GET de um endpoint da API (JSON ou `None` em caso de erro)."""
+
+    url = f"{extractor.base_url}/{path}"
+    try:
+        response = extractor.limiter.get(extractor.session, url, timeout=10)
+        response.raise_for_status()
+        return response.json()
+    except (requests.RequestException, ValueError) as e:
+        print(f"❌ Erro ao buscar {url}: {e}")
+        return None
+
+
+def season_windows(extractor, today):
+    """Início e fim da classificação de cada temporada (ID → (início, fim)).
+
+    Datas no formato AAAA-MM-DD; para a temporada em andamento, o fim é hoje.
+    """
+
+    metadata = fetch_json(extractor, "standings-season")
+    if not metadata:
+        raise RuntimeError("Metadados das temporadas indisponíveis")
+
+    windows = {}
+    for season in metadata.get("seasons", []):
+        start = season.get("standingsStart")
+        # Temporadas que ainda não começaram não têm classificação
+        if not start or start > today:
+            continue
+        end = season.get("standingsEnd")
+        if not end:
+            schedule = fetch_json(extractor, f"schedule/{start}")
+            end = (schedule or {}).get("regularSeasonEndDate")
+        if end:
+            windows[str(season["id"])] = (start, min(end, today))
+    return windows
+
+
+def is_stored(season, end, today, manifest):
+    """Temporada encerrada já gravada com o conteúdo registrado no backfill."""
+
+    state = manifest.get("backfill", {}).get(season)
+    return (
+        end < today
+        and state is not None
+        and state.get("date") == end
+        and state.get("sha256") == dataset_hash(team_path(season))
+    )
+
+
+def save_season(extractor, season, end, data):
+    """Grava a classificação final de uma temporada e registra no manifesto.
+
+    Retorna `True` se a temporada foi concluída.
+    """
+
+    standings = (data or {}).get("standings", [])
+    if not standings:
+        print(f"⚠️ {season}: sem classificação em {end}")
+        return False
+
+    season_id = str(standings[0].get("seasonId"))
+    if season_id != season:
+        print(f"⚠️ {season}: a classificação de {end} é da temporada {season_id}")
+        return False
+
+    filepath = team_path(season)
+    teams = (extractor.process_team_data(team) for team in standings)
+    changed, rows = save_records(teams, filepath)
+    rank_teams(season)
+    record_backfill(
+        season,
+        {
+            "date": end,
+            "sha256": dataset_hash(filepath),
+            "teams": rows,
+            "finished_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+    )
+    print(f"{'✔️' if changed else '⏭️ '} {season} ({end}): {rows} times")
+    return True
+
+
+def backfill(first=None, last=None, force=False):
+    """Busca a classificação final das temporadas entre `first` e `last`.
+
+    Retorna o número de temporadas que falharam.
+    """
+
+    extractor = SimpleNHLExtractor()
+    today = Date.today().isoformat()
+
+    dates = {
+        season: end for season, (_, end) in season_windows(extractor, today).items()
+    }
+    seasons = [
+        season
+        for season in sorted(dates)
+        if (first is None or season >= str(first))
+        and (last is None or season <= str(last))
+    ]
+
+    manifest = load_manifest()
+    pending = [
+        season
+        for season in seasons
+        if force or not is_stored(season, dates[season], today, manifest)
+    ]
+    print(
+        f"🏒 {len(seasons)} temporadas ({seasons[0] if seasons else '-'} a "
+        f"{seasons[-1] if seasons else '-'}): {len(seasons) - len(pending)} já "
+        f"gravadas, {len(pending)} a buscar"
+    )
+
+    # As temporadas são buscadas em paralelo (o limitador adaptativo decide
+    # quantas ao mesmo tempo) e gravadas conforme chegam, na ordem
+    failed = 0
+    with RawArchive() as archive:
+        for season, data in parallel_map(
+            lambda season: extractor.fetch_season_data(dates[season]),
+            pending,
+            workers=extractor.limiter.max_limit,
+        ):
+            archive.append("standings", dates[season], data)
+            if not save_season(extractor, season, dates[season], data):
+                failed += 1
+
+    if failed:
+        print(f"❌ {failed} temporadas falharam (execute de novo para retomar)")
+    print(f"🚦 API: {extractor.limiter.summary()}")
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill das classificações")
+    parser.add_argument("--from", dest="first", help="primeira temporada (AAAAAAAA)")
+    parser.add_argument("--to", dest="last", help="última temporada (AAAAAAAA)")
+    parser.add_argument(
+        "--force", action="store_true", help="busca também as já gravadas"
+    )
+    args = parser.parse_args()
+
+    sys.exit(1 if backfill(args.first, args.last, args.force) else 0)
+
+
+if __name__ == "__main__":
+    main()
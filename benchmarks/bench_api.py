@@ -0,0 +1,179 @@
+"""
+Benchmark da API de dados (`api.py`): vazão com o cache frio e quente.
+
+A API roda em um subprocesso (como em produção) sobre os dados de `data/` e
+recebe uma mistura fixa (com semente) de requisições: classificações de todas
+as temporadas, páginas da lista de jogadores, líderes por estatística e
+posição e elencos de todos os times, com e sem projeção de colunas. Clientes
+em threads, cada um com uma conexão persistente, medem a latência de cada
+requisição. Cenários:
+
+- frio: API com `--cache-size 0` (toda resposta é montada e serializada);
+- quente: cache LRU já aquecido com todas as URLs da mistura;
+- 304: cache quente e `If-None-Match` com a versão atual (sem corpo).
+
+Uso:
+    python benchmarks/bench_api.py [--requests 2000] [--clients 4]
+"""
+
+import argparse
+import http.client
+import json
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+STATS = ["points", "goals", "assists", "shots", "pointsPerGame", "powerPlayPoints"]
+POSITIONS = [None, "C", "L", "R", "D"]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_api(port, cache_size):
+    """Sobe a API em um subprocesso e espera ela responder."""
+
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "api.py",
+            "--port",
+            str(port),
+            "--cache-size",
+            str(cache_size),
+        ],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 120
+    while time.monotonic() < deadline:
+        try:
+            get(http.client.HTTPConnection("127.0.0.1", port), "/")
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("A API não respondeu a tempo")
+
+
+def get(connection, url, etag=None):
+    """Faz um GET e retorna `(status, corpo, etag)`."""
+
+    headers = {"If-None-Match": etag} if etag else {}
+    connection.request("GET", url, headers=headers)
+    response = connection.getresponse()
+    return response.status, response.read(), response.getheader("ETag")
+
+
+def request_mix(port, size, seed):
+    """URLs da mistura, a partir das temporadas e dos times da API."""
+
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    seasons = json.loads(get(connection, "/seasons")[1])["data"]
+    teams = json.loads(get(connection, "/teams?limit=1000&fields=team")[1])["data"]
+    connection.close()
+
+    urls = []
+    for season in seasons:
+        urls.append(f"/standings/{season}")
+        urls.append(f"/standings/{season}?fields=team_name,team_points&limit=10")
+    for offset in range(0, 1000, 50):
+        urls.append(f"/players?offset={offset}")
+        urls.append(f"/players?offset={offset}&fields=playerId,lastName,points")
+    for stat in STATS:
+        for position in POSITIONS:
+            urls.append(
+                f"/leaders/{stat}" + (f"?position={position}" if position else "")
+            )
+    for team in teams:
+        urls.append(f"/teams/{team['team']}/roster")
+        urls.append(
+            f"/teams/{team['team']}/roster?fields=lastName,goals,points&limit=5"
+        )
+
+    rng = random.Random(seed)
+    return urls, [rng.choice(urls) for _ in range(size)]
+
+
+def run_clients(port, requests, clients, etag=None):
+    """Dispara as requisições em `clients` threads. Retorna (segundos, latências)."""
+
+    latencies = [[] for _ in range(clients)]
+
+    def client(index):
+        connection = http.client.HTTPConnection("127.0.0.1", port)
+        for url in requests[index::clients]:
+            start = time.perf_counter()
+            status, _, _ = get(connection, url, etag)
+            latencies[index].append(time.perf_counter() - start)
+            if status not in (200, 304):
+                raise RuntimeError(f"{url}: HTTP {status}")
+        connection.close()
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, [x for values in latencies for x in values]
+
+
+def report(name, elapsed, latencies):
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{name:<12} {len(latencies) / elapsed:>10.0f} "
+        f"{statistics.median(latencies) * 1000:>10.2f} {p95 * 1000:>10.2f}"
+    )
+
+
+def main():
+    """Executa os cenários e imprime vazão e latência de cada um."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'cenário':<12} {'req/s':>10} {'p50 (ms)':>10} {'p95 (ms)':>10}")
+    print("-" * 45)
+
+    port = free_port()
+    process = start_api(port, cache_size=0)
+    try:
+        urls, requests = request_mix(port, args.requests, args.seed)
+        report("frio", *run_clients(port, requests, args.clients))
+    finally:
+        process.terminate()
+        process.wait()
+
+    port = free_port()
+    process = start_api(port, cache_size=max(1024, len(urls)))
+    try:
+        run_clients(port, urls, args.clients)
+        report("quente", *run_clients(port, requests, args.clients))
+        connection = http.client.HTTPConnection("127.0.0.1", port)
+        etag = get(connection, "/")[2]
+        connection.close()
+        report("304", *run_clients(port, requests, args.clients, etag))
+    finally:
+        process.terminate()
+        process.wait()
+
+    print(f"\n{len(urls)} URLs distintas, {args.requests} requisições por cenário")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark do tempo até a primeira renderização do app (boot a frio).
+
+Cada execução roda em um subprocesso novo (interpretador, imports e caches
+vazios, como no primeiro acesso depois que a instância acorda) e renderiza a
+página inicial com o `AppTest` do Streamlit, com e sem o snapshot
+(`NHL_SNAPSHOT=0` força a leitura das fontes). Se o snapshot da versão atual
+não existir, ele é gerado antes das medições.
+
+Uso:
+    python benchmarks/bench_first_render.py [--runs 5] [--page "📈 Análises"]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+RENDER_SNIPPET = """
+import time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=300)
+at.run()
+if {page!r}:
+    at.radio[0].set_value({page!r})
+    at.run()
+assert not at.exception, at.exception
+print(time.perf_counter() - start)
+"""
+
+
+def first_render(page, use_snapshot):
+    """Retorna (tempo total do processo, tempo do script até renderizar)."""
+
+    env = dict(os.environ, NHL_SNAPSHOT="1" if use_snapshot else "0")
+    snippet = RENDER_SNIPPET.format(app=str(ROOT / "app.py"), page=page)
+
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", snippet],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = time.perf_counter() - start
+    return total, float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tempo até a primeira renderização")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--page", default="", help="Página a abrir após a inicial")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    from snapshot import read_snapshot, source_version, write_snapshot
+    from storage import load_manifest
+
+    if read_snapshot(source_version(load_manifest())) is None:
+        print("📦 Gerando o snapshot da versão atual...")
+        write_snapshot()
+
+    print(f"{args.runs} execuções por modo\n")
+    print(f"{'modo':<10}{'processo (ms)':>15}{'render (ms)':>13}")
+    for name, use_snapshot in (("fontes", False), ("snapshot", True)):
+        results = [first_render(args.page, use_snapshot) for _ in range(args.runs)]
+        total, render = (statistics.median(values) for values in zip(*results))
+        print(f"{name:<10}{total * 1000:>15.0f}{render * 1000:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
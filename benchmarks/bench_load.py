@@ -0,0 +1,304 @@
+"""
+Teste de carga do app: N sessões simultâneas contra dados de fixture.
+
+Cada sessão é um `AppTest` do Streamlit rodando no mesmo processo (threads e
+caches compartilhados, como no servidor) e faz uma sequência aleatória (com
+semente) de interações: troca de página, troca de temporada e o slider de
+filtro da página de dados completos. Cada `run()` é um rerun do script e tem
+a latência medida.
+
+Por padrão o app roda sobre um diretório de fixture gerado na hora (times e
+jogadores fictícios, sem rede e sem tocar em `data/`); `--data` usa um
+diretório de dados existente. O relatório mostra os percentis de latência dos
+reruns (geral e por ação), a vazão e o pico de memória (RSS) para cada nível
+de concorrência. Com `--max-p95`, o comando falha (código 1) se o p95 passar
+do limite, para pegar regressões antes do deploy.
+
+Uso:
+    python benchmarks/bench_load.py [--sessions 1,4,8] [--steps 10]
+        [--seasons 5] [--players 1000] [--data DIR] [--max-p95 MS]
+"""
+
+import argparse
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from bench_sessions import (
+    _pin_app_test_option,
+    _serialize_script_compilation,
+    peak_rss_mb,
+    rss_mb,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+COMPLETE_PAGE = "📋 Dados Completos"
+PAGES = [COMPLETE_PAGE, "🏒 Jogadores", "🔎 Buscar Jogador", "📈 Análises"]
+
+# Peso de cada ação na sequência de uma sessão
+ACTIONS = {"página": 2, "temporada": 1, "slider": 3}
+
+DIVISIONS = ["Atlantic", "Metropolitan", "Central", "Pacific"]
+
+
+def standings_record(rng, team, division):
+    """Linha fictícia (e consistente) da classificação de um time."""
+
+    games = 82
+    record = {}
+    for side in ("home", "road"):
+        wins = rng.randint(12, 30)
+        losses = rng.randint(0, 41 - wins)
+        ot_losses = 41 - wins - losses
+        record[side] = {
+            "GamesPlayed": 41,
+            "Wins": wins,
+            "Losses": losses,
+            "OtLosses": ot_losses,
+            "GoalsFor": rng.randint(100, 160),
+            "GoalsAgainst": rng.randint(100, 160),
+        }
+
+    home, road = record["home"], record["road"]
+    wins = home["Wins"] + road["Wins"]
+    ot_losses = home["OtLosses"] + road["OtLosses"]
+    points = 2 * wins + ot_losses
+    return {
+        "team_logo": f"https://assets.nhle.com/logos/nhl/svg/T{team:02d}_light.svg",
+        "team_name": f"Time {team:02d}",
+        "divisionName": division,
+        "gamesPlayed": games,
+        "wins": wins,
+        "losses": home["Losses"] + road["Losses"],
+        "ties": 0,
+        "otLosses": ot_losses,
+        "team_points": points,
+        "pointPctg": round(points / (2 * games), 6),
+        "goalFor": home["GoalsFor"] + road["GoalsFor"],
+        "goalAgainst": home["GoalsAgainst"] + road["GoalsAgainst"],
+        **{f"home{key}": value for key, value in home.items()},
+        **{f"road{key}": value for key, value in road.items()},
+    }
+
+
+def build_fixture(root, seasons=5, players=1000, seed=0):
+    """Gera um diretório de dados fictício no layout de `data/`.
+
+    Os jogadores passam pelo mesmo parse da extração (respostas fictícias do
+    `stub_api.py`), então os arquivos têm exatamente o formato real.
+    """
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from config import CURRENT_SEASON, PLAYER_ALL_PATH, PLAYER_SEASONS_PATH, team_path
+    from extract_player import SimpleNHLExtractor, season_totals_schema
+    from storage import write_records
+    from stub_api import synthetic_player
+
+    os.chdir(root)
+    rng = random.Random(seed)
+
+    first = int(CURRENT_SEASON[:4]) - seasons + 1
+    for start in range(first, first + seasons):
+        records = [
+            standings_record(rng, team, DIVISIONS[team % len(DIVISIONS)])
+            for team in range(1, 33)
+        ]
+        records.sort(key=lambda record: record["team_points"], reverse=True)
+        write_records(records, team_path(f"{start}{start + 1}"))
+
+    extractor = SimpleNHLExtractor()
+    player_records, season_records = [], []
+    for player_id in range(8_470_000, 8_470_000 + players):
+        current, totals = extractor.parse_player(synthetic_player(player_id))
+        player_records.extend(current)
+        season_records.extend(totals)
+
+    write_records(player_records, PLAYER_ALL_PATH)
+    pq.write_table(
+        pa.Table.from_pylist(season_records, schema=season_totals_schema()),
+        PLAYER_SEASONS_PATH,
+    )
+
+
+class Session:
+    """Uma sessão de usuário com a sequência de interações e as latências."""
+
+    def __init__(self, seed, steps):
+        self.rng = random.Random(seed)
+        self.steps = steps
+        self.timings = []
+        self.errors = 0
+
+    def run(self, at, action):
+        start = time.perf_counter()
+        at.run()
+        self.timings.append((action, time.perf_counter() - start))
+        if at.exception:
+            self.errors += 1
+
+    def go_to(self, at, page):
+        if at.radio[0].value != page:
+            at.radio[0].set_value(page)
+            self.run(at, "página")
+
+    def step(self, at):
+        action = self.rng.choices(list(ACTIONS), weights=list(ACTIONS.values()))[0]
+
+        if action == "página":
+            page = self.rng.choice([p for p in PAGES if p != at.radio[0].value])
+            at.radio[0].set_value(page)
+        elif action == "temporada":
+            self.go_to(at, COMPLETE_PAGE)
+            at.selectbox[0].set_value(self.rng.choice(at.selectbox[0].options))
+        else:
+            self.go_to(at, COMPLETE_PAGE)
+            slider = at.slider[0]
+            low, high = sorted(
+                self.rng.randint(int(slider.min), int(slider.max)) for _ in range(2)
+            )
+            slider.set_range(low, high)
+        self.run(at, action)
+
+    def __call__(self):
+        from streamlit.testing.v1 import AppTest
+
+        at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=300)
+        self.run(at, "abertura")
+        for _ in range(self.steps):
+            self.step(at)
+        return self
+
+
+class MemorySampler(threading.Thread):
+    """Amostra o RSS do processo durante a carga (pico do período)."""
+
+    def __init__(self, interval=0.05):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = rss_mb()
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.peak = max(self.peak, rss_mb())
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        return max(self.peak, rss_mb())
+
+
+def percentile(values, q):
+    """Percentil `q` (0-100) por interpolação linear."""
+
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+
+def run_load(sessions, steps, seed):
+    """Roda `sessions` sessões simultâneas; retorna (sessões, duração, pico)."""
+
+    users = [Session(seed * 1000 + number, steps) for number in range(sessions)]
+    sampler = MemorySampler()
+    sampler.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        for future in [pool.submit(user) for user in users]:
+            future.result()
+    elapsed = time.perf_counter() - start
+    return users, elapsed, sampler.stop()
+
+
+def report(sessions, users, elapsed, peak):
+    """Imprime os percentis (geral e por ação), a vazão e o pico de RSS."""
+
+    timings = [timing for user in users for timing in user.timings]
+    latencies = [latency * 1000 for _, latency in timings]
+    errors = sum(user.errors for user in users)
+
+    print(
+        f"{sessions:>8}{len(latencies):>8}{len(latencies) / elapsed:>12.1f}"
+        f"{percentile(latencies, 50):>9.0f}{percentile(latencies, 95):>9.0f}"
+        f"{percentile(latencies, 99):>9.0f}{max(latencies):>9.0f}"
+        f"{peak:>11.0f}{errors:>7}"
+    )
+
+    by_action = {}
+    for action, latency in timings:
+        by_action.setdefault(action, []).append(latency * 1000)
+    for action, values in sorted(by_action.items()):
+        if len(values) > 1:
+            print(
+                f"{'':>8}{'↳ ' + action:>20}{len(values):>6}"
+                f"{percentile(values, 50):>9.0f}{percentile(values, 95):>9.0f}"
+            )
+
+    return percentile(latencies, 95), errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga do app")
+    parser.add_argument(
+        "--sessions", default="1,4,8", help="níveis de concorrência (ex.: 1,4,8)"
+    )
+    parser.add_argument("--steps", type=int, default=10, help="interações/sessão")
+    parser.add_argument("--seasons", type=int, default=5, help="temporadas (fixture)")
+    parser.add_argument("--players", type=int, default=1000, help="jogadores (fixture)")
+    parser.add_argument("--data", help="diretório com `data/` em vez da fixture")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-p95", type=float, help="p95 máximo (ms)")
+    args = parser.parse_args()
+
+    os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+
+    with tempfile.TemporaryDirectory(prefix="nhl-load-") as fixture:
+        if args.data:
+            os.chdir(args.data)
+            print(f"📂 Dados: {Path(args.data).resolve()}")
+        else:
+            build_fixture(fixture, args.seasons, args.players, args.seed)
+            print(f"🧪 Fixture: {args.seasons} temporadas, {args.players} jogadores")
+
+        # Sessões criadas fora de uma thread do Streamlit avisam "missing
+        # ScriptRunContext"; um filtro (o nível é redefinido pelo Streamlit)
+        logging.getLogger(
+            "streamlit.runtime.scriptrunner_utils.script_run_context"
+        ).addFilter(lambda record: record.levelno >= logging.ERROR)
+        _serialize_script_compilation()
+        _pin_app_test_option()
+
+        # Aquece os caches compartilhados (primeiro acesso fora da medição)
+        Session(args.seed, 0)()
+        print(f"RSS após aquecimento: {rss_mb():.0f} MB\n")
+
+        print(
+            f"{'sessões':>8}{'reruns':>8}{'reruns/s':>12}{'p50':>9}{'p95':>9}"
+            f"{'p99':>9}{'máx':>9}{'pico (MB)':>11}{'erros':>7}"
+        )
+        failed = False
+        for sessions in (int(value) for value in args.sessions.split(",")):
+            users, elapsed, peak = run_load(sessions, args.steps, args.seed)
+            p95, errors = report(sessions, users, elapsed, peak)
+            failed |= bool(errors)
+            if args.max_p95 is not None and p95 > args.max_p95:
+                print(f"❌ p95 {p95:.0f} ms acima do limite ({args.max_p95:.0f} ms)")
+                failed = True
+
+        print(f"\nPico de RSS do processo: {peak_rss_mb():.0f} MB")
+        os.chdir(ROOT)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark da simulação das chances de playoff.
+
+Monta uma liga fictícia (classificação e calendário do `stub_api.py`, sem
+rede) em três momentos da temporada (início, meio e reta final) e mede o
+tempo de N simulações com o calendário e sem ele (binomial por time), além
+da memória de pico (via `tracemalloc`).
+
+Uso:
+    python benchmarks/bench_playoffs.py [--simulations 100000] [--runs 3]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date as Date
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd  # noqa: E402
+
+from extract_team import SimpleNHLExtractor  # noqa: E402
+from playoffs import PlayoffSimulator  # noqa: E402
+from stub_api import league_schedule, season_dates, synthetic_standings  # noqa: E402
+
+YEAR = 2024
+
+# Fração da temporada já disputada em cada cenário
+MOMENTS = {"início": 0.1, "meio": 0.5, "reta final": 0.9}
+
+
+def league_at(progress):
+    """Classificação e jogos restantes da liga fictícia num ponto da temporada."""
+
+    start, end = (Date.fromisoformat(value) for value in season_dates(YEAR))
+    day = (start + timedelta(days=round(progress * (end - start).days))).isoformat()
+
+    extractor = SimpleNHLExtractor()
+    teams = pd.DataFrame(
+        extractor.process_team_data(team)
+        for team in synthetic_standings(day)["standings"]
+    )
+    games = pd.DataFrame(
+        {"homeTeam": game["home"][0], "awayTeam": game["away"][0]}
+        for date, day_games in league_schedule(YEAR).items()
+        if date >= day
+        for game in day_games
+    )
+    return teams, games
+
+
+def measure(simulator, simulations, runs):
+    """Mediana do tempo de `runs` execuções e o pico de memória (MB)."""
+
+    timings = []
+    for run in range(runs):
+        start = time.perf_counter()
+        simulator.run(simulations, seed=run)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    simulator.run(simulations)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark das chances de playoff")
+    parser.add_argument("--simulations", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{'momento':>12}{'jogos':>8}{'modo':>12}{'tempo (s)':>12}"
+        f"{'simulações/s':>15}{'pico (MB)':>11}"
+    )
+    for moment, progress in MOMENTS.items():
+        teams, games = league_at(progress)
+        for mode, simulator in (
+            ("calendário", PlayoffSimulator(teams, games)),
+            ("binomial", PlayoffSimulator(teams)),
+        ):
+            elapsed, peak = measure(simulator, args.simulations, args.runs)
+            print(
+                f"{moment:>12}{len(games):>8}{mode:>12}{elapsed:>12.2f}"
+                f"{args.simulations / elapsed:>15,.0f}{peak:>11.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
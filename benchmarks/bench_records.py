@@ -0,0 +1,137 @@
+"""
+Benchmark dos construtores de registros.
+
+Compara, para N registros jogador-temporada sintéticos (schema de
+`extract_player.season_totals_schema`):
+- lista de dicionários + `pd.DataFrame(records)`;
+- `records.ColumnBuilder` + `to_pandas()` / `to_arrow()`.
+
+Mede o tempo de construção e de conversão, a memória retida pelos registros acumulados e o
+pico de memória (via `tracemalloc`) até o DataFrame/tabela final.
+
+Uso:
+    python benchmarks/bench_records.py [--rows 100000] [--runs 3]
+"""
+
+import argparse
+import gc
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from extract_player import season_totals_schema  # noqa: E402
+from records import ColumnBuilder, fields_from_schema  # noqa: E402
+
+
+def synthetic_records(rows):
+    """Gera registros no formato de `process_player_season_totals`."""
+
+    for i in range(rows):
+        yield {
+            "playerId": 8470000 + i // 10,
+            "season": 20002001 + (i % 25) * 10001,
+            "gameTypeId": 2 if i % 5 else 3,
+            "leagueAbbrev": "NHL",
+            "sequence": 1,
+            "teamName": f"Team {i % 32}",
+            "gamesPlayed": 82,
+            "goals": i % 50,
+            "assists": i % 60,
+            "points": i % 50 + i % 60,
+            "plusMinus": i % 21 - 10,
+            "pim": i % 40,
+            "shots": 100 + i % 200,
+            "shootingPctg": (i % 50) / (100 + i % 200),
+            "powerPlayGoals": i % 12,
+            "powerPlayPoints": i % 25,
+            "shorthandedGoals": None if i % 7 else 1,
+            "gameWinningGoals": i % 8,
+            "otGoals": i % 3,
+            "avgToi": "18:32",
+            "faceoffWinningPctg": None if i % 3 else 0.51,
+        }
+
+
+def build_dicts(rows, fields):
+    return list(synthetic_records(rows))
+
+
+def to_frame_dicts(records):
+    import pandas as pd
+
+    return pd.DataFrame(records)
+
+
+def build_columns(rows, fields):
+    builder = ColumnBuilder(fields)
+    for record in synthetic_records(rows):
+        builder.append(record)
+    return builder
+
+
+def measure(build, convert, rows, fields):
+    """Retorna (tempo de construção, tempo de conversão, memória retida, pico).
+
+    Os tempos são medidos sem o `tracemalloc` (que deixa a construção várias
+    vezes mais lenta); a memória, em uma segunda passada rastreada.
+    """
+
+    gc.collect()
+    start = time.perf_counter()
+    built = build(rows, fields)
+    build_time = time.perf_counter() - start
+    start = time.perf_counter()
+    result = convert(built)
+    convert_time = time.perf_counter() - start
+    del built, result
+
+    gc.collect()
+    tracemalloc.start()
+    built = build(rows, fields)
+    retained, _ = tracemalloc.get_traced_memory()
+    result = convert(built)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built, result
+
+    return build_time, convert_time, retained, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dos construtores")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    import pandas  # noqa: F401 (fora da medição)
+    import pyarrow  # noqa: F401
+
+    fields = fields_from_schema(season_totals_schema())
+    variants = [
+        ("dicts → pandas", build_dicts, to_frame_dicts),
+        ("colunas → pandas", build_columns, ColumnBuilder.to_pandas),
+        ("colunas → arrow", build_columns, ColumnBuilder.to_arrow),
+    ]
+
+    print(f"{args.rows} registros, {len(fields)} campos, {args.runs} execuções\n")
+    print(
+        f"{'variante':<18}{'build (ms)':>12}{'conversão (ms)':>16}"
+        f"{'retido (MB)':>13}{'pico (MB)':>11}"
+    )
+    for name, build, convert in variants:
+        results = [measure(build, convert, args.rows, fields) for _ in range(args.runs)]
+        build_time, convert_time, retained, peak = (
+            statistics.median(values) for values in zip(*results)
+        )
+        print(
+            f"{name:<18}{build_time * 1000:>12.0f}{convert_time * 1000:>16.0f}"
+            f"{retained / 2**20:>13.1f}{peak / 2**20:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
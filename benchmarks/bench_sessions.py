@@ -0,0 +1,199 @@
+"""
+Relatório de memória: RSS de um processo do app contra N sessões simuladas.
+
+Cada sessão é um `AppTest` do Streamlit rodando no mesmo processo (os caches
+são compartilhados, como no servidor). A sessão abre a página de dados
+completos, troca a temporada e o filtro, abre a página de jogadores e a busca,
+e continua viva (estado e árvore de elementos retidos) enquanto as próximas
+sessões são criadas. O RSS é medido depois de cada sessão.
+
+Com `--concurrent`, as N sessões rodam ao mesmo tempo (como visitantes
+simultâneos) e o relatório mostra o pico de RSS para N = 1, 2, 4, ...
+Limitação: para o `AppTest` aguentar threads, esse modo troca funções do
+Streamlit no processo inteiro (`config.get_option`,
+`app_test.patch_config_options` e `ScriptCache.get_bytecode`) enquanto roda;
+a compilação do script fica serializada e as opções de config das sessões não
+são isoladas como no servidor. O relatório avisa disso, e as trocas são
+desfeitas ao final.
+
+Uso:
+    python benchmarks/bench_sessions.py [--sessions 20] [--concurrent]
+"""
+
+import argparse
+import gc
+import os
+import resource
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def rss_mb():
+    """Memória residente atual do processo (em MB)."""
+
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        return peak_rss_mb()
+
+
+def peak_rss_mb():
+    """Pico de memória residente do processo (em MB)."""
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KB; macOS, em bytes
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def simulate_session():
+    """Percorre as páginas principais como um usuário."""
+
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=300)
+    at.run()
+
+    # Dados completos: outra temporada e outro filtro
+    seasons = at.selectbox[0].options
+    at.selectbox[0].set_value(seasons[-1])
+    at.run()
+    at.selectbox[1].set_value(at.selectbox[1].options[-1])
+    at.run()
+
+    # Jogadores e busca
+    at.radio[0].set_value("🏒 Jogadores")
+    at.run()
+    at.radio[0].set_value("🔎 Buscar Jogador")
+    at.run()
+    at.text_input[0].set_value("mc")
+    at.run()
+
+    assert not at.exception, at.exception
+    return at
+
+
+def _serialize_script_compilation():
+    """Compila o script de uma sessão por vez.
+
+    Cada `AppTest` tem o próprio cache de bytecode e compila o app com
+    `ast.parse`/`compile`, que não são thread-safe em algumas versões do
+    Python; só a compilação é serializada, a execução das páginas continua
+    simultânea.
+    """
+
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+
+    lock = threading.Lock()
+    get_bytecode = ScriptCache.get_bytecode
+
+    def locked_get_bytecode(self, script_path):
+        with lock:
+            return get_bytecode(self, script_path)
+
+    ScriptCache.get_bytecode = locked_get_bytecode
+
+    def restore():
+        ScriptCache.get_bytecode = get_bytecode
+
+    return restore
+
+
+def _pin_app_test_option():
+    """Mantém a opção `global.appTest` ligada durante todo o processo.
+
+    `AppTest.run` liga a opção trocando `config.get_option` (global) pela
+    duração do run; com sessões simultâneas, o fim do run de uma sessão
+    desfaz a troca no meio do run de outra, e os widgets criados nesse
+    intervalo ficam sem o registro de teste (`KeyError` no próximo run).
+    Retorna a função que desfaz as trocas.
+    """
+
+    import contextlib
+
+    from streamlit import config
+    from streamlit.testing.v1 import app_test
+    from streamlit.testing.v1.util import build_mock_config_get_option
+
+    get_option, patch_config_options = config.get_option, app_test.patch_config_options
+    config.get_option = build_mock_config_get_option({"global.appTest": True})
+    app_test.patch_config_options = lambda overrides: contextlib.nullcontext()
+
+    def restore():
+        config.get_option = get_option
+        app_test.patch_config_options = patch_config_options
+
+    return restore
+
+
+def report_concurrent(max_sessions):
+    """Pico de RSS com N sessões simultâneas (N = 1, 2, 4, ...)."""
+
+    restores = [_serialize_script_compilation(), _pin_app_test_option()]
+    print(
+        "⚠️ Streamlit alterado no processo inteiro durante o modo simultâneo\n"
+        "   (config.get_option, app_test.patch_config_options e\n"
+        "   ScriptCache.get_bytecode): compilação serializada e opções de\n"
+        "   config compartilhadas entre as sessões, ao contrário do servidor.\n"
+    )
+    print(f"{'simultâneas':>12}{'RSS (MB)':>10}{'pico (MB)':>11}")
+
+    n = 1
+    sessions = []
+    try:
+        while n <= max_sessions:
+            with ThreadPoolExecutor(max_workers=n) as pool:
+                sessions.extend(pool.map(lambda _: simulate_session(), range(n)))
+            gc.collect()
+            print(f"{n:>12}{rss_mb():>10.0f}{peak_rss_mb():>11.0f}")
+            n *= 2
+    finally:
+        for restore in restores:
+            restore()
+
+
+def report_sequential(max_sessions):
+    """RSS depois de cada nova sessão (as anteriores continuam vivas)."""
+
+    print(f"{'sessões':>8}{'RSS (MB)':>10}{'pico (MB)':>11}{'por sessão (MB)':>17}")
+
+    sessions = []
+    first = None
+    for n in range(1, max_sessions + 1):
+        sessions.append(simulate_session())
+        gc.collect()
+        rss = rss_mb()
+        if first is None:
+            first = rss
+        per_session = (rss - first) / (n - 1) if n > 1 else 0.0
+        print(f"{n:>8}{rss:>10.0f}{peak_rss_mb():>11.0f}{per_session:>17.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RSS contra N sessões simuladas")
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--concurrent", action="store_true")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    sys.path.insert(0, str(ROOT))
+    os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+
+    import streamlit  # noqa: F401 (fora da medição)
+
+    gc.collect()
+    print(f"RSS inicial: {rss_mb():.0f} MB\n")
+
+    if args.concurrent:
+        report_concurrent(args.sessions)
+    else:
+        report_sequential(args.sessions)
+
+
+if __name__ == "__main__":
+    main()
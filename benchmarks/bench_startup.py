@@ -0,0 +1,75 @@
+"""
+Benchmark de inicialização dos extratores.
+
+Mede, em subprocessos isolados, o tempo de import (via `python -X importtime`)
+e o pico de memória (RSS) de cada módulo de extração.
+
+Uso:
+    python benchmarks/bench_startup.py [--runs 5]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = ["extract_team", "extract_player_id", "extract_player", "pandas"]
+
+RSS_SNIPPET = (
+    "import resource, {module}; "
+    "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)"
+)
+
+
+def import_time_us(module):
+    """Tempo cumulativo de import do módulo (em microssegundos)."""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in reversed(result.stderr.splitlines()):
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise RuntimeError(f"Import de {module} não encontrado na saída do importtime")
+
+
+def peak_rss_kb(module):
+    """Pico de memória residente após importar o módulo (em KB)."""
+
+    result = subprocess.run(
+        [sys.executable, "-c", RSS_SNIPPET.format(module=module)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return int(result.stdout.strip())
+
+
+def main():
+    """Executa o benchmark e imprime uma tabela com os resultados."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'módulo':<20} {'import (ms)':>12} {'RSS (MB)':>10}")
+    print("-" * 44)
+    for module in MODULES:
+        times = [import_time_us(module) for _ in range(args.runs)]
+        rss = peak_rss_kb(module)
+        print(
+            f"{module:<20} {statistics.median(times) / 1000:>12.1f} {rss / 1024:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Preparação dos dados dos gráficos (no servidor).
+
+O navegador recebe apenas o que precisa desenhar: histogramas chegam como
+contagens por faixa (`np.histogram`) e dispersões com muitos pontos são
+reduzidas antes do envio (e desenhadas com WebGL), então a página continua
+responsiva mesmo com todas as jogador-temporadas do histórico.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Acima disso, a dispersão é reduzida antes de ir para o navegador
+MAX_SCATTER_POINTS = 10_000
+
+# Resolução (células por eixo) da grade usada na redução
+DOWNSAMPLE_GRID = 256
+
+
+def _bin(values, grid):
+    """Índice da célula (0..grid-1) de cada valor."""
+
+    lo, hi = values.min(), values.max()
+    span = (hi - lo) or 1.0
+    return np.clip(((values - lo) / span * grid).astype(np.int64), 0, grid - 1)
+
+
+def downsample(df, x, y, max_points=MAX_SCATTER_POINTS, grid=DOWNSAMPLE_GRID, seed=0):
+    """Reduz uma dispersão para no máximo `max_points` pontos.
+
+    Divide o plano em uma grade `grid`×`grid` e mantém um ponto por célula
+    ocupada, preservando a forma da nuvem e os pontos isolados, que uma
+    amostra aleatória simples tenderia a perder. A coluna `count` informa
+    quantos pontos cada ponto mantido representa. Se ainda sobrarem pontos
+    demais, sorteia as células (semente fixa, resultado estável).
+    """
+
+    df = df.dropna(subset=[x, y])
+    if len(df) <= max_points:
+        return df.assign(count=1)
+
+    xs = df[x].to_numpy(dtype=np.float64)
+    ys = df[y].to_numpy(dtype=np.float64)
+    cells = _bin(xs, grid) * grid + _bin(ys, grid)
+    _, first, counts = np.unique(cells, return_index=True, return_counts=True)
+
+    if len(first) > max_points:
+        rng = np.random.default_rng(seed)
+        keep = np.sort(rng.choice(len(first), max_points, replace=False))
+        first, counts = first[keep], counts[keep]
+
+    order = np.argsort(first)
+    return df.iloc[first[order]].assign(count=counts[order])
+
+
+def histogram(values, bins=30):
+    """Contagens por faixa de uma série (uma linha por faixa)."""
+
+    values = pd.Series(values).dropna().to_numpy(dtype=np.float64)
+    if not len(values):
+        return pd.DataFrame(columns=["start", "end", "mid", "count"])
+
+    counts, edges = np.histogram(values, bins=bins)
+    return pd.DataFrame(
+        {
+            "start": edges[:-1],
+            "end": edges[1:],
+            "mid": (edges[:-1] + edges[1:]) / 2,
+            "count": counts,
+        }
+    )
@@ -0,0 +1,109 @@
+"""
+Configurações compartilhadas pelos extratores e pelo orquestrador.
+"""
+
+import os
+from pathlib import Path
+
+# Temporada corrente (formato da API: AAAAAAAA, ex.: 20252026)
+CURRENT_SEASON = "20252026"
+
+# URL base da API; NHL_API_BASE_URL aponta os extratores para uma API local
+# (ex.: `python stub_api.py`) para testes sem rede
+API_BASE_URL = os.environ.get("NHL_API_BASE_URL", "https://api-web.nhle.com/v1")
+# URL base da API de estatísticas (relatórios em lote, ex.: `skater/summary`);
+# NHL_STATS_API_BASE_URL aponta para a API local de teste
+STATS_API_BASE_URL = os.environ.get(
+    "NHL_STATS_API_BASE_URL", "https://api.nhle.com/stats/rest/en"
+)
+
+DATA_DIR = Path("data")
+TEAMS_DIR = DATA_DIR / "teams"
+PLAYER_DIR = DATA_DIR / "player"
+PLAYER_ID_DIR = DATA_DIR / "player_id"
+RAW_DIR = DATA_DIR / "raw"
+# Classificação dia a dia (corrida por pontos), uma matriz time × data por temporada
+RACE_DIR = DATA_DIR / "race"
+# Calendário da temporada regular (jogos disputados e restantes)
+SCHEDULE_DIR = DATA_DIR / "schedule"
+# Jogos (boxscores): tabelas time-jogo e jogador-jogo particionadas por temporada e data
+GAMES_DIR = DATA_DIR / "games"
+# Lances (play-by-play), particionados por temporada e jogo
+EVENTS_DIR = DATA_DIR / "events"
+# Snapshot pré-calculado do app (tabelas, métricas e índices em Arrow IPC)
+SNAPSHOT_DIR = DATA_DIR / "snapshot"
+
+# NHL_SNAPSHOT=0 faz o app ignorar o snapshot e ler as fontes (diagnóstico)
+USE_SNAPSHOT = os.environ.get("NHL_SNAPSHOT", "1") != "0"
+
+PLAYER_ALL_PATH = PLAYER_DIR / "nhl_player_all.csv"
+# Totais por temporada de cada jogador (formato longo, colunar)
+PLAYER_SEASONS_PATH = PLAYER_DIR / "nhl_player_seasons.parquet"
+# Posições e percentis dos jogadores na temporada (mesma ordem do CSV)
+PLAYER_RANKS_PATH = PLAYER_DIR / "nhl_player_ranks.parquet"
+# Saídas parciais da extração de jogadores em shards (`--shard i/N`)
+PLAYER_SHARD_DIR = PLAYER_DIR / "shards"
+
+
+def team_path(season):
+    """Arquivo de classificação dos times de uma temporada."""
+    return TEAMS_DIR / f"nhl_standings_{season}.csv"
+
+
+def team_ranks_path(season):
+    """Arquivo com as posições e percentis dos times de uma temporada."""
+    return TEAMS_DIR / f"nhl_ranks_{season}.parquet"
+
+
+def race_path(season):
+    """Arquivo da classificação dia a dia de uma temporada."""
+    return RACE_DIR / f"nhl_race_{season}.parquet"
+
+
+def schedule_path(season):
+    """Arquivo com o calendário da temporada regular."""
+    return SCHEDULE_DIR / f"nhl_schedule_{season}.csv"
+
+
+def games_dir(table, season):
+    """Partições de uma tabela de jogos (`team_games`/`player_games`) na temporada."""
+    return GAMES_DIR / table / f"season={season}"
+
+
+def games_partition_path(table, season, date):
+    """Arquivo de uma tabela de jogos em uma data."""
+    return games_dir(table, season) / f"date={date}" / "part-0.parquet"
+
+
+def events_dir(season):
+    """Partições (uma por jogo) dos lances de uma temporada."""
+    return EVENTS_DIR / f"season={season}"
+
+
+def events_path(season, game_id):
+    """Arquivo com os lances de um jogo."""
+    return events_dir(season) / f"game={game_id}" / "part-0.parquet"
+
+
+def player_id_path(season):
+    """Arquivo com os IDs dos jogadores de uma temporada."""
+    return PLAYER_ID_DIR / f"nhl_standings_players_{season}_id.csv"
+
+
+def goalie_path(season):
+    """Arquivo com as estatísticas dos goleiros de uma temporada."""
+    return PLAYER_DIR / f"nhl_goalies_{season}.parquet"
+
+
+def player_shard_paths(index, count):
+    """Arquivos parciais (jogadores, histórico) do shard `index` de `count`."""
+    name = f"shard-{index}-of-{count}"
+    return (
+        PLAYER_SHARD_DIR / f"nhl_player_all.{name}.csv",
+        PLAYER_SHARD_DIR / f"nhl_player_seasons.{name}.parquet",
+    )
+
+
+def player_shard_stamp_path(index, count):
+    """Carimbo do shard `index` de `count` (gravado quando o shard termina)."""
+    return PLAYER_SHARD_DIR / f"shard-{index}-of-{count}.json"
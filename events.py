@@ -0,0 +1,294 @@
+"""
+Lances dos jogos (play-by-play) em uma tabela colunar tipada.
+
+Para cada jogo encerrado do calendário (`schedule.py`), o feed
+`/gamecenter/{id}/play-by-play` é buscado em paralelo (pelo limitador
+adaptativo do host) e achatado em uma linha por lance, com tipos fixos
+(`events_schema`), gravada em Parquet particionado por temporada e jogo:
+
+    data/events/season=20242025/game=2024020001/part-0.parquet
+
+As coordenadas (`x`, `y`, em pés, centro da pista na origem) são
+normalizadas para que o time do lance sempre ataque para o lado positivo de
+`x` (gol em x = 89): os chutes de todos os jogos e períodos ficam na mesma
+meia pista e viram arrays numéricos contíguos na leitura (`shotmap.py`).
+
+Como no `games.py`, a busca é incremental: jogos já gravados nunca são
+buscados de novo e cada jogo é publicado assim que chega.
+
+Uso:
+    python events.py [--from 20232024] [--to 20252026] [--force]
+"""
+
+import argparse
+import sys
+from datetime import date as Date
+
+from archive import RawArchive
+from backfill import fetch_json, season_windows
+from config import EVENTS_DIR, events_dir, events_path
+from extract_team import SimpleNHLExtractor
+from games import final_games, needs_schedule
+from pipeline import parallel_map
+from schedule import crawl_schedule
+from storage import ParquetRecordWriter, record_partitions
+
+# Jogador principal e secundário de cada tipo de lance (campos de `details`)
+EVENT_PLAYERS = {
+    "goal": ("scoringPlayerId", "assist1PlayerId"),
+    "shot-on-goal": ("shootingPlayerId", None),
+    "missed-shot": ("shootingPlayerId", None),
+    "blocked-shot": ("shootingPlayerId", "blockingPlayerId"),
+    "hit": ("hittingPlayerId", "hitteePlayerId"),
+    "faceoff": ("winningPlayerId", "losingPlayerId"),
+    "penalty": ("committedByPlayerId", "drawnByPlayerId"),
+}
+
+# Tentativas de chute (o time do lance é sempre o de quem chutou)
+SHOT_EVENTS = ["goal", "shot-on-goal", "missed-shot", "blocked-shot"]
+
+
+def events_schema():
+    """Schema da tabela de lances (uma linha por lance)."""
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("eventId", pa.int32()),
+            ("sortOrder", pa.int32()),
+            ("period", pa.int8()),
+            ("periodType", pa.string()),
+            ("time", pa.int16()),
+            ("situationCode", pa.string()),
+            ("typeCode", pa.int16()),
+            ("type", pa.string()),
+            ("team", pa.string()),
+            ("playerId", pa.int64()),
+            ("secondaryPlayerId", pa.int64()),
+            ("goalieId", pa.int64()),
+            ("x", pa.int16()),
+            ("y", pa.int16()),
+            ("zone", pa.string()),
+            ("shotType", pa.string()),
+        ]
+    )
+
+
+def period_seconds(value):
+    """Tempo decorrido no período ("MM:SS") em segundos."""
+
+    if not value:
+        return None
+    minutes, _, seconds = str(value).partition(":")
+    return int(minutes) * 60 + int(seconds or 0)
+
+
+def attacks_left(home, defending_side, x, zone):
+    """Indica se o time do lance ataca para o lado negativo de `x`.
+
+    Usa o lado defendido pelo mandante no período; sem ele, a zona do lance
+    (ofensiva com x negativo ou defensiva com x positivo).
+    """
+
+    if defending_side in ("left", "right"):
+        return home != (defending_side == "left")
+    return (zone == "O" and x < 0) or (zone == "D" and x > 0)
+
+
+def play_records(data):
+    """Lances de um feed de play-by-play, já achatados e normalizados."""
+
+    if not data or not data.get("plays"):
+        return []
+
+    home, away = data.get("homeTeam") or {}, data.get("awayTeam") or {}
+    abbrevs = {home.get("id"): home.get("abbrev"), away.get("id"): away.get("abbrev")}
+    # Time de cada jogador (no bloqueio, o dono do lance é quem bloqueou)
+    rosters = {
+        spot.get("playerId"): spot.get("teamId")
+        for spot in data.get("rosterSpots") or []
+    }
+
+    records = []
+    for play in data["plays"]:
+        details = play.get("details") or {}
+        kind = play.get("typeDescKey")
+        primary, secondary = EVENT_PLAYERS.get(kind, ("playerId", None))
+        player = details.get(primary)
+        team = rosters.get(player, details.get("eventOwnerTeamId"))
+
+        x, y, zone = (
+            details.get("xCoord"),
+            details.get("yCoord"),
+            details.get("zoneCode"),
+        )
+        if (
+            x is not None
+            and y is not None
+            and attacks_left(
+                team == home.get("id"), play.get("homeTeamDefendingSide"), x, zone
+            )
+        ):
+            x, y = -x, -y
+
+        period = play.get("periodDescriptor") or {}
+        records.append(
+            {
+                "eventId": play.get("eventId"),
+                "sortOrder": play.get("sortOrder"),
+                "period": period.get("number"),
+                "periodType": period.get("periodType"),
+                "time": period_seconds(play.get("timeInPeriod")),
+                "situationCode": play.get("situationCode"),
+                "typeCode": play.get("typeCode"),
+                "type": kind,
+                "team": abbrevs.get(team),
+                "playerId": player,
+                "secondaryPlayerId": details.get(secondary) if secondary else None,
+                "goalieId": details.get("goalieInNetId"),
+                "x": x,
+                "y": y,
+                "zone": zone,
+                "shotType": details.get("shotType"),
+            }
+        )
+    return records
+
+
+def read_events(seasons=None, columns=None, types=None):
+    """Lê os lances (todas as partições) como `pyarrow.Table`.
+
+    `season` (texto) e `game` vêm do caminho das partições; `seasons` e
+    `types` limitam as temporadas e os tipos de lance lidos.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    partitions = pa.schema([("season", pa.string()), ("game", pa.int64())])
+    schema = pa.unify_schemas([events_schema(), partitions])
+    if not EVENTS_DIR.exists():
+        empty = schema.empty_table()
+        return empty.select(columns) if columns else empty
+
+    dataset = ds.dataset(
+        EVENTS_DIR,
+        schema=schema,
+        format="parquet",
+        partitioning=ds.partitioning(partitions, flavor="hive"),
+    )
+    expression = None
+    if seasons is not None:
+        expression = ds.field("season").isin([str(season) for season in seasons])
+    if types is not None:
+        by_type = ds.field("type").isin(list(types))
+        expression = by_type if expression is None else expression & by_type
+    return dataset.to_table(columns=columns, filter=expression)
+
+
+def stored_events(season):
+    """IDs dos jogos de uma temporada com os lances gravados."""
+
+    directory = events_dir(season)
+    if not directory.exists():
+        return set()
+    return {
+        int(path.parent.name.removeprefix("game="))
+        for path in directory.glob("game=*/part-0.parquet")
+    }
+
+
+def write_events(season, game_id, records):
+    """Publica os lances de um jogo. Retorna o número de lances."""
+
+    with ParquetRecordWriter(events_path(season, game_id), events_schema()) as writer:
+        for record in records:
+            writer.write(record)
+        _, _, rows = writer.commit()
+    return rows
+
+
+def crawl_season(extractor, season, archive=None, force=False):
+    """Busca os lances dos jogos encerrados pendentes de uma temporada.
+
+    Retorna o número de jogos que falharam (ficam pendentes para a próxima
+    execução).
+    """
+
+    games = [game_id for ids in final_games(season).values() for game_id in ids]
+    stored = set() if force else stored_events(season)
+    pending = [game_id for game_id in games if game_id not in stored]
+    if not pending:
+        print(f"⏭️  {season}: {len(games)} jogos encerrados, todos gravados")
+        return 0
+
+    failed = 0
+    events = 0
+    for game_id, data in parallel_map(
+        lambda game_id: fetch_json(extractor, f"gamecenter/{game_id}/play-by-play"),
+        pending,
+        workers=extractor.limiter.max_limit,
+    ):
+        if archive is not None:
+            archive.append("play_by_play", str(game_id), data)
+        records = play_records(data)
+        if not records:
+            failed += 1
+            continue
+        events += write_events(season, game_id, records)
+
+    record_partitions(events_dir(season))
+    print(
+        f"{'⚠️' if failed else '✔️'} {season}: {len(pending) - failed} jogos "
+        f"buscados ({events} lances), {failed} falharam"
+    )
+    return failed
+
+
+def crawl(first=None, last=None, force=False, refresh_schedule=True):
+    """Busca os lances das temporadas entre `first` e `last`.
+
+    Sem `first` e `last`, só a temporada mais recente; o calendário é buscado
+    antes quando necessário. Retorna o número de jogos que falharam.
+    """
+
+    extractor = SimpleNHLExtractor()
+    windows = season_windows(extractor, Date.today().isoformat())
+
+    seasons = sorted(windows)
+    if first is None and last is None:
+        seasons = seasons[-1:]
+    seasons = [
+        season
+        for season in seasons
+        if (first is None or season >= str(first))
+        and (last is None or season <= str(last))
+    ]
+
+    failed = 0
+    with RawArchive() as archive:
+        for season in seasons:
+            if needs_schedule(season, refresh_schedule) and not crawl_schedule(
+                season, extractor, windows
+            ):
+                failed += 1
+                continue
+            failed += crawl_season(extractor, season, archive, force)
+
+    print(f"🚦 API: {extractor.limiter.summary()}")
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lances dos jogos (play-by-play)")
+    parser.add_argument("--from", dest="first", help="primeira temporada (AAAAAAAA)")
+    parser.add_argument("--to", dest="last", help="última temporada (AAAAAAAA)")
+    parser.add_argument(
+        "--force", action="store_true", help="busca também os jogos já gravados"
+    )
+    args = parser.parse_args()
+
+    sys.exit(1 if crawl(args.first, args.last, args.force) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,14 +4,16 @@ Sistema de Extração de Dados da NHL com estruturas de dados personalidades.
 API Base: https://api-web.nhle.com/v1
 """
 import requests
-import pandas as pd
-import time
 from datetime import datetime
 from pathlib import Path
 
+from storage import save_records
+from throttle import limiter_for
+
 class SimpleNHLExtractor:
     def __init__(self):
         self.base_url = "https://api-web.nhle.com/v1"
+        self.limiter = limiter_for(self.base_url)
         self.session = requests.Session()
 
     def fetch_season_data(self, date):
@@ -20,7 +22,7 @@ class SimpleNHLExtractor:
         url = f"{self.base_url}/standings/{date}"
 
         try:
-            response = self.session.get(url, timeout=10)
+            response = self.limiter.get(self.session, url, timeout=10)
             if response.status_code == 200:
                 return response.json()
         except Exception as e:
@@ -40,19 +42,16 @@ class SimpleNHLExtractor:
     def save_data(self, data, season_id):
         """Salva os dados em um arquivo CSV."""
 
-        if not data:
-            print(f"Sem dados para salvar da temporada {season_id}")
-            return
-
-        df = pd.DataFrame(data)
         filename = f"nhl_standings_{season_id}.csv"
         filepath = Path("data/teams") / filename
 
-        # Cria o diretório se não existir
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-
-        df.to_csv(filepath, index=False, sep=';')
-        print(f"✔️ {filepath} salvo ({len(data)} times).")
+        changed, rows = save_records(data, filepath)
+        if not rows:
+            print(f"Sem dados para salvar da temporada {season_id}")
+        elif changed:
+            print(f"✔️ {filepath} salvo ({rows} times).")
+        else:
+            print(f"⏭️  {filepath} sem alterações ({rows} times).")
 
 def main():
     """Função principal para executar a extração."""
@@ -85,8 +84,6 @@ def main():
         # Salva os dados
         extractor.save_data(all_teams, season_id)
 
-        time.sleep(1)  # Respeita o limite da API
-
 
 if __name__ == "__main__":
     main()
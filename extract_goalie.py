@@ -0,0 +1,154 @@
+"""
+Extração dos goleiros pelo relatório em lote da API de estatísticas.
+
+O `extract_player_id.py` usa o relatório dos jogadores de linha
+(`skater/summary`) e o `extract_player.py` lê o landing de cada jogador com
+campos de jogador de linha, então os goleiros ficam de fora dos dois. Aqui o
+relatório `goalie/summary` traz todos os goleiros de uma temporada em uma
+única requisição (e não uma por jogador), gravados em Parquet com schema
+tipado (`goalie_schema`) em `data/player/nhl_goalies_{temporada}.parquet`.
+
+Uso:
+    python extract_goalie.py [--seasons 20242025 20252026]
+"""
+
+import argparse
+
+import requests
+
+from archive import RawArchive
+from config import CURRENT_SEASON, STATS_API_BASE_URL, goalie_path
+from pipeline import parallel_map
+from storage import ParquetRecordWriter, commit_writer
+from throttle import limiter_for
+
+# Temporadas buscadas por padrão (a corrente e as anteriores)
+DEFAULT_SEASONS = 5
+
+
+def goalie_schema():
+    """Schema (tipado) da tabela de goleiros (uma linha por goleiro)."""
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("playerId", pa.int64()),
+            ("season", pa.int32()),
+            ("goalieFullName", pa.string()),
+            ("lastName", pa.string()),
+            ("teamAbbrevs", pa.string()),
+            ("shootsCatches", pa.string()),
+            ("gamesPlayed", pa.int16()),
+            ("gamesStarted", pa.int16()),
+            ("wins", pa.int16()),
+            ("losses", pa.int16()),
+            ("otLosses", pa.int16()),
+            ("shotsAgainst", pa.int32()),
+            ("saves", pa.int32()),
+            ("goalsAgainst", pa.int16()),
+            ("goalsAgainstAverage", pa.float64()),
+            ("savePct", pa.float64()),
+            ("shutouts", pa.int16()),
+            ("timeOnIce", pa.int32()),
+        ]
+    )
+
+
+def recent_seasons(last=CURRENT_SEASON, count=DEFAULT_SEASONS):
+    """As `count` temporadas até `last` (formato AAAAAAAA), da mais antiga."""
+
+    start = int(str(last)[:4])
+    return [f"{year}{year + 1}" for year in range(start - count + 1, start + 1)]
+
+
+class SimpleNHLExtractor:
+    def __init__(self):
+        self.base_url = f"{STATS_API_BASE_URL}/goalie/summary"
+        self.limiter = limiter_for(self.base_url)
+        self.session = requests.Session()
+
+    def fetch_season_data(self, season):
+        """Busca o relatório de todos os goleiros de uma temporada."""
+
+        url = (
+            f"{self.base_url}?limit=-1&start=0&sort=wins"
+            f"&cayenneExp=gameTypeId=2%20and%20seasonId={season}"
+        )
+
+        try:
+            response = self.limiter.get(self.session, url, timeout=10)
+            if response.status_code == 200:
+                return response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"❌ Erro ao buscar os goleiros da temporada {season}: {e}")
+        return None
+
+    def process_goalie_data(self, goalie):
+        """Processa os dados de um goleiro do relatório."""
+
+        return {
+            "playerId": goalie.get("playerId"),
+            "season": goalie.get("seasonId"),
+            **{
+                field: goalie.get(field)
+                for field in goalie_schema().names
+                if field not in ("playerId", "season")
+            },
+        }
+
+    def save_season(self, data, season):
+        """Processa e salva o relatório de uma temporada. Retorna as linhas."""
+
+        goalies = (data or {}).get("data") or []
+        if not goalies:
+            print(f"Sem goleiros para a temporada: {season}")
+            return 0
+
+        filepath = goalie_path(season)
+        with ParquetRecordWriter(filepath, goalie_schema()) as writer:
+            for goalie in goalies:
+                writer.write(self.process_goalie_data(goalie))
+            changed, rows = commit_writer(writer)
+
+        if changed:
+            print(f"✔️ {filepath} salvo ({rows} goleiros).")
+        else:
+            print(f"⏭️  {filepath} sem alterações ({rows} goleiros).")
+        return rows
+
+
+def main(seasons=None):
+    """Função principal para executar a extração."""
+
+    print("🧤 Extraindo goleiros da NHL...")
+
+    seasons = seasons or recent_seasons()
+    extractor = SimpleNHLExtractor()
+
+    # Uma requisição por temporada, todas em paralelo
+    failed = 0
+    with RawArchive() as archive:
+        for season, data in parallel_map(
+            extractor.fetch_season_data, seasons, workers=len(seasons)
+        ):
+            # Guarda a resposta bruta para reprocessamento
+            archive.append("goalie_summary", season, data)
+            if not extractor.save_season(data, season):
+                failed += 1
+
+    print(f"🚦 API: {extractor.limiter.summary()}")
+    return failed
+
+
+def cli():
+    parser = argparse.ArgumentParser(description="Extração dos goleiros da NHL")
+    parser.add_argument(
+        "--seasons", nargs="+", help="temporadas (AAAAAAAA); padrão: as 5 últimas"
+    )
+    args = parser.parse_args()
+
+    raise SystemExit(1 if main(args.seasons) else 0)
+
+
+if __name__ == "__main__":
+    cli()
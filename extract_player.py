@@ -1,20 +1,74 @@
 """
 Sistema de Extração de Dados da NHL com estruturas de dados personalizadas.
 API Base: https://api-web.nhle.com/v1
+
+A extração pode ser dividida entre máquinas (`--shard i/N`): cada shard busca
+só os jogadores cujo hash estável do ID cai nele e grava arquivos parciais em
+`data/player/shards/`; `--merge N` junta os shards nos arquivos finais. Cada
+shard concluído grava um carimbo (hash da lista de IDs, número de shards e
+hash dos arquivos parciais), e o merge recusa shards de outra execução.
+
+Uso:
+    python extract_player.py [--season 20252026]
+    python extract_player.py --shard 2/4
+    python extract_player.py --merge 4 [--allow-missing]
 """
 
+import argparse
+import json
+import zlib
+
 import requests
-import pandas as pd
-import time
-from pathlib import Path
-import os
-from tqdm import tqdm
+
+from archive import RawArchive
+from config import (
+    API_BASE_URL,
+    CURRENT_SEASON,
+    PLAYER_ALL_PATH,
+    PLAYER_SEASONS_PATH,
+    player_id_path,
+    player_shard_paths,
+    player_shard_stamp_path,
+)
+from pipeline import parallel_map, threaded
+from ranks import rank_players
+from storage import (
+    CSVRecordWriter,
+    ParquetRecordWriter,
+    commit_writer,
+    dataset_hash,
+    read_records,
+    write_json,
+)
+from throttle import limiter_for
+
+# Estatísticas de `seasonTotals` guardadas na tabela jogador-temporada
+SEASON_STAT_COLUMNS = [
+    "gamesPlayed",
+    "goals",
+    "assists",
+    "points",
+    "plusMinus",
+    "pim",
+    "shots",
+    "shootingPctg",
+    "powerPlayGoals",
+    "powerPlayPoints",
+    "shorthandedGoals",
+    "gameWinningGoals",
+    "otGoals",
+    "avgToi",
+    "faceoffWinningPctg",
+]
 
 
 class SimpleNHLExtractor:
     def __init__(self):
-        self.base_url = "https://api-web.nhle.com/v1"
+        self.base_url = API_BASE_URL
+        self.limiter = limiter_for(self.base_url)
         self.session = requests.Session()
+        # Jogadores cuja busca falhou (sem resposta da API)
+        self.failed = 0
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
@@ -26,7 +80,7 @@ class SimpleNHLExtractor:
         url = f"{self.base_url}/player/{player_id}/landing"
 
         try:
-            response = self.session.get(url, timeout=10)
+            response = self.limiter.get(self.session, url, timeout=10)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -90,113 +144,381 @@ class SimpleNHLExtractor:
 
         return [player_info]
 
-    def save_data(self, data, player_id):
-        """Salva os dados em um arquivo CSV."""
-        if not data:
-            print(f"⚠️ Sem dados para salvar do jogador {player_id}")
-            return
-
-        df = pd.DataFrame(data)
-        filename = f"nhl_player_{player_id}.csv"
-        filepath = Path("data/player") / filename
-
-        # Cria o diretório se não existir
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-
-        df.to_csv(filepath, index=False, sep=";")
-        print(f"✔️ Arquivo {filename} salvo com sucesso!")
-
-    def combine_and_clean_player_csv(self, player_ids):
-        """Combina os arquivos CSV dos jogadores e apaga os arquivos individuais."""
-        df_list = []
-        individual_files = []
-
-        for player_id in player_ids:
-            filepath = Path("data/player") / f"nhl_player_{player_id}.csv"
-
-            if filepath.exists():
-                try:
-                    df = pd.read_csv(filepath, sep=";")
-                    df_list.append(df)
-                    individual_files.append(filepath)
-                    print(f"📁 Arquivo {filepath.name} carregado para combinação.")
-                except Exception as e:
-                    print(f"❌ Erro ao ler {filepath}: {e}")
-            else:
-                print(f"⚠️ Arquivo {filepath.name} não encontrado.")
-
-        if df_list:
-            # Salva o arquivo combinado
-            combined_df = pd.concat(df_list, ignore_index=True)
-            combined_filepath = Path("data/player") / "nhl_player_all.csv"
-            combined_df.to_csv(combined_filepath, index=False, sep=";")
-
-            # Apaga os arquivos individuais
-            files_deleted = 0
-            for filepath in individual_files:
-                try:
-                    os.remove(filepath)
-                    print(f"🗑️  Arquivo {filepath.name} removido.")
-                    files_deleted += 1
-                except Exception as e:
-                    print(f"⚠️ Não foi possível remover {filepath.name}: {e}")
-
-            print(f"\n✅ Arquivo combinado salvo como: {combined_filepath}")
-            print(f"📊 Total de jogadores combinados: {len(df_list)}")
+    def process_player_season_totals(self, player_data):
+        """Extrai os totais temporada a temporada (`seasonTotals`) do jogador.
+
+        Uma linha por (playerId, season, gameTypeId, leagueAbbrev, sequence),
+        aproveitando a mesma resposta do `/player/{id}/landing`.
+        """
+        if not player_data:
+            return []
+
+        player_id = player_data.get("playerId")
+        return [
+            {
+                "playerId": player_id,
+                "season": totals.get("season"),
+                "gameTypeId": totals.get("gameTypeId"),
+                "leagueAbbrev": totals.get("leagueAbbrev"),
+                "sequence": totals.get("sequence"),
+                "teamName": (totals.get("teamName") or {}).get("default"),
+                **{column: totals.get(column) for column in SEASON_STAT_COLUMNS},
+            }
+            for totals in player_data.get("seasonTotals", [])
+        ]
+
+    def parse_player(self, player_data):
+        """Transforma a resposta da API de um jogador em registros.
+
+        Retorna a tupla (registros da temporada atual, totais de todas as
+        temporadas).
+        """
+        return (
+            self.process_player_complete_data(player_data),
+            self.process_player_season_totals(player_data),
+        )
+
+    def parse_players(self, fetched, archive=None):
+        """Estágio de parse: transforma as respostas da API em registros.
+
+        As respostas brutas são guardadas no `archive` (na ordem dos IDs),
+        para que possam ser reprocessadas sem refazer as requisições.
+        """
+        for player_id, player_data in fetched:
+            if not player_data:
+                self.failed += 1
+                continue
+            if archive is not None:
+                archive.append("player_landing", player_id, player_data)
+            yield self.parse_player(player_data)
+
+    def save_data(self, parsed, filepath, seasons_filepath):
+        """Estágio de escrita: salva os jogadores (CSV) e o histórico (Parquet)."""
+        with (
+            CSVRecordWriter(filepath) as players_writer,
+            ParquetRecordWriter(
+                seasons_filepath, season_totals_schema()
+            ) as seasons_writer,
+        ):
+            for player_records, season_records in parsed:
+                for record in player_records:
+                    players_writer.write(record)
+                for record in season_records:
+                    seasons_writer.write(record)
+
+            changed, rows = commit_writer(players_writer)
+            seasons_changed, seasons_rows = commit_writer(seasons_writer)
+
+        if not rows:
+            print("⚠️ Nenhum jogador extraído, arquivo mantido.")
+        elif changed:
+            print(f"\n✅ Arquivo combinado salvo como: {filepath}")
+        else:
+            print(f"\n⏭️  {filepath} sem alterações.")
+
+        if seasons_changed:
             print(
-                f"🗑️  Arquivos individuais removidos: {files_deleted}/{len(individual_files)}"
+                f"✅ Histórico salvo como: {seasons_filepath} ({seasons_rows} linhas)"
+            )
+
+        return rows
+
+
+def season_totals_schema():
+    """Schema (tipado) da tabela jogador-temporada."""
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("playerId", pa.int64()),
+            ("season", pa.int32()),
+            ("gameTypeId", pa.int8()),
+            ("leagueAbbrev", pa.string()),
+            ("sequence", pa.int16()),
+            ("teamName", pa.string()),
+            ("gamesPlayed", pa.int32()),
+            ("goals", pa.int32()),
+            ("assists", pa.int32()),
+            ("points", pa.int32()),
+            ("plusMinus", pa.int32()),
+            ("pim", pa.int32()),
+            ("shots", pa.int32()),
+            ("shootingPctg", pa.float64()),
+            ("powerPlayGoals", pa.int32()),
+            ("powerPlayPoints", pa.int32()),
+            ("shorthandedGoals", pa.int32()),
+            ("gameWinningGoals", pa.int32()),
+            ("otGoals", pa.int32()),
+            ("avgToi", pa.string()),
+            ("faceoffWinningPctg", pa.float64()),
+        ]
+    )
+
+
+def shard_of(player_id, count):
+    """Shard (1..count) do jogador.
+
+    Usa o CRC32 do ID, estável entre processos e máquinas (ao contrário do
+    `hash()` do Python, que muda a cada execução).
+    """
+    return zlib.crc32(str(player_id).encode()) % count + 1
+
+
+def parse_shard(value):
+    """Converte `i/N` (1 ≤ i ≤ N) na tupla `(i, N)`."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"shard inválido: {value!r} (use i/N, ex.: 1/4)"
+        ) from None
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard fora do intervalo: {value!r}")
+    return index, count
+
+
+def shard_stamp(season, count):
+    """Identifica uma execução em shards: a lista de IDs e o número de shards."""
+    return {"ids_sha256": dataset_hash(player_id_path(season)), "count": count}
+
+
+def write_shard_stamp(season, index, count):
+    """Grava o carimbo de um shard concluído, com o hash dos arquivos parciais.
+
+    Um arquivo sem hash (`None`) é de um shard sem linhas, que não publica nada.
+    """
+    stamp = {
+        **shard_stamp(season, count),
+        "index": index,
+        "files": {
+            path.name: dataset_hash(path) for path in player_shard_paths(index, count)
+        },
+    }
+    write_json(stamp, player_shard_stamp_path(index, count))
+
+
+def shard_files(season, index, count):
+    """Arquivos parciais (jogadores, histórico) de um shard, validados pelo carimbo.
+
+    Retorna `None` no lugar dos arquivos vazios (não publicados). Falha se o
+    shard for de outra lista de IDs ou número de shards, ou se algum arquivo
+    mudou depois do carimbo.
+    """
+    stamp_path = player_shard_stamp_path(index, count)
+    stamp = json.loads(stamp_path.read_text(encoding="utf-8"))
+    expected = shard_stamp(season, count)
+    if {key: stamp.get(key) for key in expected} != expected:
+        raise ValueError(
+            f"Shard {index}/{count} é de outra lista de IDs ou número de shards "
+            f"({stamp_path}); extraia-o de novo"
+        )
+
+    files = []
+    for path in player_shard_paths(index, count):
+        sha256 = stamp.get("files", {}).get(path.name)
+        if sha256 is None:
+            files.append(None)
+        elif dataset_hash(path) != sha256:
+            raise ValueError(
+                f"{path} não corresponde ao carimbo do shard {index}/{count}"
             )
         else:
-            print("⚠️ Nenhum arquivo encontrado para combinar.")
+            files.append(path)
+    return files
+
 
+def main(season=CURRENT_SEASON, shard=None):
+    """Função principal para executar a extração.
+
+    Com `shard=(i, N)`, extrai só os jogadores do shard `i` e grava os
+    arquivos parciais do shard (e o carimbo) em vez dos finais. Retorna
+    `(falhas, jogadores)`: as buscas que falharam e as linhas gravadas.
+    """
+    from tqdm import tqdm
 
-def main():
-    """Função principal para executar a extração."""
     print("=" * 50)
     print("🏒 NHL Data Extractor")
     print("=" * 50)
 
-    # Lista de IDs dos jogadores
+    # Lista de IDs dos jogadores (só inteiros: cabe em memória e dá o total
+    # da barra de progresso)
 
-    IDS = pd.read_csv("data/player_id/nhl_standings_players_20252026_id.csv", sep=";")[
-        "playerId"
+    player_ids = [
+        int(record["playerId"]) for record in read_records(player_id_path(season))
     ]
 
-    player_ids = IDS.to_list()
+    filepath, seasons_filepath = PLAYER_ALL_PATH, PLAYER_SEASONS_PATH
+    if shard:
+        index, count = shard
+        print(f"🧩 Shard {index}/{count}")
+        player_ids = [
+            player_id for player_id in player_ids if shard_of(player_id, count) == index
+        ]
+        filepath, seasons_filepath = player_shard_paths(index, count)
+        # Nada da execução anterior fica para trás: um shard sem linhas não
+        # publica arquivos, e um shard interrompido fica sem carimbo
+        for path in (player_shard_stamp_path(index, count), filepath, seasons_filepath):
+            path.unlink(missing_ok=True)
 
     extractor = SimpleNHLExtractor()
+    limiter = extractor.limiter
+
+    def progress(fetched):
+        # Mostra a concorrência atual do limitador na barra de progresso
+        with tqdm(fetched, total=len(player_ids)) as bar:
+            for item in bar:
+                bar.set_postfix(concorrência=limiter.concurrency, refresh=False)
+                yield item
+
+    # fetch (threads) → parse (thread própria) → escrita, ligados por filas
+    # limitadas: nada é materializado em memória. O limitador adaptativo
+    # decide quantas das threads de fetch podem chamar a API ao mesmo tempo.
+    with RawArchive() as archive:
+        fetched = parallel_map(
+            extractor.fetch_player_data, player_ids, workers=limiter.max_limit
+        )
+        parsed = threaded(extractor.parse_players(progress(fetched), archive))
+        total = extractor.save_data(parsed, filepath, seasons_filepath)
 
-    # Criar diretório de saída
-    Path("data/player").mkdir(parents=True, exist_ok=True)
-
-    # Extrair dados de cada jogador
-    for player_id in tqdm(player_ids):
-        print(f"\n📊 Processando jogador ID: {player_id}")
-        print("-" * 30)
-
-        data = extractor.fetch_player_data(player_id)
-        if not data:
-            continue
-
-        player_records = extractor.process_player_complete_data(data)
-
-        # Salva os dados individuais
-        extractor.save_data(player_records, player_id)
-
-        time.sleep(2)  # Respeita o limite da API
+    if shard:
+        write_shard_stamp(season, *shard)
 
-    # Combina todos os arquivos e remove os individuais
-    print("\n" + "=" * 50)
-    print("🔄 Combinando e limpando arquivos CSV...")
-    print("=" * 50)
-    extractor.combine_and_clean_player_csv(player_ids)
+    # Posições e percentis só fazem sentido com todos os jogadores (não no shard)
+    if not shard and total:
+        rank_players()
 
     print("\n" + "=" * 50)
-    print("✅ Extração concluída com sucesso!")
+    if extractor.failed or not total:
+        print(f"⚠️ Extração incompleta: {extractor.failed} jogadores sem dados")
+    else:
+        print("✅ Extração concluída com sucesso!")
     print("=" * 50)
-    print("📍 Arquivo final: data/player/nhl_player_all.csv")
-    print(f"📊 Total de jogadores: {len(player_ids)}")
+    print(f"📍 Arquivo final: {filepath}")
+    print(f"📍 Histórico: {seasons_filepath}")
+    print(f"📊 Total de jogadores: {total}")
+    print(f"🚦 API: {limiter.summary()}")
+    return extractor.failed, total
+
+
+def merge_shards(season=CURRENT_SEASON, count=1, allow_missing=False):
+    """Junta os arquivos parciais dos `count` shards nos arquivos finais.
+
+    Os jogadores são deduplicados por `playerId` (vale o primeiro shard em que
+    aparecem) e ordenados pela posição na lista de IDs, então o resultado é o
+    mesmo de uma extração sem shards. Falha se algum shard não tiver
+    terminado (sem carimbo), se algum carimbo não for desta lista de IDs e
+    deste número de shards ou, sem `allow_missing`, se algum ID da lista não
+    tiver sido extraído.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    print(f"🧩 Juntando {count} shards...")
+
+    player_ids = [
+        int(record["playerId"]) for record in read_records(player_id_path(season))
+    ]
+    position = {}
+    for order, player_id in enumerate(player_ids):
+        position.setdefault(player_id, order)
+
+    shards = range(1, count + 1)
+    absent = [
+        str(player_shard_stamp_path(index, count))
+        for index in shards
+        if not player_shard_stamp_path(index, count).exists()
+    ]
+    if absent:
+        raise FileNotFoundError(f"Shards não concluídos: {', '.join(absent)}")
+    paths = [shard_files(season, index, count) for index in shards]
+
+    # Jogadores: primeiro registro de cada ID, na ordem da lista
+    players = {}
+    for players_path, _ in paths:
+        if players_path is None:
+            continue
+        for record in read_records(players_path):
+            players.setdefault(int(record["playerId"]), record)
+
+    missing = [player_id for player_id in position if player_id not in players]
+    if missing:
+        message = f"{len(missing)} jogadores da lista sem dados (ex.: {missing[:5]})"
+        if not allow_missing:
+            raise ValueError(message)
+        print(f"⚠️ {message}")
+
+    # Histórico: linhas de cada ID vindas só do shard que ficou com o jogador
+    tables = []
+    seen = pa.array([], pa.int64())
+    for _, seasons_path in paths:
+        if seasons_path is None:
+            continue
+        table = pq.read_table(seasons_path, schema=season_totals_schema())
+        table = table.filter(pc.invert(pc.is_in(table["playerId"], value_set=seen)))
+        seen = pa.concat_arrays([seen, pc.unique(table["playerId"])])
+        tables.append(table)
+    seasons = (
+        pa.concat_tables(tables) if tables else season_totals_schema().empty_table()
+    )
+
+    # Mesma ordem da extração sem shards (sort estável mantém a ordem
+    # original das temporadas de cada jogador)
+    order = pc.index_in(seasons["playerId"], value_set=pa.array(player_ids, pa.int64()))
+    seasons = (
+        seasons.append_column("_order", order)
+        .append_column("_row", pa.array(range(seasons.num_rows), pa.int64()))
+        .sort_by([("_order", "ascending"), ("_row", "ascending")])
+        .drop_columns(["_order", "_row"])
+    )
+
+    with (
+        CSVRecordWriter(PLAYER_ALL_PATH) as players_writer,
+        ParquetRecordWriter(
+            PLAYER_SEASONS_PATH, season_totals_schema()
+        ) as seasons_writer,
+    ):
+        for player_id in sorted(
+            players, key=lambda pid: position.get(pid, len(position))
+        ):
+            players_writer.write(players[player_id])
+        seasons_writer.write_table(seasons)
+
+        changed, rows = commit_writer(players_writer)
+        seasons_changed, seasons_rows = commit_writer(seasons_writer)
+
+    print(f"{'✅' if changed else '⏭️ '} {PLAYER_ALL_PATH}: {rows} jogadores")
+    print(
+        f"{'✅' if seasons_changed else '⏭️ '} {PLAYER_SEASONS_PATH}: "
+        f"{seasons_rows} linhas"
+    )
+    rank_players()
+    return rows
+
+
+def cli():
+    parser = argparse.ArgumentParser(description="Extração dos jogadores da NHL")
+    parser.add_argument("--season", default=CURRENT_SEASON)
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        "--shard", type=parse_shard, help="extrai só o shard i de N (ex.: 2/4)"
+    )
+    group.add_argument(
+        "--merge", type=int, metavar="N", help="junta os N shards nos arquivos finais"
+    )
+    parser.add_argument(
+        "--allow-missing",
+        action="store_true",
+        help="no --merge, aceita IDs da lista sem dados",
+    )
+    args = parser.parse_args()
+
+    if args.merge:
+        merge_shards(args.season, args.merge, args.allow_missing)
+    else:
+        failed, rows = main(args.season, args.shard)
+        raise SystemExit(1 if failed or not rows else 0)
 
 
 if __name__ == "__main__":
-    main()
+    cli()
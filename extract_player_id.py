@@ -4,14 +4,17 @@ Sistema de Extração de Dados da NHL com estruturas de dados personalidades.
 API Base: https://api-web.nhle.com/v1
 """
 import requests
-import pandas as pd
-import time
-from datetime import datetime
-from pathlib import Path
+
+from archive import RawArchive
+from config import CURRENT_SEASON, STATS_API_BASE_URL, player_id_path
+from pipeline import parallel_map
+from storage import save_records
+from throttle import limiter_for
 
 class SimpleNHLExtractor:
     def __init__(self):
-        self.base_url = "https://api.nhle.com/stats/rest/en/skater/summary?limit=-1&start=0&sort=points&cayenneExp=seasonId="
+        self.base_url = f"{STATS_API_BASE_URL}/skater/summary?limit=-1&start=0&sort=points&cayenneExp=seasonId="
+        self.limiter = limiter_for(self.base_url)
         self.session = requests.Session()
 
     def fetch_season_data(self, date):
@@ -20,7 +23,7 @@ class SimpleNHLExtractor:
         url = f"{self.base_url}{date}"
 
         try:
-            response = self.session.get(url, timeout=10)
+            response = self.limiter.get(self.session, url, timeout=10)
             if response.status_code == 200:
                 return response.json()
         except Exception as e:
@@ -38,55 +41,65 @@ class SimpleNHLExtractor:
         }
 
     def save_data(self, data, season_id):
-        """Salva os dados em um arquivo CSV."""
+        """Salva os dados em um arquivo CSV. Retorna o número de jogadores."""
 
-        if not data:
+        filepath = player_id_path(season_id)
+
+        changed, rows = save_records(data, filepath)
+        if not rows:
             print(f"Sem dados para salvar da temporada {season_id}")
-            return
+        elif changed:
+            print(f"✔️ {filepath} salvo ({rows} jogadores).")
+        else:
+            print(f"⏭️  {filepath} sem alterações ({rows} jogadores).")
+        return rows
 
-        df = pd.DataFrame(data)
-        filename = f"nhl_standings_players_{season_id}_id.csv"
-        filepath = Path("data/player") / filename
+    def save_season(self, data, season):
+        """Processa e salva a resposta da API de uma temporada. Retorna os jogadores."""
 
-        # Cria o diretório se não existir
-        filepath.parent.mkdir(parents=True, exist_ok=True)
+        if not data:
+            return 0
 
-        df.to_csv(filepath, index=False, sep=';')
-        print(f"✔️ {filepath} salvo ({len(data)} times).")
+        standings = data.get('data', [])
+        if not standings:
+            print(f"Sem dados para a temporada: {season}")
+            return 0
 
-def main():
-    """Função principal para executar a extração."""
+        season_id = standings[0].get('seasonId', 'unknown')
 
-    print("🏒 Extraindo dados da NHL...")
+        # Salva os dados
+        players = (self.process_team_data(team) for team in standings)
+        return self.save_data(players, season_id)
 
-    dates = ['20252026']
 
-    extractor = SimpleNHLExtractor()
+def main(season=CURRENT_SEASON):
+    """Função principal para executar a extração.
 
-    for date in dates:
-        print(f"📅 Processando dados para a data: {date}")
+    Retorna o número de temporadas que falharam.
+    """
 
-        data = extractor.fetch_season_data(date)
-        if not data:
-            continue
+    print("🏒 Extraindo dados da NHL...")
 
-        standings = data.get('data', [])
-        if not standings:
-            print(f"Sem dados para a data: {date}")
-            continue
+    dates = [season]
 
-        season_id = standings[0].get('seasonId', 'unknown')
+    extractor = SimpleNHLExtractor()
 
-        all_teams = []
-        for team in standings:
-            team_data = extractor.process_team_data(team)
-            all_teams.append(team_data)
+    failed = 0
+    with RawArchive() as archive:
+        fetched = parallel_map(
+            extractor.fetch_season_data, dates, workers=len(dates)
+        )
+        for date, data in fetched:
+            print(f"📅 Processando dados para a data: {date}")
 
-        # Salva os dados
-        extractor.save_data(all_teams, season_id)
+            # Guarda a resposta bruta para reprocessamento
+            archive.append('skater_summary', date, data)
+            if not extractor.save_season(data, date):
+                failed += 1
 
-        time.sleep(1)  # Respeita o limite da API
+    print(f"🚦 API: {extractor.limiter.summary()}")
+    return failed
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(1 if main() else 0)
@@ -5,15 +5,20 @@ API Base: https://api-web.nhle.com/v1
 """
 
 import requests
-import pandas as pd
-import time
 from datetime import datetime
-from pathlib import Path
+
+from archive import RawArchive
+from config import API_BASE_URL, team_path
+from pipeline import parallel_map
+from ranks import rank_teams
+from storage import save_records
+from throttle import limiter_for
 
 
 class SimpleNHLExtractor:
     def __init__(self):
-        self.base_url = "https://api-web.nhle.com/v1"
+        self.base_url = API_BASE_URL
+        self.limiter = limiter_for(self.base_url)
         self.session = requests.Session()
 
     def fetch_season_data(self, date):
@@ -22,7 +27,7 @@ class SimpleNHLExtractor:
         url = f"{self.base_url}/standings/{date}"
 
         try:
-            response = self.session.get(url, timeout=10)
+            response = self.limiter.get(self.session, url, timeout=10)
             if response.status_code == 200:
                 return response.json()
         except Exception as e:
@@ -62,62 +67,96 @@ class SimpleNHLExtractor:
         }
 
     def save_data(self, data, season_id):
-        """Salva os dados em um arquivo CSV."""
+        """Salva os dados em um arquivo CSV. Retorna o número de times."""
 
-        if not data:
+        filepath = team_path(season_id)
+
+        changed, rows = save_records(data, filepath)
+        if not rows:
             print(f"Sem dados para salvar da temporada {season_id}")
-            return
+        elif changed:
+            print(f"✔️ {filepath} salvo ({rows} times).")
+        else:
+            print(f"⏭️  {filepath} sem alterações ({rows} times).")
 
-        df = pd.DataFrame(data)
-        filename = f"nhl_standings_{season_id}.csv"
-        filepath = Path("data/teams") / filename
+        # Posições e percentis da temporada, ao lado da classificação
+        if rows:
+            rank_teams(season_id)
+        return rows
 
-        # Cria o diretório se não existir
-        filepath.parent.mkdir(parents=True, exist_ok=True)
+    def save_standings(self, data, date):
+        """Processa e salva a resposta da API de uma data. Retorna os times."""
 
-        df.to_csv(filepath, index=False, sep=";")
-        print(f"✔️ {filepath} salvo ({len(data)} times).")
+        if not data:
+            return 0
 
+        standings = data.get("standings", [])
+        if not standings:
+            print(f"Sem dados para a data: {date}")
+            return 0
 
-def main():
-    """Função principal para executar a extração."""
+        season_id = standings[0].get("seasonId", "unknown")
 
-    print("🏒 Extraindo dados da NHL...")
+        # Salva os dados
+        teams = (self.process_team_data(team) for team in standings)
+        return self.save_data(teams, season_id)
 
-    dates = [
-        "2022-05-01",
-        "2023-04-14",
-        "2024-04-18",
-        "2025-04-17",
-        datetime.now().strftime("%Y-%m-%d"),
-    ]
 
-    extractor = SimpleNHLExtractor()
+def season_dates(extractor, season):
+    """Data da classificação de `season`: o último dia (ou hoje, se em andamento)."""
 
-    for date in dates:
-        print(f"📅 Processando dados para a data: {date}")
+    # Import local: o backfill importa este módulo
+    from backfill import season_windows
 
-        data = extractor.fetch_season_data(date)
-        if not data:
-            continue
+    today = datetime.now().strftime("%Y-%m-%d")
+    window = season_windows(extractor, today).get(str(season))
+    if window is None:
+        print(f"⚠️ Temporada {season} sem classificação nos metadados da API")
+        return []
+    return [window[1]]
 
-        standings = data.get("standings", [])
-        if not standings:
-            print(f"Sem dados para a data: {date}")
-            continue
 
-        season_id = standings[0].get("seasonId", "unknown")
+def main(season=None):
+    """Função principal para executar a extração.
 
-        all_teams = []
-        for team in standings:
-            team_data = extractor.process_team_data(team)
-            all_teams.append(team_data)
+    Com `season`, busca só a classificação daquela temporada. Retorna o
+    número de datas que falharam.
+    """
 
-        # Salva os dados
-        extractor.save_data(all_teams, season_id)
+    print("🏒 Extraindo dados da NHL...")
+
+    extractor = SimpleNHLExtractor()
 
-        time.sleep(1)  # Respeita o limite da API
+    if season is None:
+        dates = [
+            "2022-05-01",
+            "2023-04-14",
+            "2024-04-18",
+            "2025-04-17",
+            datetime.now().strftime("%Y-%m-%d"),
+        ]
+    else:
+        dates = season_dates(extractor, season)
+        if not dates:
+            return 1
+
+    # As datas são buscadas em paralelo (o limitador adaptativo controla
+    # quantas ao mesmo tempo) e processadas conforme chegam
+    failed = 0
+    with RawArchive() as archive:
+        for date, data in parallel_map(
+            extractor.fetch_season_data, dates, workers=len(dates)
+        ):
+            print(f"📅 Processando dados para a data: {date}")
+
+            # Guarda a resposta bruta para reprocessamento
+            archive.append("standings", date, data)
+            if not extractor.save_standings(data, date):
+                failed += 1
+
+    print(f"🚦 API: {extractor.limiter.summary()}")
+    return failed
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(1 if main() else 0)
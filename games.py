@@ -0,0 +1,389 @@
+"""
+Jogos: boxscores da temporada regular em tabelas time-jogo e jogador-jogo.
+
+Os jogos de cada temporada vêm do calendário (`schedule.py`); o boxscore
+(`/gamecenter/{id}/boxscore`) de cada jogo encerrado é buscado em paralelo,
+pelo limitador adaptativo do host, e gravado em Parquet particionado por
+temporada e data (layout Hive, lido de uma vez com `read_games`):
+
+    data/games/team_games/season=20242025/date=2024-10-08/part-0.parquet
+    data/games/player_games/season=20242025/date=2024-10-08/part-0.parquet
+
+A busca é incremental: jogos encerrados já gravados nunca são buscados de
+novo, e cada data é publicada (de forma atômica) assim que todos os seus
+jogos chegam, então uma execução interrompida retoma de onde parou. A
+partição de `team_games` é gravada por último e é ela que marca um jogo como
+gravado. Ao fim de cada temporada, o manifesto registra o hash de cada tabela
+(`games/{tabela}/season=...`, combinado das partições).
+
+Uso:
+    python games.py [--from 20232024] [--to 20252026] [--force]
+"""
+
+import argparse
+import sys
+from collections import Counter
+from datetime import date as Date
+
+from archive import RawArchive
+from backfill import fetch_json, season_windows
+from config import GAMES_DIR, games_dir, games_partition_path, schedule_path
+from extract_team import SimpleNHLExtractor
+from pipeline import parallel_map
+from schedule import FINAL_STATES, crawl_schedule
+from storage import ParquetRecordWriter, read_records, record_partitions
+
+TABLES = ["team_games", "player_games"]
+
+# Estatísticas dos jogadores de linha (somadas no time-jogo as de `TEAM_TOTALS`)
+SKATER_STATS = [
+    "goals",
+    "assists",
+    "points",
+    "plusMinus",
+    "pim",
+    "hits",
+    "powerPlayGoals",
+    "shots",
+    "blockedShots",
+    "shifts",
+    "giveaways",
+    "takeaways",
+]
+TEAM_TOTALS = [
+    "hits",
+    "pim",
+    "powerPlayGoals",
+    "blockedShots",
+    "giveaways",
+    "takeaways",
+]
+GOALIE_STATS = ["saves", "shotsAgainst", "goalsAgainst"]
+
+
+def team_game_schema():
+    """Schema da tabela time-jogo (uma linha por time em cada jogo)."""
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("gameId", pa.int64()),
+            ("team", pa.string()),
+            ("opponent", pa.string()),
+            ("home", pa.bool_()),
+            ("win", pa.bool_()),
+            ("lastPeriodType", pa.string()),
+            ("goalsFor", pa.int16()),
+            ("goalsAgainst", pa.int16()),
+            ("shots", pa.int16()),
+            ("shotsAgainst", pa.int16()),
+            *[(stat, pa.int16()) for stat in TEAM_TOTALS],
+        ]
+    )
+
+
+def player_game_schema():
+    """Schema da tabela jogador-jogo (goleiros com `saves`, `savePctg`...)."""
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("gameId", pa.int64()),
+            ("playerId", pa.int64()),
+            ("team", pa.string()),
+            ("opponent", pa.string()),
+            ("home", pa.bool_()),
+            ("name", pa.string()),
+            ("position", pa.string()),
+            ("sweaterNumber", pa.int16()),
+            ("toi", pa.int32()),
+            *[(stat, pa.int16()) for stat in SKATER_STATS],
+            ("faceoffWinningPctg", pa.float64()),
+            *[(stat, pa.int16()) for stat in GOALIE_STATS],
+            ("savePctg", pa.float64()),
+        ]
+    )
+
+
+def toi_seconds(value):
+    """Tempo no gelo ("MM:SS") em segundos (`None` se ausente)."""
+
+    if not value:
+        return None
+    minutes, _, seconds = str(value).partition(":")
+    return int(minutes) * 60 + int(seconds or 0)
+
+
+def goalie_record(goalie):
+    """Estatísticas de goleiro (`saveShotsAgainst` = "defesas/chutes")."""
+
+    saves, _, shots = str(goalie.get("saveShotsAgainst") or "").partition("/")
+    return {
+        "saves": goalie.get("saves", int(saves) if saves else None),
+        "shotsAgainst": goalie.get("shotsAgainst", int(shots) if shots else None),
+        "goalsAgainst": goalie.get("goalsAgainst"),
+        "savePctg": goalie.get("savePctg"),
+    }
+
+
+def boxscore_records(data):
+    """Linhas time-jogo e jogador-jogo de um boxscore encerrado.
+
+    Retorna `(times, jogadores)` ou `None` se o jogo não terminou ou veio sem
+    estatísticas.
+    """
+
+    if not data or data.get("gameState") not in FINAL_STATES:
+        return None
+    by_team = data.get("playerByGameStats") or {}
+    if not by_team:
+        return None
+
+    game_id = data.get("id")
+    period = (data.get("gameOutcome") or {}).get("lastPeriodType")
+    sides = {side: data.get(f"{side}Team") or {} for side in ("home", "away")}
+
+    teams, players = [], []
+    for side, other in (("home", "away"), ("away", "home")):
+        team, opponent = sides[side], sides[other]
+        groups = by_team.get(f"{side}Team") or {}
+        base = {
+            "gameId": game_id,
+            "team": team.get("abbrev"),
+            "opponent": opponent.get("abbrev"),
+            "home": side == "home",
+        }
+
+        totals = dict.fromkeys(TEAM_TOTALS, 0)
+        for player in groups.get("forwards", []) + groups.get("defense", []):
+            record = {
+                **base,
+                "playerId": player.get("playerId"),
+                "name": (player.get("name") or {}).get("default"),
+                "position": player.get("position"),
+                "sweaterNumber": player.get("sweaterNumber"),
+                "toi": toi_seconds(player.get("toi")),
+                **{stat: player.get(stat) for stat in SKATER_STATS},
+                "shots": player.get("sog", player.get("shots")),
+                "faceoffWinningPctg": player.get("faceoffWinningPctg"),
+            }
+            for stat in TEAM_TOTALS:
+                totals[stat] += record[stat] or 0
+            players.append(record)
+
+        for goalie in groups.get("goalies", []):
+            players.append(
+                {
+                    **base,
+                    "playerId": goalie.get("playerId"),
+                    "name": (goalie.get("name") or {}).get("default"),
+                    "position": goalie.get("position", "G"),
+                    "sweaterNumber": goalie.get("sweaterNumber"),
+                    "toi": toi_seconds(goalie.get("toi")),
+                    "pim": goalie.get("pim"),
+                    **goalie_record(goalie),
+                }
+            )
+
+        goals_for, goals_against = team.get("score"), opponent.get("score")
+        teams.append(
+            {
+                **base,
+                "win": (goals_for or 0) > (goals_against or 0),
+                "lastPeriodType": period,
+                "goalsFor": goals_for,
+                "goalsAgainst": goals_against,
+                "shots": team.get("sog"),
+                "shotsAgainst": opponent.get("sog"),
+                **totals,
+            }
+        )
+    return teams, players
+
+
+def read_games(table, seasons=None, columns=None):
+    """Lê uma tabela de jogos (todas as partições) como `pyarrow.Table`.
+
+    `season` e `date` (texto) vêm do caminho das partições; `seasons` limita
+    as temporadas lidas (só as partições delas são abertas).
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    directory = GAMES_DIR / table
+    partitions = pa.schema([("season", pa.string()), ("date", pa.string())])
+    schema = team_game_schema() if table == "team_games" else player_game_schema()
+    schema = pa.unify_schemas([schema, partitions])
+    if not directory.exists():
+        empty = schema.empty_table()
+        return empty.select(columns) if columns else empty
+
+    dataset = ds.dataset(
+        directory,
+        schema=schema,
+        format="parquet",
+        partitioning=ds.partitioning(partitions, flavor="hive"),
+    )
+    expression = None
+    if seasons is not None:
+        expression = ds.field("season").isin([str(season) for season in seasons])
+    return dataset.to_table(columns=columns, filter=expression)
+
+
+def stored_games(season):
+    """IDs dos jogos de uma temporada já gravados (partições de `team_games`)."""
+
+    table = read_games("team_games", [season], columns=["gameId"])
+    return set(table["gameId"].to_pylist())
+
+
+def write_partition(table, season, date, records):
+    """Publica uma partição, mantendo os jogos já gravados que não vieram de
+    novo. Retorna o número de linhas.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    schema = team_game_schema() if table == "team_games" else player_game_schema()
+    filepath = games_partition_path(table, season, date)
+    with ParquetRecordWriter(filepath, schema) as writer:
+        if filepath.exists():
+            stored = pq.read_table(filepath, schema=schema)
+            fetched = sorted({record["gameId"] for record in records})
+            keep = pc.invert(pc.is_in(stored["gameId"], value_set=pa.array(fetched)))
+            writer.write_table(stored.filter(keep))
+        for record in records:
+            writer.write(record)
+        _, _, rows = writer.commit()
+    return rows
+
+
+def final_games(season):
+    """Jogos encerrados do calendário gravado: data → [IDs]."""
+
+    games = {}
+    for game in read_records(schedule_path(season)):
+        if game["gameState"] in FINAL_STATES:
+            games.setdefault(game["date"], []).append(int(game["gameId"]))
+    return games
+
+
+def crawl_season(extractor, season, archive=None, force=False):
+    """Busca os boxscores pendentes de uma temporada (a partir do calendário).
+
+    Retorna o número de jogos que falharam (ficam pendentes para a próxima
+    execução).
+    """
+
+    games = final_games(season)
+    stored = set() if force else stored_games(season)
+    pending = [
+        (date, game_id)
+        for date in sorted(games)
+        for game_id in games[date]
+        if game_id not in stored
+    ]
+    total = sum(len(ids) for ids in games.values())
+    if not pending:
+        print(f"⏭️  {season}: {total} jogos encerrados, todos gravados")
+        return 0
+
+    # Os boxscores chegam na ordem das datas; cada data é publicada assim que
+    # o último jogo dela chega (jogos que falharam ficam de fora)
+    remaining = Counter(date for date, _ in pending)
+    batch = {}
+    failed = 0
+    for (date, game_id), data in parallel_map(
+        lambda item: fetch_json(extractor, f"gamecenter/{item[1]}/boxscore"),
+        pending,
+        workers=extractor.limiter.max_limit,
+    ):
+        if archive is not None:
+            archive.append("boxscore", str(game_id), data)
+        teams, players = batch.setdefault(date, ([], []))
+        records = boxscore_records(data)
+        if records is None:
+            failed += 1
+        else:
+            teams.extend(records[0])
+            players.extend(records[1])
+
+        remaining[date] -= 1
+        if remaining[date] == 0:
+            teams, players = batch.pop(date)
+            if teams:
+                write_partition("player_games", season, date, players)
+                write_partition("team_games", season, date, teams)
+
+    for table in TABLES:
+        record_partitions(games_dir(table, season))
+    print(
+        f"{'⚠️' if failed else '✔️'} {season}: {total} jogos encerrados, "
+        f"{len(pending) - failed} buscados, {failed} falharam"
+    )
+    return failed
+
+
+def needs_schedule(season, refresh):
+    """Indica se o calendário da temporada precisa ser buscado: quando falta
+    ou (com `refresh`) quando ainda há jogos por disputar.
+    """
+
+    filepath = schedule_path(season)
+    if not filepath.exists():
+        return True
+    return refresh and any(
+        game["gameState"] not in FINAL_STATES for game in read_records(filepath)
+    )
+
+
+def crawl(first=None, last=None, force=False, refresh_schedule=True):
+    """Busca os boxscores das temporadas entre `first` e `last`.
+
+    Sem `first` e `last`, só a temporada mais recente; o calendário é buscado
+    antes quando necessário (`needs_schedule`). Retorna o número de jogos que
+    falharam.
+    """
+
+    extractor = SimpleNHLExtractor()
+    windows = season_windows(extractor, Date.today().isoformat())
+
+    seasons = sorted(windows)
+    if first is None and last is None:
+        seasons = seasons[-1:]
+    seasons = [
+        season
+        for season in seasons
+        if (first is None or season >= str(first))
+        and (last is None or season <= str(last))
+    ]
+
+    failed = 0
+    with RawArchive() as archive:
+        for season in seasons:
+            if needs_schedule(season, refresh_schedule) and not crawl_schedule(
+                season, extractor, windows
+            ):
+                failed += 1
+                continue
+            failed += crawl_season(extractor, season, archive, force)
+
+    print(f"🚦 API: {extractor.limiter.summary()}")
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Boxscores dos jogos")
+    parser.add_argument("--from", dest="first", help="primeira temporada (AAAAAAAA)")
+    parser.add_argument("--to", dest="last", help="última temporada (AAAAAAAA)")
+    parser.add_argument(
+        "--force", action="store_true", help="busca também os jogos já gravados"
+    )
+    args = parser.parse_args()
+
+    sys.exit(1 if crawl(args.first, args.last, args.force) else 0)
+
+
+if __name__ == "__main__":
+    main()
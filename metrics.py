@@ -0,0 +1,182 @@
+"""
+Métricas derivadas dos times e jogadores.
+
+Todas as métricas são calculadas de forma vetorizada sobre a tabela completa
+(todas as temporadas) logo após o carregamento, uma única vez por versão dos
+dados. As páginas apenas leem as colunas prontas.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Expoente da fórmula de Pitágoras (GF^k / (GF^k + GA^k)) usado para hóquei
+PYTHAGOREAN_EXPONENT = 2.0
+
+TEAM_NUMERIC_COLUMNS = [
+    "gamesPlayed",
+    "wins",
+    "losses",
+    "ties",
+    "otLosses",
+    "team_points",
+    "pointPctg",
+    "goalFor",
+    "goalAgainst",
+    "homeGamesPlayed",
+    "homeWins",
+    "homeLosses",
+    "homeOtLosses",
+    "homeGoalsFor",
+    "homeGoalsAgainst",
+    "roadGamesPlayed",
+    "roadWins",
+    "roadLosses",
+    "roadOtLosses",
+    "roadGoalsFor",
+    "roadGoalsAgainst",
+]
+
+PLAYER_NUMERIC_COLUMNS = [
+    "sweaterNumber",
+    "gamesPlayed",
+    "points",
+    "goals",
+    "assists",
+    "shots",
+    "shootingPctg",
+    "powerPlayGoals",
+    "powerPlayPoints",
+    "otGoals",
+]
+
+# Líderes entre os goleiros: estatística → ordem crescente (menor é melhor)
+GOALIE_LEADER_STATS = {
+    "wins": False,
+    "savePct": False,
+    "goalsAgainstAverage": True,
+    "shutouts": False,
+}
+# Médias só valem para goleiros com uma fração mínima dos jogos do goleiro
+# que mais jogou na temporada (sem isso, quem jogou 1 jogo lidera)
+GOALIE_RATE_STATS = ["savePct", "goalsAgainstAverage"]
+GOALIE_MIN_GAMES_SHARE = 0.25
+
+
+def _per(numerator, denominator):
+    """Divisão elemento a elemento com NaN quando o denominador é zero."""
+    return numerator / denominator.where(denominator != 0)
+
+
+def _to_numeric(df, columns):
+    for col in columns:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+
+
+def add_team_metrics(teams):
+    """Adiciona as métricas derivadas à tabela de times (todas as temporadas)."""
+
+    teams = teams.copy()
+    _to_numeric(teams, TEAM_NUMERIC_COLUMNS)
+    games = teams["gamesPlayed"]
+
+    teams["pointPctgPercent"] = (teams["pointPctg"] * 100).round(2)
+    teams["goalDifferential"] = teams["goalFor"] - teams["goalAgainst"]
+    teams["pointsPerGame"] = _per(teams["team_points"], games)
+    teams["goalsForPerGame"] = _per(teams["goalFor"], games)
+    teams["goalsAgainstPerGame"] = _per(teams["goalAgainst"], games)
+    teams["goalDifferentialPerGame"] = _per(teams["goalDifferential"], games)
+
+    # Casa / fora
+    for side in ("home", "road"):
+        side_games = teams[f"{side}GamesPlayed"]
+        side_points = 2 * teams[f"{side}Wins"] + teams[f"{side}OtLosses"]
+        teams[f"{side}Points"] = side_points
+        teams[f"{side}PointPctg"] = (_per(side_points, 2 * side_games) * 100).round(2)
+        teams[f"{side}GoalDifferential"] = (
+            teams[f"{side}GoalsFor"] - teams[f"{side}GoalsAgainst"]
+        )
+        teams[f"{side}GoalsForPerGame"] = _per(teams[f"{side}GoalsFor"], side_games)
+        teams[f"{side}GoalsAgainstPerGame"] = _per(
+            teams[f"{side}GoalsAgainst"], side_games
+        )
+
+    # Pontos esperados pela fórmula de Pitágoras
+    goals_for = teams["goalFor"].astype(float) ** PYTHAGOREAN_EXPONENT
+    goals_against = teams["goalAgainst"].astype(float) ** PYTHAGOREAN_EXPONENT
+    teams["pythagoreanWinPctg"] = _per(goals_for, goals_for + goals_against)
+    teams["expectedPoints"] = (teams["pythagoreanWinPctg"] * 2 * games).round(1)
+    teams["pointsAboveExpected"] = teams["team_points"] - teams["expectedPoints"]
+
+    return teams
+
+
+def add_player_metrics(players):
+    """Adiciona as métricas derivadas à tabela de jogadores."""
+
+    players = players.copy()
+    _to_numeric(players, PLAYER_NUMERIC_COLUMNS)
+    games = players["gamesPlayed"]
+
+    players["pointsPerGame"] = _per(players["points"], games)
+    players["goalsPerGame"] = _per(players["goals"], games)
+    players["assistsPerGame"] = _per(players["assists"], games)
+    players["shotsPerGame"] = _per(players["shots"], games)
+    players["shootingPctgPercent"] = (players["shootingPctg"] * 100).round(2)
+    players["powerPlayPointShare"] = _per(players["powerPlayPoints"], players["points"])
+    players["pointsPer82"] = (players["pointsPerGame"] * 82).round(1)
+
+    return players
+
+
+def add_goalie_metrics(goalies):
+    """Adiciona as métricas derivadas à tabela de goleiros (todas as temporadas)."""
+
+    goalies = goalies.copy()
+    goalies["season"] = goalies["season"].astype(str)
+    games = goalies["gamesPlayed"]
+
+    goalies["savePctPercent"] = (goalies["savePct"] * 100).round(2)
+    goalies["winPctg"] = _per(goalies["wins"], games)
+    goalies["shotsAgainstPerGame"] = _per(goalies["shotsAgainst"], games)
+    most_games = goalies.groupby("season")["gamesPlayed"].transform("max")
+    goalies["qualified"] = games >= most_games * GOALIE_MIN_GAMES_SHARE
+
+    return goalies
+
+
+def goalie_leaders(goalies, limit=10):
+    """Líderes entre os goleiros: temporada → {estatística: `limit` primeiros}.
+
+    Nas médias (`GOALIE_RATE_STATS`) só entram os goleiros qualificados; os
+    empates ficam com quem jogou mais.
+    """
+
+    leaders = {}
+    for season, df in goalies.groupby("season"):
+        leaders[season] = {}
+        for stat, ascending in GOALIE_LEADER_STATS.items():
+            pool = df[df["qualified"]] if stat in GOALIE_RATE_STATS else df
+            leaders[season][stat] = (
+                pool.sort_values(
+                    [stat, "gamesPlayed"], ascending=[ascending, False], kind="stable"
+                )
+                .head(limit)
+                .reset_index(drop=True)
+            )
+    return leaders
+
+
+def season_summary(teams):
+    """Resumo por temporada (uma linha por temporada) a partir dos times."""
+
+    grouped = teams.groupby("season")
+    summary = pd.DataFrame(
+        {
+            "teams": grouped.size(),
+            "games": grouped["gamesPlayed"].sum() / 2,
+            "goals": grouped["goalFor"].sum(),
+        }
+    )
+    summary["goalsPerGame"] = summary["goals"] / summary["games"].replace(0, np.nan)
+    return summary
@@ -0,0 +1,319 @@
+"""
+Orquestrador da extração: executa os estágios como um DAG.
+
+Cada estágio declara os arquivos que lê (inputs) e que escreve (outputs); as
+dependências são derivadas desses caminhos (ids → players, calendário →
+jogos e lances, teams, goleiros e a classificação dia a dia independentes, e
+o snapshot do app depois de todos).
+Estágios independentes rodam em paralelo, então o tempo total cai para o
+caminho crítico. Um estágio é pulado quando seus inputs não mudaram desde a
+última execução bem-sucedida, e o tempo de cada estágio fica registrado no
+manifesto (`data/manifest.json`, chave `stages`).
+
+Uso:
+    python orchestrator.py [--season 20252026] [--only ids players] [--force]
+"""
+
+import argparse
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import extract_goalie
+import extract_player
+import extract_player_id
+import events
+import extract_team
+import games
+import race
+import schedule
+import snapshot
+from config import (
+    CURRENT_SEASON,
+    PLAYER_ALL_PATH,
+    PLAYER_RANKS_PATH,
+    PLAYER_SEASONS_PATH,
+    TEAMS_DIR,
+    events_dir,
+    games_dir,
+    goalie_path,
+    player_id_path,
+    race_path,
+    schedule_path,
+    team_path,
+    team_ranks_path,
+)
+from storage import dataset_hash, dataset_key, load_manifest, record_stage
+from throttle import limiters
+
+
+class Stage:
+    def __init__(self, name, run, inputs=(), outputs=(), max_age=None):
+        self.name = name
+        self.run = run
+        self.inputs = [Path(path) for path in inputs]
+        self.outputs = [Path(path) for path in outputs]
+        self.max_age = max_age
+
+    def depends_on(self, other):
+        """Indica se este estágio lê algum arquivo escrito por `other`."""
+        return any(path in other.outputs for path in self.inputs)
+
+    def fingerprint(self):
+        """Hashes atuais dos inputs do estágio."""
+        return {dataset_key(path): dataset_hash(path) for path in self.inputs}
+
+    def is_fresh(self, state):
+        """Indica se o estágio pode ser pulado.
+
+        Estágios sem inputs (que só leem a API) sempre rodam. Os demais são
+        pulados se a última execução terminou bem, com os mesmos inputs, as
+        saídas ainda existem e (se houver `max_age`) não expiraram.
+        """
+        if not self.inputs or not state or state.get("status") != "ok":
+            return False
+
+        if state.get("inputs") != self.fingerprint():
+            return False
+
+        if not all(path.exists() for path in self.outputs):
+            return False
+
+        if self.max_age is not None:
+            finished_at = datetime.fromisoformat(state["finished_at"])
+            if datetime.now(timezone.utc) - finished_at > self.max_age:
+                return False
+
+        return True
+
+
+def build_stages(season=CURRENT_SEASON):
+    """Define os estágios da extração de uma temporada."""
+
+    def crawl_ids():
+        if extract_player_id.main(season):
+            raise RuntimeError("lista de jogadores indisponível")
+
+    def crawl_players():
+        failed, rows = extract_player.main(season)
+        if failed or not rows:
+            raise RuntimeError(
+                f"jogadores incompletos ({failed} falhas, {rows} linhas)"
+            )
+
+    def crawl_teams():
+        if extract_team.main(season):
+            raise RuntimeError("classificação dos times indisponível")
+
+    def crawl_goalies():
+        if extract_goalie.main(extract_goalie.recent_seasons(season)):
+            raise RuntimeError("relatório dos goleiros incompleto")
+
+    def crawl_race():
+        if race.crawl(season, season):
+            raise RuntimeError("classificação dia a dia incompleta")
+
+    def crawl_schedule():
+        if not schedule.crawl_schedule(season):
+            raise RuntimeError("calendário indisponível")
+
+    def crawl_games():
+        if games.crawl(season, season, refresh_schedule=False):
+            raise RuntimeError("boxscores incompletos")
+
+    def crawl_events():
+        if events.crawl(season, season, refresh_schedule=False):
+            raise RuntimeError("lances incompletos")
+
+    return [
+        Stage(
+            "ids",
+            crawl_ids,
+            outputs=[player_id_path(season)],
+        ),
+        Stage(
+            "players",
+            crawl_players,
+            inputs=[player_id_path(season)],
+            outputs=[PLAYER_ALL_PATH, PLAYER_SEASONS_PATH, PLAYER_RANKS_PATH],
+            # As estatísticas mudam mesmo com a lista de IDs igual
+            max_age=timedelta(hours=20),
+        ),
+        Stage(
+            "teams",
+            crawl_teams,
+            outputs=[team_path(season), team_ranks_path(season)],
+        ),
+        # Goleiros: um relatório em lote por temporada (sem IDs nem landing)
+        Stage(
+            "goalies",
+            crawl_goalies,
+            outputs=[goalie_path(season)],
+        ),
+        Stage(
+            "race",
+            crawl_race,
+            outputs=[race_path(season)],
+        ),
+        Stage(
+            "schedule",
+            crawl_schedule,
+            outputs=[schedule_path(season)],
+        ),
+        # Os jogos e os lances da temporada saem do calendário (só os
+        # encerrados que ainda não foram gravados)
+        Stage(
+            "games",
+            crawl_games,
+            inputs=[schedule_path(season)],
+            outputs=[games_dir("team_games", season)],
+        ),
+        Stage(
+            "events",
+            crawl_events,
+            inputs=[schedule_path(season)],
+            outputs=[events_dir(season)],
+        ),
+        # A corrida, o calendário, os jogos e os lances não entram no
+        # snapshot, mas mudam a versão dos dados: o snapshot só é gerado
+        # depois deles, para não ficar desatualizado
+        Stage(
+            "snapshot",
+            snapshot.main,
+            inputs=sorted({*TEAMS_DIR.glob("nhl_standings_*.csv"), team_path(season)})
+            + sorted({*TEAMS_DIR.glob("nhl_ranks_*.parquet"), team_ranks_path(season)})
+            + [PLAYER_ALL_PATH, PLAYER_SEASONS_PATH, PLAYER_RANKS_PATH]
+            + [goalie_path(season)]
+            + [race_path(season), schedule_path(season)]
+            + [games_dir("team_games", season), events_dir(season)],
+            outputs=[snapshot.SNAPSHOT_META_PATH],
+        ),
+    ]
+
+
+def run_stage(stage):
+    """Executa um estágio e registra o resultado no manifesto."""
+
+    print(f"▶️  Estágio '{stage.name}' iniciado.")
+    inputs = stage.fingerprint()
+    started_at = datetime.now(timezone.utc)
+    start = time.perf_counter()
+
+    try:
+        stage.run()
+        status = "ok"
+    except Exception as e:
+        print(f"❌ Estágio '{stage.name}' falhou: {e}")
+        status = "failed"
+
+    duration = time.perf_counter() - start
+    record_stage(
+        stage.name,
+        {
+            "status": status,
+            "inputs": inputs,
+            "started_at": started_at.isoformat(timespec="seconds"),
+            "finished_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "duration_s": round(duration, 3),
+        },
+    )
+    print(f"⏹️  Estágio '{stage.name}' terminou ({status}, {duration:.1f}s).")
+    return {"status": status, "duration_s": duration}
+
+
+def run_dag(stages, force=False, max_workers=None):
+    """Executa os estágios respeitando as dependências.
+
+    Retorna um dicionário `nome -> {"status", "duration_s"}`, onde o status é
+    `ok`, `failed`, `skipped` (inputs inalterados) ou `blocked` (dependência
+    falhou).
+    """
+
+    upstream = {
+        stage.name: {
+            other.name
+            for other in stages
+            if other is not stage and stage.depends_on(other)
+        }
+        for stage in stages
+    }
+    states = load_manifest().get("stages", {})
+
+    pending = {stage.name: stage for stage in stages}
+    running = {}
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(stages)) as pool:
+        while pending or running:
+            changed = False
+
+            for name, stage in list(pending.items()):
+                deps = upstream[name]
+                if any(
+                    results.get(dep, {}).get("status") in ("failed", "blocked")
+                    for dep in deps
+                ):
+                    print(f"⛔ Estágio '{name}' bloqueado por falha em dependência.")
+                    results[name] = {"status": "blocked", "duration_s": 0.0}
+                elif not deps.issubset(results):
+                    continue
+                elif not force and stage.is_fresh(states.get(name)):
+                    print(f"⏭️  Estágio '{name}' pulado (inputs inalterados).")
+                    results[name] = {"status": "skipped", "duration_s": 0.0}
+                else:
+                    running[pool.submit(run_stage, stage)] = name
+
+                del pending[name]
+                changed = True
+
+            if changed:
+                continue
+
+            if not running:
+                raise RuntimeError(
+                    f"Dependências cíclicas entre os estágios: {sorted(pending)}"
+                )
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+
+    return results
+
+
+def main():
+    """Executa a extração completa a partir da linha de comando."""
+
+    parser = argparse.ArgumentParser(description="Orquestrador da extração da NHL")
+    parser.add_argument("--season", default=CURRENT_SEASON)
+    parser.add_argument("--only", nargs="+", help="Executa apenas estes estágios")
+    parser.add_argument(
+        "--force", action="store_true", help="Não pula estágios inalterados"
+    )
+    args = parser.parse_args()
+
+    stages = build_stages(args.season)
+    if args.only:
+        stages = [stage for stage in stages if stage.name in args.only]
+
+    start = time.perf_counter()
+    results = run_dag(stages, force=args.force)
+    elapsed = time.perf_counter() - start
+
+    print("\n" + "=" * 50)
+    print("📊 Resumo da extração")
+    print("=" * 50)
+    for name, result in results.items():
+        print(f"{name:<10} {result['status']:<8} {result['duration_s']:>8.1f}s")
+    total = sum(result["duration_s"] for result in results.values())
+    print(f"\n⏱️  Tempo total: {elapsed:.1f}s (soma dos estágios: {total:.1f}s)")
+    for host, limiter in limiters().items():
+        print(f"🚦 {host}: {limiter.summary()}")
+
+    if any(result["status"] in ("failed", "blocked") for result in results.values()):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Estágios de streaming para a extração: fetch → parse → sink.
+
+Os estágios são geradores ligados por filas limitadas. O fetch roda em várias
+threads (I/O), o parse roda em uma thread própria e o sink consome o fluxo na
+thread principal. Quando o sink fica para trás as filas enchem e os estágios
+anteriores param de buscar dados (backpressure), então a memória usada é
+constante, independente do número de IDs.
+
+Exemplo:
+    fetched = parallel_map(fetch, ids, workers=4)
+    records = threaded(parse(fetched))
+    save_records(records, filepath)
+"""
+
+import queue
+import threading
+
+_DONE = object()
+_END = object()
+_ERROR = object()
+
+
+class _Failure:
+    def __init__(self, exc):
+        self.exc = exc
+
+
+def parallel_map(func, items, workers=4, maxsize=32):
+    """Aplica `func` aos itens em paralelo, gerando `(item, resultado)`.
+
+    Os resultados saem na mesma ordem dos itens, para que as saídas sejam
+    determinísticas. No máximo `maxsize` itens ficam em voo (sendo buscados
+    ou aguardando consumo); exceções de `func` são repassadas ao consumidor.
+    """
+
+    todo = queue.Queue()
+    done = queue.Queue()
+    slots = threading.BoundedSemaphore(maxsize)
+    stop = threading.Event()
+
+    def feeder():
+        count = 0
+        try:
+            for item in items:
+                while not slots.acquire(timeout=0.1):
+                    if stop.is_set():
+                        return
+                if stop.is_set():
+                    return
+                todo.put((count, item))
+                count += 1
+            done.put((_END, count, None))
+        except BaseException as e:
+            done.put((_ERROR, None, _Failure(e)))
+        finally:
+            for _ in range(workers):
+                todo.put(_DONE)
+
+    def worker():
+        while True:
+            task = todo.get()
+            if task is _DONE:
+                return
+
+            seq, item = task
+            if stop.is_set():
+                continue
+
+            try:
+                result = func(item)
+            except BaseException as e:
+                result = _Failure(e)
+            done.put((seq, item, result))
+
+    threads = [threading.Thread(target=feeder, daemon=True)] + [
+        threading.Thread(target=worker, daemon=True) for _ in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+
+    buffer = {}
+    next_seq = 0
+    total = None
+    try:
+        while total is None or next_seq < total:
+            if next_seq in buffer:
+                item, result = buffer.pop(next_seq)
+            else:
+                seq, item, result = done.get()
+                if seq is _END:
+                    total = item
+                    continue
+                if seq is _ERROR:
+                    raise result.exc
+                if seq != next_seq:
+                    buffer[seq] = (item, result)
+                    continue
+
+            next_seq += 1
+            slots.release()
+
+            if isinstance(result, _Failure):
+                raise result.exc
+            yield item, result
+    finally:
+        stop.set()
+
+
+def threaded(iterable, maxsize=64):
+    """Consome `iterable` em uma thread própria através de uma fila limitada.
+
+    Permite que um estágio (ex.: parse/validação) rode em paralelo com o
+    estágio seguinte (ex.: escrita).
+    """
+
+    buffer = queue.Queue(maxsize)
+    stop = threading.Event()
+
+    def producer():
+        try:
+            for value in iterable:
+                while not stop.is_set():
+                    try:
+                        buffer.put(value, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if stop.is_set():
+                    return
+            buffer.put(_END)
+        except BaseException as e:
+            buffer.put(_Failure(e))
+
+    thread = threading.Thread(target=producer, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            value = buffer.get()
+            if value is _END:
+                return
+            if isinstance(value, _Failure):
+                raise value.exc
+            yield value
+    finally:
+        stop.set()
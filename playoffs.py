@@ -0,0 +1,329 @@
+"""
+Chances de playoff por simulação de Monte Carlo (vetorizada em NumPy).
+
+Parte da classificação atual (`nhl_standings_{temporada}.csv`) e dos jogos
+restantes do calendário (`schedule.py`). A força de cada time vem da
+expectativa pitagórica de gols pró/contra (com um prior de alguns jogos na
+média da liga, para o início da temporada não exagerar), e cada jogo é
+decidido pelo log5 das forças dos dois times mais a vantagem de jogar em
+casa. Uma fração dos jogos vai para a prorrogação (o perdedor leva 1 ponto).
+
+Todas as temporadas de um bloco são simuladas de uma vez, sem laço por jogo:
+os resultados são uma matriz simulações × jogos e as vitórias de cada time
+saem de um único produto com a matriz de incidência jogo × time. O ponto da
+prorrogação só depende do perdedor, então é sorteado por time (binomial sobre
+as derrotas). Sem calendário, os jogos restantes de cada time são sorteados
+por binomial contra um adversário médio.
+
+Classificação para os playoffs (formato atual): os 3 primeiros de cada
+divisão e mais 2 wild cards por conferência. Os critérios de desempate são
+pontos e vitórias (empates restantes sorteados).
+
+Uso:
+    python playoffs.py [--season 20252026] [--simulations 100000]
+"""
+
+import argparse
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from metrics import PYTHAGOREAN_EXPONENT
+
+DEFAULT_SIMULATIONS = 100_000
+
+# Células (simulações × jogos) por bloco: limita a memória da simulação
+CHUNK_CELLS = 4_000_000
+
+# Jogos por time na temporada regular (sem calendário)
+SEASON_GAMES = 82
+
+# Vantagem de jogar em casa (na probabilidade de vitória do mandante)
+HOME_ADVANTAGE = 0.04
+
+# Fração dos jogos decididos na prorrogação/shootout
+OVERTIME_RATE = 0.23
+
+# Jogos "fictícios" na média da liga somados aos gols de cada time
+PRIOR_GAMES = 10
+
+DIVISION_CONFERENCE = {
+    "Atlantic": "Eastern",
+    "Metropolitan": "Eastern",
+    "Central": "Western",
+    "Pacific": "Western",
+}
+DIVISION_SPOTS = 3
+WILD_CARDS = 2
+
+# Colunas da classificação usadas na simulação (o layout antigo, de 4
+# colunas, do `extract.py` não tem a divisão nem os gols)
+REQUIRED_COLUMNS = [
+    "team_logo",
+    "team_name",
+    "divisionName",
+    "gamesPlayed",
+    "wins",
+    "team_points",
+    "goalFor",
+    "goalAgainst",
+]
+
+LOGO_ABBREV = re.compile(r"/([A-Z0-9]+)_(?:light|dark)\.svg")
+
+
+def team_abbrev(logo):
+    """Sigla do time a partir da URL do logo (a classificação não tem a sigla)."""
+
+    match = LOGO_ABBREV.search(str(logo))
+    return match.group(1) if match else None
+
+
+def team_strength(goals_for, goals_against, games):
+    """Expectativa pitagórica de cada time, com prior na média da liga."""
+
+    goals_for = np.asarray(goals_for, dtype=float)
+    goals_against = np.asarray(goals_against, dtype=float)
+    games = np.asarray(games, dtype=float)
+
+    average = goals_for.sum() / max(games.sum(), 1)
+    goals_for = goals_for + PRIOR_GAMES * average
+    goals_against = goals_against + PRIOR_GAMES * average
+    scored = goals_for**PYTHAGOREAN_EXPONENT
+    return scored / (scored + goals_against**PYTHAGOREAN_EXPONENT)
+
+
+def win_probability(home, away):
+    """Probabilidade de vitória do mandante (log5 + vantagem de casa)."""
+
+    p = (home - home * away) / (home + away - 2 * home * away)
+    return np.clip(p + HOME_ADVANTAGE, 0.05, 0.95)
+
+
+class PlayoffSimulator:
+    """Simula o restante da temporada a partir da classificação atual.
+
+    `teams` é a classificação de uma temporada (colunas do
+    `nhl_standings_{temporada}.csv`) e `games` os jogos restantes, com as
+    siglas de mandante e visitante (`homeTeam`, `awayTeam`); sem `games`, os
+    jogos restantes de cada time vêm de `SEASON_GAMES - gamesPlayed`.
+    Classificações sem as colunas de `REQUIRED_COLUMNS` levantam `ValueError`.
+    """
+
+    def __init__(self, teams, games=None):
+        missing = [column for column in REQUIRED_COLUMNS if column not in teams]
+        if missing:
+            raise ValueError(f"Classificação sem as colunas: {missing}")
+
+        teams = teams.reset_index(drop=True)
+        self.abbrevs = teams["team_logo"].map(team_abbrev).fillna(teams["team_name"])
+        self.names = teams["team_name"].to_numpy()
+        self.divisions = teams["divisionName"].to_numpy()
+
+        unknown = sorted(set(self.divisions) - set(DIVISION_CONFERENCE))
+        if unknown:
+            raise ValueError(f"Divisões sem conferência conhecida: {unknown}")
+        self.conferences = np.array([DIVISION_CONFERENCE[d] for d in self.divisions])
+
+        self.points = teams["team_points"].fillna(0).to_numpy(dtype=np.int32)
+        self.wins = teams["wins"].fillna(0).to_numpy(dtype=np.int32)
+        self.played = teams["gamesPlayed"].fillna(0).to_numpy(dtype=np.int32)
+        self.strength = team_strength(
+            teams["goalFor"].fillna(0), teams["goalAgainst"].fillna(0), self.played
+        )
+
+        count = len(teams)
+        if games is not None:
+            index = pd.Series(np.arange(count), index=self.abbrevs.to_numpy())
+            home = games["homeTeam"].map(index)
+            away = games["awayTeam"].map(index)
+            known = home.notna() & away.notna()
+            home = home[known].to_numpy(dtype=np.intp)
+            away = away[known].to_numpy(dtype=np.intp)
+
+            self.home_win = win_probability(
+                self.strength[home], self.strength[away]
+            ).astype(np.float32)
+            # Incidência jogo × time: +1 no mandante, -1 no visitante. As
+            # vitórias de cada time são `vitórias do mandante @ incidência`
+            # mais os jogos como visitante
+            self.incidence = np.zeros((len(home), count), dtype=np.float32)
+            self.incidence[np.arange(len(home)), home] = 1
+            self.incidence[np.arange(len(away)), away] = -1
+            self.away_games = np.bincount(away, minlength=count).astype(np.int32)
+            self.remaining = (
+                np.bincount(home, minlength=count).astype(np.int32) + self.away_games
+            )
+        else:
+            self.home_win = None
+            self.remaining = np.maximum(SEASON_GAMES - self.played, 0)
+
+        # Índices dos times de cada divisão e conferência
+        self.division_teams = {
+            division: np.flatnonzero(self.divisions == division)
+            for division in sorted(set(self.divisions))
+        }
+        self.conference_teams = {
+            conference: np.flatnonzero(self.conferences == conference)
+            for conference in sorted(set(self.conferences))
+        }
+
+    def _simulate_schedule(self, rng, size):
+        """Vitórias nos jogos restantes (`size` × times) jogando o calendário."""
+
+        home_won = rng.random((size, len(self.home_win)), dtype=np.float32)
+        home_won = (home_won < self.home_win).astype(np.float32)
+        wins = home_won @ self.incidence
+        return wins.astype(np.int32) + self.away_games
+
+    def _simulate_binomial(self, rng, size):
+        """Vitórias nos jogos restantes (`size` × times) sem calendário."""
+
+        remaining = np.broadcast_to(self.remaining, (size, len(self.remaining)))
+        return rng.binomial(remaining, self.strength)
+
+    def _rank(self, rng, points, wins):
+        """Classificados, campeões de divisão e melhor campanha de um bloco."""
+
+        size, count = points.shape
+        # Pontos, depois vitórias; o ruído desempata o resto ao acaso
+        score = points + wins * 1e-3 + rng.random((size, count)) * 1e-6
+        rows = np.arange(size)[:, None]
+
+        playoff = np.zeros((size, count), dtype=bool)
+        division_winner = np.zeros((size, count), dtype=bool)
+        for teams in self.division_teams.values():
+            order = teams[np.argsort(-score[:, teams], axis=1)]
+            playoff[rows, order[:, :DIVISION_SPOTS]] = True
+            division_winner[rows, order[:, :1]] = True
+
+        for teams in self.conference_teams.values():
+            wild = np.where(playoff[:, teams], -np.inf, score[:, teams])
+            order = teams[np.argsort(-wild, axis=1)]
+            playoff[rows, order[:, :WILD_CARDS]] = True
+
+        presidents = np.zeros((size, count), dtype=bool)
+        presidents[np.arange(size), score.argmax(axis=1)] = True
+        return playoff, division_winner, presidents
+
+    def run(self, simulations=DEFAULT_SIMULATIONS, seed=0):
+        """Roda as simulações; retorna um DataFrame com as probabilidades."""
+
+        rng = np.random.default_rng(seed)
+        count = len(self.names)
+        # Sem calendário, o bloco é dimensionado pelos jogos restantes da liga
+        games = (
+            len(self.home_win)
+            if self.home_win is not None
+            else max(int(self.remaining.sum()) // 2, count)
+        )
+        chunk = max(1, min(simulations, CHUNK_CELLS // max(games, 1)))
+
+        totals = {
+            name: np.zeros(count)
+            for name in ("points", "playoff", "division", "presidents")
+        }
+        done = 0
+        while done < simulations:
+            size = min(chunk, simulations - done)
+            if self.home_win is not None:
+                wins = self._simulate_schedule(rng, size)
+            else:
+                wins = self._simulate_binomial(rng, size)
+            # Cada derrota vai para a prorrogação de forma independente (só o
+            # perdedor ganha o ponto extra): basta uma binomial por time
+            overtime = rng.binomial(self.remaining - wins, OVERTIME_RATE)
+            points = self.points + 2 * wins + overtime
+            wins = self.wins + wins
+            playoff, division, presidents = self._rank(rng, points, wins)
+
+            totals["points"] += points.sum(axis=0)
+            totals["playoff"] += playoff.sum(axis=0)
+            totals["division"] += division.sum(axis=0)
+            totals["presidents"] += presidents.sum(axis=0)
+            done += size
+
+        odds = pd.DataFrame(
+            {
+                "team": self.abbrevs.to_numpy(),
+                "team_name": self.names,
+                "divisionName": self.divisions,
+                "conference": self.conferences,
+                "team_points": self.points,
+                "gamesPlayed": self.played,
+                "remaining": self.remaining,
+                "strength": self.strength,
+                "projectedPoints": totals["points"] / simulations,
+                "playoffProb": totals["playoff"] / simulations,
+                "divisionProb": totals["division"] / simulations,
+                "presidentsProb": totals["presidents"] / simulations,
+            }
+        )
+        return odds.sort_values(
+            ["conference", "playoffProb", "projectedPoints"],
+            ascending=[True, False, False],
+            ignore_index=True,
+        )
+
+
+def remaining_games(schedule):
+    """Jogos ainda não disputados de um calendário (`schedule.py`)."""
+    from schedule import FINAL_STATES
+
+    return schedule[~schedule["gameState"].isin(FINAL_STATES)]
+
+
+def playoff_odds(season, simulations=DEFAULT_SIMULATIONS, seed=0):
+    """Chances de playoff de uma temporada a partir dos arquivos gravados.
+
+    Retorna `None` se a classificação da temporada não existir.
+    """
+    from config import schedule_path, team_path
+
+    teams_file = team_path(season)
+    if not teams_file.exists():
+        return None
+
+    schedule_file = schedule_path(season)
+    games = (
+        remaining_games(pd.read_csv(schedule_file, sep=";"))
+        if schedule_file.exists()
+        else None
+    )
+    teams = pd.read_csv(teams_file, sep=";")
+    return PlayoffSimulator(teams, games).run(simulations, seed)
+
+
+def main():
+    from config import CURRENT_SEASON
+
+    parser = argparse.ArgumentParser(description="Chances de playoff")
+    parser.add_argument("--season", default=CURRENT_SEASON)
+    parser.add_argument("--simulations", type=int, default=DEFAULT_SIMULATIONS)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    odds = playoff_odds(args.season, args.simulations, args.seed)
+    elapsed = time.perf_counter() - start
+    if odds is None:
+        print(f"❌ Classificação de {args.season} não encontrada")
+        return
+
+    columns = ["team_name", "team_points", "remaining", "projectedPoints"]
+    probabilities = ["playoffProb", "divisionProb", "presidentsProb"]
+    for conference, group in odds.groupby("conference"):
+        print(f"\n🏒 {conference}")
+        print(
+            group[columns + probabilities]
+            .assign(**{column: group[column] * 100 for column in probabilities})
+            .round(1)
+            .to_string(index=False)
+        )
+    print(f"\n⏱️ {args.simulations} simulações em {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
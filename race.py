@@ -0,0 +1,348 @@
+"""
+Corrida por pontos: a classificação dia a dia de uma temporada.
+
+O crawler busca `/standings/{data}` para cada dia da temporada (em paralelo,
+pelo limitador adaptativo do host) e guarda o resultado de forma compacta,
+como matrizes time × data: `data/race/nhl_race_{temporada}.parquet` tem uma
+linha por time e, para cada estatística, uma lista de tamanho fixo (um valor
+por data), além da posição do time na liga em cada dia, já calculada. As
+datas ficam nos metadados do arquivo.
+
+Temporadas encerradas já completas são puladas; na temporada em andamento,
+só os dias novos (e o último gravado) são buscados de novo.
+
+`RaceFrames` transforma as matrizes nos arrays de cada quadro da animação
+(times na ordem da posição, pontos, jogos e rótulos), uma única vez; o
+gráfico é montado direto desses arrays, sem remodelar DataFrames por quadro.
+
+Uso:
+    python race.py [--from 20232024] [--to 20252026] [--force]
+"""
+
+import argparse
+import json
+import sys
+from datetime import date as Date
+from datetime import timedelta
+
+import numpy as np
+
+from archive import RawArchive
+from backfill import season_windows
+from config import race_path
+from extract_team import SimpleNHLExtractor
+from pipeline import parallel_map
+from storage import ParquetRecordWriter, commit_writer
+
+# Estatísticas guardadas por time e data (matrizes time × data)
+RACE_STATS = ["points", "gamesPlayed", "wins"]
+
+
+def season_days(start, end):
+    """Datas (AAAA-MM-DD) de `start` a `end`, inclusive."""
+
+    first, last = Date.fromisoformat(start), Date.fromisoformat(end)
+    return [
+        (first + timedelta(days=offset)).isoformat()
+        for offset in range((last - first).days + 1)
+    ]
+
+
+def race_schema(days):
+    """Schema do arquivo de uma temporada (`days` vai para os metadados)."""
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("team", pa.string()),
+            ("name", pa.string()),
+            ("logo", pa.string()),
+            *[(stat, pa.list_(pa.int16(), len(days))) for stat in RACE_STATS],
+            ("rank", pa.list_(pa.int8(), len(days))),
+        ],
+        metadata={"dates": json.dumps(days)},
+    )
+
+
+def day_records(data, season):
+    """Times de uma resposta de `/standings/{data}`.
+
+    Retorna `sigla → (nome, logo, pontos, jogos, vitórias)`, ou `None` se a
+    resposta estiver vazia ou for de outra temporada.
+    """
+
+    standings = (data or {}).get("standings", [])
+    if not standings or str(standings[0].get("seasonId")) != season:
+        return None
+
+    records = {}
+    for team in standings:
+        name = (team.get("teamName") or {}).get("default")
+        abbrev = (team.get("teamAbbrev") or {}).get("default") or name
+        records[abbrev] = (
+            name,
+            team.get("teamLogo"),
+            *(team.get(stat) or 0 for stat in RACE_STATS),
+        )
+    return records
+
+
+def rank_matrix(stats):
+    """Posição (0 = líder) de cada time em cada data.
+
+    Critérios: mais pontos, menos jogos, mais vitórias (empates restantes pela
+    ordem das siglas).
+    """
+
+    order = np.lexsort((-stats["wins"], stats["gamesPlayed"], -stats["points"]), axis=0)
+    rank = np.empty(order.shape, dtype=np.int8)
+    np.put_along_axis(rank, order, np.arange(order.shape[0])[:, None], axis=0)
+    return rank
+
+
+class RaceMatrices:
+    """Matrizes time × data (estatísticas e posição) de uma temporada."""
+
+    def __init__(self, days, teams, names, logos, stats, rank=None):
+        self.days = days
+        self.teams = teams
+        self.names = names
+        self.logos = logos
+        self.stats = stats
+        self.rank = rank_matrix(stats) if rank is None else rank
+
+    @classmethod
+    def from_days(cls, days, records):
+        """Monta as matrizes a partir dos registros de cada dia (`day_records`).
+
+        Um time ausente em algum dia repete os valores do dia anterior.
+        """
+
+        info = {}
+        for day in records:
+            for abbrev, values in day.items():
+                info[abbrev] = values[:2]
+        teams = sorted(info)
+        row = {abbrev: index for index, abbrev in enumerate(teams)}
+
+        shape = (len(teams), len(days))
+        stats = {stat: np.zeros(shape, dtype=np.int16) for stat in RACE_STATS}
+        seen = np.zeros(shape, dtype=bool)
+        for column, day in enumerate(records):
+            for abbrev, values in day.items():
+                seen[row[abbrev], column] = True
+                for stat, value in zip(RACE_STATS, values[2:]):
+                    stats[stat][row[abbrev], column] = value
+
+        # Índice do último dia com dados de cada time (preenchimento adiante)
+        last_seen = np.maximum.accumulate(
+            np.where(seen, np.arange(len(days)), 0), axis=1
+        )
+        stats = {
+            stat: np.take_along_axis(matrix, last_seen, axis=1)
+            for stat, matrix in stats.items()
+        }
+
+        return cls(
+            days,
+            teams,
+            [info[abbrev][0] for abbrev in teams],
+            [info[abbrev][1] for abbrev in teams],
+            stats,
+        )
+
+    @classmethod
+    def from_table(cls, table):
+        """Lê as matrizes de uma `pyarrow.Table` (sem cópia dos valores)."""
+
+        days = json.loads(table.schema.metadata[b"dates"])
+
+        def matrix(column):
+            values = table[column].combine_chunks().flatten().to_numpy()
+            return values.reshape(table.num_rows, len(days))
+
+        return cls(
+            days,
+            table["team"].to_pylist(),
+            table["name"].to_pylist(),
+            table["logo"].to_pylist(),
+            {stat: matrix(stat) for stat in RACE_STATS},
+            matrix("rank"),
+        )
+
+    def to_table(self):
+        import pyarrow as pa
+
+        def matrix(values, kind):
+            return pa.FixedSizeListArray.from_arrays(
+                pa.array(values.ravel(), kind), len(self.days)
+            )
+
+        return pa.table(
+            {
+                "team": self.teams,
+                "name": self.names,
+                "logo": self.logos,
+                **{stat: matrix(self.stats[stat], pa.int16()) for stat in RACE_STATS},
+                "rank": matrix(self.rank, pa.int8()),
+            },
+            schema=race_schema(self.days),
+        )
+
+    def day_records(self):
+        """Registros de cada dia (mesmo formato de `day_records`)."""
+
+        return {
+            day: {
+                abbrev: (
+                    self.names[row],
+                    self.logos[row],
+                    *(int(self.stats[stat][row, column]) for stat in RACE_STATS),
+                )
+                for row, abbrev in enumerate(self.teams)
+            }
+            for column, day in enumerate(self.days)
+        }
+
+
+def read_race(filepath):
+    """Lê a classificação dia a dia de um arquivo (`None` se não existir)."""
+    import pyarrow.parquet as pq
+
+    if not filepath.exists():
+        return None
+    return RaceMatrices.from_table(pq.read_table(filepath))
+
+
+def write_race(filepath, race):
+    """Publica as matrizes de uma temporada (só se o conteúdo mudou)."""
+
+    with ParquetRecordWriter(filepath, race_schema(race.days)) as writer:
+        writer.write_table(race.to_table())
+        return commit_writer(writer)
+
+
+class RaceFrames:
+    """Arrays de cada quadro da animação, preparados uma única vez.
+
+    Para cada quadro (data), os times na ordem da posição: `order`
+    [quadros × times] tem os índices dos times e `points`, `games` e `labels`
+    seguem a mesma ordem. `step` usa uma data a cada `step` dias (a última
+    data sempre entra).
+    """
+
+    def __init__(self, race, step=1):
+        columns = list(range(0, len(race.days), step))
+        if columns[-1] != len(race.days) - 1:
+            columns.append(len(race.days) - 1)
+
+        self.dates = [race.days[column] for column in columns]
+        self.teams = race.teams
+        self.order = np.argsort(race.rank[:, columns], axis=0, kind="stable").T
+        self.points = np.take_along_axis(
+            race.stats["points"][:, columns].T, self.order, axis=1
+        )
+        self.games = np.take_along_axis(
+            race.stats["gamesPlayed"][:, columns].T, self.order, axis=1
+        )
+        self.labels = np.asarray(race.names, dtype=object)[self.order]
+        self.max_points = int(race.stats["points"].max(initial=0))
+
+
+def crawl_season(extractor, season, start, end, archive=None, force=False):
+    """Busca (ou completa) a classificação dia a dia de uma temporada.
+
+    Retorna `True` se todos os dias foram obtidos e o arquivo foi gravado.
+    """
+
+    days = season_days(start, end)
+    filepath = race_path(season)
+
+    known = {}
+    stored = None if force else read_race(filepath)
+    if stored is not None and stored.days[0] == start:
+        # Mantém os dias gravados; o último é buscado de novo (pode ter sido
+        # gravado antes de os jogos do dia terminarem)
+        known = stored.day_records()
+        known.pop(stored.days[-1])
+
+    pending = [day for day in days if day not in known]
+    failed = []
+    for day, data in parallel_map(
+        extractor.fetch_season_data, pending, workers=extractor.limiter.max_limit
+    ):
+        # Endpoint próprio: o `reprocess.py teams` só relê as classificações
+        # dos extratores de times, não as ~190 diárias de cada temporada
+        if archive is not None:
+            archive.append("standings_daily", day, data)
+        records = day_records(data, season)
+        if records is None:
+            failed.append(day)
+        else:
+            known[day] = records
+
+    if failed:
+        print(f"❌ {season}: {len(failed)} datas sem classificação (ex.: {failed[0]})")
+        return False
+
+    race = RaceMatrices.from_days(days, [known[day] for day in days])
+    changed, teams = write_race(filepath, race)
+    print(
+        f"{'✔️' if changed else '⏭️ '} {season}: {teams} times × {len(days)} datas "
+        f"({len(pending)} buscadas)"
+    )
+    return True
+
+
+def crawl(first=None, last=None, force=False):
+    """Busca a classificação dia a dia das temporadas entre `first` e `last`.
+
+    Sem `first` e `last`, só a temporada mais recente. Retorna o número de temporadas
+    que falharam.
+    """
+
+    extractor = SimpleNHLExtractor()
+    today = Date.today().isoformat()
+    windows = season_windows(extractor, today)
+
+    seasons = sorted(windows)
+    if first is None and last is None:
+        seasons = seasons[-1:]
+    seasons = [
+        season
+        for season in seasons
+        if (first is None or season >= str(first))
+        and (last is None or season <= str(last))
+    ]
+
+    failed = 0
+    with RawArchive() as archive:
+        for season in seasons:
+            start, end = windows[season]
+            stored = None if force else read_race(race_path(season))
+            if (
+                stored is not None
+                and end < today
+                and stored.days == season_days(start, end)
+            ):
+                print(f"⏭️  {season}: completa")
+                continue
+            if not crawl_season(extractor, season, start, end, archive, force):
+                failed += 1
+
+    print(f"🚦 API: {extractor.limiter.summary()}")
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Classificação dia a dia")
+    parser.add_argument("--from", dest="first", help="primeira temporada (AAAAAAAA)")
+    parser.add_argument("--to", dest="last", help="última temporada (AAAAAAAA)")
+    parser.add_argument("--force", action="store_true", help="busca todos os dias")
+    args = parser.parse_args()
+
+    sys.exit(1 if crawl(args.first, args.last, args.force) else 0)
+
+
+if __name__ == "__main__":
+    main()
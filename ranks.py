@@ -0,0 +1,218 @@
+"""
+Posições e percentis por temporada, materializados na extração.
+
+Para cada estatística numérica, a posição (1 = melhor, empates com a mesma
+posição) e o percentil (100 = melhor, 0 = pior) de cada linha:
+
+- jogadores: na temporada (`{stat}Rank`, `{stat}Pctl`) e entre os jogadores
+  da mesma posição (`{stat}PositionRank`, `{stat}PositionPctl`);
+- times: na temporada (liga) e na divisão (`{stat}DivisionRank`, ...).
+
+Todas as estatísticas de um agrupamento são calculadas de uma vez, sobre a
+matriz linhas × estatísticas: uma ordenação por coluna (valor e depois
+grupo, ambas estáveis) e acumulados para empates e inícios de grupo, sem
+laço por grupo nem por linha.
+
+Os resultados ficam ao lado dos dados, em Parquet, na mesma ordem das linhas
+(`nhl_player_ranks.parquet` e `nhl_ranks_{temporada}.parquet`), e o app só
+lê as colunas.
+
+Uso:
+    python ranks.py             # recalcula tudo a partir dos arquivos atuais
+"""
+
+from config import (
+    PLAYER_ALL_PATH,
+    PLAYER_RANKS_PATH,
+    TEAMS_DIR,
+    team_path,
+    team_ranks_path,
+)
+from storage import ParquetRecordWriter, commit_writer
+
+# Colunas numéricas que não são estatísticas
+NON_STAT_COLUMNS = {"playerId", "season", "sweaterNumber"}
+
+# Estatísticas em que menos é melhor
+LOWER_IS_BETTER = {
+    "losses",
+    "otLosses",
+    "goalAgainst",
+    "homeLosses",
+    "homeOtLosses",
+    "homeGoalsAgainst",
+    "roadLosses",
+    "roadOtLosses",
+    "roadGoalsAgainst",
+}
+
+
+def group_ranks(values, groups, lower_is_better):
+    """Posição e percentil de cada linha dentro do seu grupo, por coluna.
+
+    `values` é uma matriz linhas × estatísticas (NaN = sem valor), `groups`
+    o código do grupo de cada linha e `lower_is_better` uma máscara por
+    coluna. Retorna `(rank, percentile)` com o mesmo formato de `values`
+    (NaN onde não há valor).
+    """
+    import numpy as np
+
+    rows, columns = values.shape
+    missing = np.isnan(values)
+    # Ordem crescente = do melhor para o pior; sem valor vai para o fim
+    keys = np.where(lower_is_better, values, -values)
+    keys = np.where(missing, np.inf, keys)
+
+    # Por valor e depois (estável) por grupo: cada grupo fica contíguo e
+    # ordenado do melhor para o pior
+    order = np.argsort(keys, axis=0, kind="stable")
+    order = np.take_along_axis(
+        order, np.argsort(groups[order], axis=0, kind="stable"), axis=0
+    )
+    sorted_groups = groups[order]
+    sorted_keys = np.take_along_axis(keys, order, axis=0)
+
+    position = np.broadcast_to(np.arange(rows)[:, None], (rows, columns))
+    group_start = np.ones((rows, columns), dtype=bool)
+    group_start[1:] = sorted_groups[1:] != sorted_groups[:-1]
+    value_start = group_start.copy()
+    value_start[1:] |= sorted_keys[1:] != sorted_keys[:-1]
+
+    # Empates recebem a posição do primeiro (competição: 1, 2, 2, 4)
+    first_of_group = np.maximum.accumulate(np.where(group_start, position, 0), axis=0)
+    first_of_value = np.maximum.accumulate(np.where(value_start, position, 0), axis=0)
+    sorted_rank = (first_of_value - first_of_group + 1).astype(np.float64)
+
+    rank = np.empty((rows, columns))
+    np.put_along_axis(rank, order, sorted_rank, axis=0)
+
+    # Linhas com valor em cada grupo (por estatística)
+    counts = np.zeros((groups.max() + 1 if rows else 0, columns))
+    np.add.at(counts, groups, ~missing)
+    size = counts[groups]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percentile = np.where(size > 1, 100 * (size - rank) / (size - 1), 100.0)
+
+    rank[missing] = np.nan
+    percentile[missing] = np.nan
+    return rank, percentile
+
+
+def stat_columns(table):
+    """Colunas numéricas de uma tabela Arrow que são estatísticas."""
+    import pyarrow as pa
+
+    return [
+        field.name
+        for field in table.schema
+        if field.name not in NON_STAT_COLUMNS
+        and (pa.types.is_integer(field.type) or pa.types.is_floating(field.type))
+    ]
+
+
+def rank_table(table, keys, groupings):
+    """Tabela de posições e percentis de `table` (mesma ordem das linhas).
+
+    `keys` são as colunas copiadas para identificar as linhas e `groupings`
+    mapeia o sufixo das colunas para as colunas que formam o grupo (sempre
+    por temporada; sufixo vazio = liga inteira).
+    """
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    stats = stat_columns(table)
+    values = np.column_stack(
+        [table[stat].cast(pa.float64()).fill_null(np.nan).to_numpy() for stat in stats]
+    )
+    lower_is_better = np.array([stat in LOWER_IS_BETTER for stat in stats])
+
+    columns = {key: table[key] for key in keys}
+    for suffix, group_columns in groupings.items():
+        labels = pc.binary_join_element_wise(
+            *[
+                table[column].cast(pa.string()).fill_null("")
+                for column in group_columns
+            ],
+            "|",
+        )
+        _, groups = np.unique(
+            labels.to_numpy(zero_copy_only=False), return_inverse=True
+        )
+        rank, percentile = group_ranks(values, groups, lower_is_better)
+        for column, stat in enumerate(stats):
+            columns[f"{stat}{suffix}Rank"] = pa.array(
+                rank[:, column], pa.float64(), from_pandas=True
+            ).cast(pa.int32())
+            columns[f"{stat}{suffix}Pctl"] = pa.array(
+                percentile[:, column].round(1), pa.float32(), from_pandas=True
+            )
+    return pa.table(columns)
+
+
+def read_csv(filepath):
+    """Lê um CSV (sep=';') da extração como tabela Arrow."""
+    import pyarrow.csv as pv
+
+    return pv.read_csv(filepath, parse_options=pv.ParseOptions(delimiter=";"))
+
+
+def write_ranks(table, filepath):
+    """Publica a tabela de posições (só se o conteúdo mudou)."""
+
+    with ParquetRecordWriter(filepath, table.schema) as writer:
+        writer.write_table(table)
+        return commit_writer(writer)
+
+
+def rank_players(filepath=PLAYER_ALL_PATH, ranks_filepath=PLAYER_RANKS_PATH):
+    """Posições dos jogadores por temporada e por posição (C, L, R, D)."""
+
+    if not filepath.exists():
+        return 0
+
+    table = rank_table(
+        read_csv(filepath),
+        ["playerId", "season", "position"],
+        {"": ["season"], "Position": ["season", "position"]},
+    )
+    changed, rows = write_ranks(table, ranks_filepath)
+    print(f"{'🏅' if changed else '⏭️ '} {ranks_filepath}: {rows} jogadores")
+    return rows
+
+
+def rank_teams(season):
+    """Posições dos times de uma temporada na liga e na divisão.
+
+    Classificações sem a divisão (o layout antigo, de 4 colunas, do
+    `extract.py`) recebem só as posições na liga.
+    """
+    import pyarrow as pa
+
+    filepath = team_path(season)
+    if not filepath.exists():
+        return 0
+
+    teams = read_csv(filepath)
+    teams = teams.append_column(
+        "season", pa.array([str(season)] * teams.num_rows, pa.string())
+    )
+    groupings = {"": ["season"]}
+    if "divisionName" in teams.column_names:
+        groupings["Division"] = ["season", "divisionName"]
+    else:
+        print(f"⚠️ {filepath}: sem a coluna divisionName, só posições na liga")
+    table = rank_table(teams, ["season", "team_name"], groupings)
+    changed, rows = write_ranks(table, team_ranks_path(season))
+    print(f"{'🏅' if changed else '⏭️ '} {team_ranks_path(season)}: {rows} times")
+    return rows
+
+
+def main():
+    rank_players()
+    for filepath in sorted(TEAMS_DIR.glob("nhl_standings_*.csv")):
+        rank_teams(filepath.stem.removeprefix("nhl_standings_"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Construtor colunar de registros.
+
+Em vez de um dicionário por linha (que o pandas depois precisa percorrer para
+inferir colunas e tipos), cada campo é acumulado em um array tipado
+(`array.array`), junto com as posições dos valores ausentes. Os buffers são entregues ao
+Arrow (`to_arrow`) ou ao pandas (`to_pandas`) sem cópia.
+
+Tipos aceitos: int8, int16, int32, int64, double (float64), bool e string.
+Um valor que não cabe no tipo da coluna (texto, float em coluna inteira ou
+fora do intervalo) levanta `ValueError` com o nome da coluna, e o registro é
+descartado por inteiro.
+
+Como os DataFrames/tabelas entregues compartilham a memória dos arrays, o
+construtor não aceita novos registros depois de `to_arrow`/`to_pandas` até
+que `clear()` seja chamado: `append` levanta `RuntimeError` antes de tocar em
+qualquer coluna.
+"""
+
+import array
+
+TYPECODES = {
+    "int8": "b",
+    "int16": "h",
+    "int32": "i",
+    "int64": "q",
+    "double": "d",
+    "float64": "d",
+    "bool": "b",
+}
+
+
+def fields_from_schema(schema):
+    """Converte um `pyarrow.Schema` em uma lista `(nome, tipo)`."""
+    return [(field.name, str(field.type)) for field in schema]
+
+
+class ColumnBuilder:
+    def __init__(self, fields):
+        self.fields = [(name, kind) for name, kind in fields]
+        self.clear()
+
+    def clear(self):
+        """Descarta os registros acumulados."""
+        self.values = {
+            name: array.array(TYPECODES[kind]) if kind in TYPECODES else []
+            for name, kind in self.fields
+        }
+        # Valores ausentes são raros: guardamos só as posições deles
+        self.nulls = {
+            name: array.array("q") for name, kind in self.fields if kind in TYPECODES
+        }
+        # Métodos `append` pré-resolvidos: o laço por registro fica sem buscas
+        self._strings = [
+            (name, self.values[name].append)
+            for name, kind in self.fields
+            if kind not in TYPECODES
+        ]
+        self._numbers = [
+            (name, self.values[name].append, self.nulls[name].append)
+            for name, kind in self.fields
+            if kind in TYPECODES
+        ]
+        self.rows = 0
+        # Arrays já entregues ao Arrow/pandas não podem crescer
+        self.exported = False
+
+    def __len__(self):
+        return self.rows
+
+    def append(self, record):
+        """Adiciona um registro (dicionário ou objeto com `.get`)."""
+        if self.exported:
+            raise RuntimeError(
+                "Registros já entregues por to_arrow/to_pandas; chame clear() antes"
+            )
+        get = record.get
+        for name, append in self._strings:
+            append(get(name))
+        row = self.rows
+        for name, append, append_null in self._numbers:
+            value = get(name)
+            if value is None:
+                append(0)
+                append_null(row)
+            else:
+                try:
+                    append(value)
+                except (TypeError, OverflowError) as e:
+                    self._truncate(row)
+                    raise ValueError(
+                        f"Valor inválido na coluna {name!r}: {value!r} ({e})"
+                    ) from e
+        self.rows = row + 1
+
+    def _truncate(self, rows):
+        """Descarta o que foi acumulado depois dos primeiros `rows` registros."""
+        for values in self.values.values():
+            del values[rows:]
+        for nulls in self.nulls.values():
+            while nulls and nulls[-1] >= rows:
+                nulls.pop()
+
+    def _column(self, name):
+        """Valores (sem cópia) e máscara de ausentes (`True` = ausente)."""
+        import numpy as np
+
+        values = self.values[name]
+        values = np.frombuffer(values, dtype=values.typecode)
+        mask = np.zeros(self.rows, dtype=bool)
+        mask[np.frombuffer(self.nulls[name], dtype=np.int64)] = True
+        if values.dtype.kind == "f":
+            mask |= np.isnan(values)
+        return values, mask
+
+    def to_arrow(self):
+        """Entrega os dados como `pyarrow.Table` (buffers numéricos sem cópia)."""
+        import pyarrow as pa
+
+        self.exported = True
+        arrays = []
+        names = []
+        for name, kind in self.fields:
+            names.append(name)
+            if kind not in TYPECODES:
+                arrays.append(pa.array(self.values[name], type=pa.string()))
+                continue
+
+            values, mask = self._column(name)
+            if kind == "bool":
+                values = values.astype(bool)
+            arrays.append(pa.array(values, mask=mask if mask.any() else None))
+
+        return pa.Table.from_arrays(arrays, names=names)
+
+    def to_pandas(self):
+        """Entrega os dados como `pandas.DataFrame` (buffers numéricos sem cópia).
+
+        Colunas inteiras com valores ausentes viram arrays anuláveis do pandas
+        (`Int32`, `Int64`, ...), também sem copiar os valores.
+        """
+        import pandas as pd
+
+        self.exported = True
+        columns = {}
+        for name, kind in self.fields:
+            if kind not in TYPECODES:
+                columns[name] = pd.array(self.values[name], dtype="string")
+                continue
+
+            values, mask = self._column(name)
+            if kind == "bool":
+                columns[name] = pd.arrays.BooleanArray(values.astype(bool), mask)
+            elif not mask.any():
+                columns[name] = values
+            elif values.dtype.kind == "f":
+                columns[name] = pd.arrays.FloatingArray(values, mask)
+            else:
+                columns[name] = pd.arrays.IntegerArray(values, mask)
+
+        return pd.DataFrame(columns, copy=False)
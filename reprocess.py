@@ -0,0 +1,221 @@
+"""
+Reprocessa o arquivo de respostas brutas (`data/raw`) sem acessar a API.
+
+As partes do arquivo são processadas em paralelo por um pool de processos com
+as mesmas funções de parse dos extratores, e o resultado é publicado pelos
+mesmos sinks. Uma mudança de schema (ex.: uma coluna nova em
+`process_player_complete_data`) vira um job local de segundos, sem refazer o
+crawl da liga.
+
+Os jogadores são reconstruídos com a resposta mais recente de cada ID entre
+todas as datas do arquivo (uma extração interrompida deixa só parte dos
+jogadores na data mais recente) e só são publicados se todos os IDs da lista
+da temporada tiverem resposta arquivada.
+
+Uso:
+    python reprocess.py players [--date AAAA-MM-DD] [--workers N] [--allow-missing]
+    python reprocess.py teams [--date AAAA-MM-DD]
+    python reprocess.py ids [--date AAAA-MM-DD]
+    python reprocess.py goalies [--date AAAA-MM-DD]
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from archive import list_all_parts, list_parts, read_part
+from config import (
+    CURRENT_SEASON,
+    PLAYER_ALL_PATH,
+    PLAYER_SEASONS_PATH,
+    player_id_path,
+)
+from storage import read_records
+
+ENDPOINTS = {
+    "players": "player_landing",
+    "teams": "standings",
+    "ids": "skater_summary",
+    "goalies": "goalie_summary",
+}
+
+
+def latest_by_key(entries):
+    """Mantém a resposta mais recente de cada chave (na ordem da 1ª aparição)."""
+
+    latest = {}
+    for key, value in entries:
+        latest[key] = value
+    return latest
+
+
+def newest_by_season(entries, season_of):
+    """Resposta mais recente de cada temporada: temporada → `(chave, resposta)`.
+
+    A chave de cada entrada é a data (ou a temporada) da resposta; fica a de
+    maior chave de cada temporada (no empate, a arquivada por último). Assim
+    cada temporada é publicada uma única vez e nunca com uma resposta de uma
+    data anterior. Respostas sem temporada (vazias) são ignoradas.
+    """
+
+    newest = {}
+    for key, payload in entries:
+        season = season_of(payload)
+        if season is None:
+            continue
+        if season not in newest or str(key) >= str(newest[season][0]):
+            newest[season] = (key, payload)
+    return {season: newest[season] for season in sorted(newest)}
+
+
+def _season_id(rows_key):
+    """Temporada (`seasonId` da primeira linha) de uma resposta da API."""
+
+    def season_of(payload):
+        rows = (payload or {}).get(rows_key) or []
+        season = rows[0].get("seasonId") if rows else None
+        return None if season is None else str(season)
+
+    return season_of
+
+
+def _archived(parts):
+    return (
+        (entry["key"], entry["payload"]) for path in parts for entry in read_part(path)
+    )
+
+
+def parse_player_part(path):
+    """Processa uma parte do arquivo de jogadores (executado em outro processo)."""
+
+    import extract_player
+
+    extractor = extract_player.SimpleNHLExtractor()
+    return [
+        (entry["key"], extractor.parse_player(entry["payload"]))
+        for entry in read_part(path)
+    ]
+
+
+def reprocess_players(parts, workers=None, season=CURRENT_SEASON, allow_missing=False):
+    """Reconstrói os arquivos de jogadores a partir do arquivo bruto.
+
+    Vale a resposta mais recente de cada ID (as partes devem vir em ordem
+    cronológica) e os jogadores são publicados na ordem da lista de IDs da
+    temporada, como em `merge_shards`. Sem `allow_missing`, falha sem
+    publicar nada se algum ID da lista não tiver resposta arquivada.
+    """
+
+    import extract_player
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(parse_player_part, parts)
+        parsed = latest_by_key(
+            (int(key), entry) for part in results for key, entry in part
+        )
+
+    player_ids = dict.fromkeys(
+        int(record["playerId"]) for record in read_records(player_id_path(season))
+    )
+    missing = [player_id for player_id in player_ids if player_id not in parsed]
+    if missing:
+        message = f"{len(missing)} jogadores da lista sem resposta (ex.: {missing[:5]})"
+        if not allow_missing:
+            raise ValueError(message)
+        print(f"⚠️ Reprocessamento parcial: {message}")
+
+    extractor = extract_player.SimpleNHLExtractor()
+    rows = extractor.save_data(
+        (parsed[player_id] for player_id in player_ids if player_id in parsed),
+        PLAYER_ALL_PATH,
+        PLAYER_SEASONS_PATH,
+    )
+    if rows:
+        extract_player.rank_players()
+    return rows
+
+
+def reprocess_teams(parts):
+    """Reconstrói as classificações dos times a partir do arquivo bruto.
+
+    Só a classificação da data mais recente de cada temporada é publicada.
+    """
+
+    import extract_team
+
+    extractor = extract_team.SimpleNHLExtractor()
+    newest = newest_by_season(_archived(parts), _season_id("standings"))
+    for date, payload in newest.values():
+        extractor.save_standings(payload, date)
+    return len(newest)
+
+
+def reprocess_ids(parts):
+    """Reconstrói as listas de IDs dos jogadores a partir do arquivo bruto."""
+
+    import extract_player_id
+
+    extractor = extract_player_id.SimpleNHLExtractor()
+    newest = newest_by_season(_archived(parts), _season_id("data"))
+    for season, payload in newest.values():
+        extractor.save_season(payload, season)
+    return len(newest)
+
+
+def reprocess_goalies(parts):
+    """Reconstrói as tabelas de goleiros a partir do arquivo bruto."""
+
+    import extract_goalie
+
+    extractor = extract_goalie.SimpleNHLExtractor()
+    newest = newest_by_season(_archived(parts), _season_id("data"))
+    return sum(
+        extractor.save_season(payload, season) for season, payload in newest.values()
+    )
+
+
+def main():
+    """Reprocessa um dataset a partir da linha de comando."""
+
+    parser = argparse.ArgumentParser(description="Reprocessa o arquivo bruto da API")
+    parser.add_argument("dataset", choices=sorted(ENDPOINTS))
+    parser.add_argument(
+        "--date", help="Data do arquivo (AAAA-MM-DD); padrão: a mais recente"
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--allow-missing",
+        action="store_true",
+        help="Publica os jogadores mesmo se faltar algum ID da lista",
+    )
+    args = parser.parse_args()
+
+    if args.dataset == "players" and not args.date:
+        parts = list_all_parts(ENDPOINTS[args.dataset])
+    else:
+        parts = list_parts(ENDPOINTS[args.dataset], args.date)
+    if not parts:
+        print(f"⚠️ Nenhuma resposta arquivada para '{args.dataset}'.")
+        raise SystemExit(1)
+
+    print(f"🔄 Reprocessando {args.dataset} ({len(parts)} partes)...")
+
+    if args.dataset == "players":
+        try:
+            total = reprocess_players(
+                parts, args.workers, allow_missing=args.allow_missing
+            )
+        except ValueError as exc:
+            print(f"❌ Jogadores não publicados: {exc}")
+            raise SystemExit(1)
+    elif args.dataset == "teams":
+        total = reprocess_teams(parts)
+    elif args.dataset == "goalies":
+        total = reprocess_goalies(parts)
+    else:
+        total = reprocess_ids(parts)
+
+    print(f"✅ Reprocessamento concluído: {total} registros.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Elencos: índice time → jogadores e resumo pré-agregado por time.
+
+O índice é montado uma única vez por versão dos dados: as linhas da tabela de
+jogadores são ordenadas por time (`currentTeamAbbrev`) e, dentro do time, por
+pontos, e cada time guarda só o intervalo `[início, fim)` dessa ordem. Abrir
+um time é uma fatia do array de linhas (o elenco já vem ordenado, e os
+artilheiros são as primeiras linhas), sem filtrar a tabela inteira nem
+agrupar a cada clique.
+
+O resumo por time (elenco, totais e o maior pontuador) também é calculado
+uma vez, junto com o índice.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Totais do elenco somados no resumo por time
+ROSTER_TOTALS = [
+    "gamesPlayed",
+    "goals",
+    "assists",
+    "points",
+    "shots",
+    "powerPlayPoints",
+]
+
+
+class TeamRosterIndex:
+    def __init__(self, player_data):
+        self.player_data = player_data.reset_index(drop=True)
+
+        abbrevs = self.player_data["currentTeamAbbrev"].fillna("").to_numpy(str)
+        points = self.player_data["points"].fillna(0).to_numpy()
+
+        # Linhas ordenadas por time e, dentro do time, por pontos (decrescente)
+        self.rows = np.lexsort((-points, abbrevs)).astype(np.int64)
+        teams, starts = np.unique(abbrevs[self.rows], return_index=True)
+        ends = np.append(starts[1:], len(self.rows))
+        self.teams = {
+            team: (int(start), int(end))
+            for team, start, end in zip(teams, starts, ends)
+            if team
+        }
+        self.summary = self._summarize()
+
+    def _summarize(self):
+        """Resumo por time: nome, logo, elenco, totais e o maior pontuador."""
+
+        data = self.player_data
+        leaders = data.iloc[self.rows[[start for start, _ in self.teams.values()]]]
+
+        summary = pd.DataFrame(
+            {
+                "team": list(self.teams),
+                "fullTeamName": leaders["fullTeamName"].to_numpy(),
+                "teamLogo": leaders["teamLogo"].to_numpy(),
+                "players": [end - start for start, end in self.teams.values()],
+                "topScorer": (
+                    leaders["firstName"] + " " + leaders["lastName"]
+                ).to_numpy(),
+                "topScorerPoints": leaders["points"].to_numpy(),
+            }
+        )
+        totals = (
+            data[data["currentTeamAbbrev"].isin(self.teams)]
+            .groupby("currentTeamAbbrev")[ROSTER_TOTALS]
+            .sum()
+        )
+        summary = summary.join(totals, on="team")
+        summary["pointsPerGame"] = (
+            summary["points"] / summary["gamesPlayed"].where(summary["gamesPlayed"] > 0)
+        ).round(2)
+        return summary.sort_values("fullTeamName", ignore_index=True)
+
+    @classmethod
+    def from_tables(cls, player_data, tables):
+        """Reconstrói o índice a partir das tabelas de `to_tables` (snapshot)."""
+
+        index = cls.__new__(cls)
+        index.player_data = player_data.reset_index(drop=True)
+        index.rows = tables["roster_rows"]["row"].to_numpy()
+        teams = tables["roster_teams"]
+        index.teams = {
+            team: (start, end)
+            for team, start, end in zip(
+                teams["team"].to_pylist(),
+                teams["start"].to_pylist(),
+                teams["end"].to_pylist(),
+            )
+        }
+        index.summary = tables["roster_summary"].to_pandas()
+        return index
+
+    def to_tables(self):
+        """Estruturas do índice como tabelas Arrow (para o snapshot)."""
+
+        import pyarrow as pa
+
+        return {
+            "roster_rows": pa.table({"row": self.rows}),
+            "roster_teams": pa.table(
+                {
+                    "team": list(self.teams),
+                    "start": [start for start, _ in self.teams.values()],
+                    "end": [end for _, end in self.teams.values()],
+                }
+            ),
+            "roster_summary": pa.Table.from_pandas(self.summary, preserve_index=False),
+        }
+
+    def __contains__(self, team):
+        return team in self.teams
+
+    def roster(self, team, limit=None):
+        """Jogadores do time, do maior ao menor pontuador."""
+
+        start, end = self.teams.get(team, (0, 0))
+        if limit is not None:
+            end = min(end, start + limit)
+        return self.player_data.iloc[self.rows[start:end]]
+
+    def team_summary(self, team):
+        """Linha do resumo pré-agregado do time (`None` se não existir)."""
+
+        rows = self.summary[self.summary["team"] == team]
+        return None if rows.empty else rows.iloc[0]
@@ -0,0 +1,135 @@
+"""
+Calendário da temporada regular (jogos disputados e restantes).
+
+O endpoint `/schedule/{data}` devolve uma semana de jogos e as datas da
+temporada regular. A primeira semana informa o fim da temporada; as demais
+semanas são buscadas em paralelo (pelo limitador adaptativo do host) e os
+jogos da temporada regular vão para `data/schedule/nhl_schedule_{temporada}.csv`,
+usado pela simulação das chances de playoff (`playoffs.py`).
+
+Uso:
+    python schedule.py [--season 20252026]
+"""
+
+import argparse
+import sys
+from datetime import date as Date
+from datetime import timedelta
+
+from archive import RawArchive
+from backfill import fetch_json, season_windows
+from config import schedule_path
+from extract_team import SimpleNHLExtractor
+from pipeline import parallel_map
+from storage import save_records
+
+# Tipo de jogo da temporada regular na API
+REGULAR_SEASON = 2
+
+# Estados de jogos já encerrados (os demais contam como restantes)
+FINAL_STATES = {"OFF", "FINAL"}
+
+SCHEDULE_FIELDS = [
+    "gameId",
+    "date",
+    "homeTeam",
+    "awayTeam",
+    "gameState",
+    "homeScore",
+    "awayScore",
+]
+
+
+def week_games(data, season):
+    """Jogos da temporada regular de uma resposta de `/schedule/{data}`."""
+
+    for day in (data or {}).get("gameWeek", []):
+        for game in day.get("games", []):
+            if (
+                str(game.get("season")) != season
+                or game.get("gameType") != REGULAR_SEASON
+            ):
+                continue
+            home, away = game.get("homeTeam", {}), game.get("awayTeam", {})
+            yield {
+                "gameId": game.get("id"),
+                "date": day.get("date"),
+                "homeTeam": home.get("abbrev"),
+                "awayTeam": away.get("abbrev"),
+                "gameState": game.get("gameState"),
+                "homeScore": home.get("score"),
+                "awayScore": away.get("score"),
+            }
+
+
+def crawl_schedule(season, extractor=None, windows=None):
+    """Busca o calendário completo da temporada regular de `season`.
+
+    `extractor` e `windows` (de `season_windows`) podem ser reaproveitados
+    por quem busca várias temporadas. Retorna o número de jogos gravados (0
+    se a temporada não foi encontrada ou alguma semana falhou).
+    """
+
+    extractor = extractor or SimpleNHLExtractor()
+    if windows is None:
+        windows = season_windows(extractor, Date.today().isoformat())
+    if season not in windows:
+        print(f"❌ Temporada {season} não encontrada nos metadados")
+        return 0
+
+    start = windows[season][0]
+    with RawArchive() as archive:
+        first = fetch_json(extractor, f"schedule/{start}")
+        if not first:
+            return 0
+        archive.append("schedule", start, first)
+
+        # Semanas seguintes (até o fim da temporada regular), em paralelo
+        end = Date.fromisoformat(first.get("regularSeasonEndDate") or start)
+        weeks = []
+        day = Date.fromisoformat(start) + timedelta(days=7)
+        while day <= end:
+            weeks.append(day.isoformat())
+            day += timedelta(days=7)
+
+        responses = [first]
+        for week, data in parallel_map(
+            lambda week: fetch_json(extractor, f"schedule/{week}"),
+            weeks,
+            workers=extractor.limiter.max_limit,
+        ):
+            if not data:
+                print(f"❌ {season}: semana de {week} indisponível")
+                return 0
+            archive.append("schedule", week, data)
+            responses.append(data)
+
+    # Semanas se sobrepõem nas bordas; cada jogo entra uma vez
+    games = {}
+    for data in responses:
+        for game in week_games(data, season):
+            games[game["gameId"]] = game
+    games = sorted(games.values(), key=lambda game: (game["date"], game["gameId"]))
+
+    filepath = schedule_path(season)
+    changed, rows = save_records(games, filepath, SCHEDULE_FIELDS)
+    remaining = sum(game["gameState"] not in FINAL_STATES for game in games)
+    print(
+        f"{'✔️' if changed else '⏭️ '} {filepath}: {rows} jogos ({remaining} restantes)"
+    )
+    print(f"🚦 API: {extractor.limiter.summary()}")
+    return rows
+
+
+def main():
+    from config import CURRENT_SEASON
+
+    parser = argparse.ArgumentParser(description="Calendário da temporada regular")
+    parser.add_argument("--season", default=CURRENT_SEASON)
+    args = parser.parse_args()
+
+    sys.exit(0 if crawl_schedule(args.season) else 1)
+
+
+if __name__ == "__main__":
+    main()
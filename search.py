@@ -0,0 +1,222 @@
+"""
+Índice de busca de jogadores (nome, sigla do time ou ID).
+
+O índice é montado uma única vez por versão dos dados e combina:
+- prefixo dos nomes (busca binária sobre os tokens ordenados);
+- trigramas dos nomes, para tolerar erros de digitação ("mcdavd");
+- sigla do time e ID do jogador.
+
+As pontuações são acumuladas em arrays NumPy, então uma consulta custa alguns
+milissegundos mesmo com dezenas de milhares de jogador-temporadas.
+"""
+
+import bisect
+import unicodedata
+from collections import defaultdict
+
+import numpy as np
+
+# Fração mínima dos trigramas da consulta presente no nome
+MIN_SIMILARITY = 0.5
+
+
+def normalize(text):
+    """Remove acentos, converte para minúsculas e apara espaços."""
+
+    text = unicodedata.normalize("NFKD", str(text))
+    return "".join(c for c in text if not unicodedata.combining(c)).lower().strip()
+
+
+def trigrams(text):
+    """Trigramas de cada palavra do texto (com bordas marcadas por espaço)."""
+
+    grams = set()
+    for token in text.split():
+        padded = f"  {token} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _prefix_range(keys, prefix):
+    """Intervalo `[lo, hi)` das chaves ordenadas que começam com `prefix`."""
+
+    lo = bisect.bisect_left(keys, prefix)
+    hi = bisect.bisect_left(keys, prefix + "\uffff")
+    return lo, hi
+
+
+def _postings(table, key):
+    """Dicionário chave → linhas a partir de uma tabela `(key, rows: list)`.
+
+    As linhas de cada chave são fatias (sem cópia) do buffer da coluna.
+    """
+
+    rows = table["rows"].combine_chunks()
+    values = rows.values.to_numpy()
+    offsets = rows.offsets.to_numpy()
+    return {
+        name: values[offsets[i] : offsets[i + 1]]
+        for i, name in enumerate(table[key].to_pylist())
+    }
+
+
+def _postings_array(postings):
+    """Coluna `list<int64>` com as linhas de cada chave (na ordem das chaves)."""
+
+    import pyarrow as pa
+
+    lengths = [len(rows) for rows in postings]
+    offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int32)
+    values = np.concatenate(postings) if postings else np.array([], dtype=np.int64)
+    return pa.ListArray.from_arrays(offsets, values.astype(np.int64))
+
+
+class PlayerSearchIndex:
+    def __init__(self, player_data):
+        self.player_data = player_data.reset_index(drop=True)
+        n = len(self.player_data)
+
+        names = [
+            normalize(f"{first} {last}")
+            for first, last in zip(
+                self.player_data["firstName"].fillna(""),
+                self.player_data["lastName"].fillna(""),
+            )
+        ]
+
+        # Tokens (primeiro nome, sobrenome e nome completo) ordenados
+        tokens = []
+        grams = defaultdict(list)
+        gram_counts = np.zeros(n, dtype=np.int32)
+        for row, name in enumerate(names):
+            tokens.append((name, row))
+            tokens.extend((token, row) for token in name.split())
+            name_grams = trigrams(name)
+            gram_counts[row] = len(name_grams)
+            for gram in name_grams:
+                grams[gram].append(row)
+
+        tokens.sort()
+        self.token_keys = [token for token, _ in tokens]
+        self.token_rows = np.array([row for _, row in tokens], dtype=np.int64)
+
+        self.grams = {
+            gram: np.array(rows, dtype=np.int64) for gram, rows in grams.items()
+        }
+        self.gram_counts = gram_counts
+
+        # IDs como texto ordenado (busca por prefixo)
+        ids = sorted(
+            (str(player_id), row)
+            for row, player_id in enumerate(self.player_data["playerId"])
+        )
+        self.id_keys = [key for key, _ in ids]
+        self.id_rows = np.array([row for _, row in ids], dtype=np.int64)
+
+        # Sigla do time → linhas
+        teams = defaultdict(list)
+        for row, abbrev in enumerate(self.player_data["currentTeamAbbrev"].fillna("")):
+            teams[normalize(abbrev)].append(row)
+        self.teams = {
+            abbrev: np.array(rows, dtype=np.int64) for abbrev, rows in teams.items()
+        }
+
+    @classmethod
+    def from_tables(cls, player_data, tables):
+        """Reconstrói o índice a partir das tabelas de `to_tables` (snapshot)."""
+
+        index = cls.__new__(cls)
+        index.player_data = player_data.reset_index(drop=True)
+        index.token_keys = tables["search_tokens"]["key"].to_pylist()
+        index.token_rows = tables["search_tokens"]["row"].to_numpy()
+        index.grams = _postings(tables["search_grams"], "gram")
+        index.gram_counts = tables["search_counts"]["gram_count"].to_numpy()
+        index.id_keys = tables["search_ids"]["key"].to_pylist()
+        index.id_rows = tables["search_ids"]["row"].to_numpy()
+        index.teams = _postings(tables["search_teams"], "abbrev")
+        return index
+
+    def to_tables(self):
+        """Estruturas do índice como tabelas Arrow (para o snapshot)."""
+
+        import pyarrow as pa
+
+        grams = sorted(self.grams)
+        teams = sorted(self.teams)
+        return {
+            "search_tokens": pa.table({"key": self.token_keys, "row": self.token_rows}),
+            "search_grams": pa.table(
+                {
+                    "gram": grams,
+                    "rows": _postings_array([self.grams[gram] for gram in grams]),
+                }
+            ),
+            "search_counts": pa.table({"gram_count": self.gram_counts}),
+            "search_ids": pa.table({"key": self.id_keys, "row": self.id_rows}),
+            "search_teams": pa.table(
+                {
+                    "abbrev": teams,
+                    "rows": _postings_array([self.teams[abbrev] for abbrev in teams]),
+                }
+            ),
+        }
+
+    def __len__(self):
+        return len(self.player_data)
+
+    def find_id(self, player_id):
+        """Linhas do jogador com o ID informado."""
+
+        key = str(player_id)
+        lo = bisect.bisect_left(self.id_keys, key)
+        hi = bisect.bisect_right(self.id_keys, key)
+        return self.player_data.iloc[np.sort(self.id_rows[lo:hi])]
+
+    def scores(self, query):
+        """Pontuação de cada linha para a consulta (0 = sem correspondência)."""
+
+        query = normalize(query)
+        scores = np.zeros(len(self), dtype=np.float64)
+        if not query:
+            return scores
+
+        if query.isdigit():
+            lo, hi = _prefix_range(self.id_keys, query)
+            scores[self.id_rows[lo:hi]] += 3.0
+            return scores
+
+        # Nome completo começando pela consulta
+        lo, hi = _prefix_range(self.token_keys, query)
+        scores[np.unique(self.token_rows[lo:hi])] += 2.0
+
+        # Cada palavra da consulta como prefixo de uma palavra do nome
+        for token in query.split():
+            lo, hi = _prefix_range(self.token_keys, token)
+            scores[np.unique(self.token_rows[lo:hi])] += 1.0
+
+        # Sigla do time
+        if query in self.teams:
+            scores[self.teams[query]] += 3.0
+
+        # Similaridade por trigramas (tolerância a erros de digitação)
+        query_grams = trigrams(query)
+        postings = [self.grams[gram] for gram in query_grams if gram in self.grams]
+        if postings:
+            shared = np.bincount(np.concatenate(postings), minlength=len(self))
+            similarity = shared / len(query_grams)
+            # Desempate a favor de nomes mais curtos (mais próximos da consulta)
+            jaccard = shared / (len(query_grams) + self.gram_counts - shared)
+            scores += np.where(similarity >= MIN_SIMILARITY, similarity + jaccard, 0.0)
+
+        return scores
+
+    def search(self, query, limit=20):
+        """Retorna as linhas mais relevantes para a consulta."""
+
+        scores = self.scores(query)
+        matches = np.flatnonzero(scores > 0)
+        if not len(matches):
+            return self.player_data.iloc[[]]
+
+        order = matches[np.argsort(-scores[matches], kind="stable")][:limit]
+        return self.player_data.iloc[order]
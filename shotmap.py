@@ -0,0 +1,149 @@
+"""
+Mapa de chutes: contagens por região da meia pista ofensiva.
+
+Os chutes de uma temporada (`events.py`, coordenadas já normalizadas para o
+ataque no lado positivo de `x`) viram arrays numéricos contíguos e cada chute
+recebe, de uma vez, o índice da sua célula na grade (divisão inteira e
+`np.clip`, sem laço por chute). As grades por time saem de um único `np.bincount` sobre
+`time × célula`; as de cada jogador, de um `bincount` sobre a fatia dele nos
+chutes ordenados por jogador, guardadas em um cache LRU limitado
+(`PLAYER_CACHE_SIZE` jogadores) na primeira consulta.
+
+O índice é montado uma vez por versão dos dados (cache do app), então trocar
+de time ou de jogador no dashboard não percorre os lances de novo.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from events import SHOT_EVENTS, read_events
+
+# Meia pista ofensiva (pés): da linha central (x = 0) ao fundo (x = 100) e de
+# uma lateral à outra (y = ±42,5); o gol fica em x = 89
+X_RANGE = (0.0, 100.0)
+Y_RANGE = (-42.5, 42.5)
+GOAL_X = 89
+CELL_FEET = 2.5
+
+# Grades de jogadores guardadas por índice (~22 KB cada com a célula padrão)
+PLAYER_CACHE_SIZE = 256
+
+
+class ShotMap:
+    """Grades de chutes e gols (linhas = y, colunas = x) de uma tabela de
+    chutes com `team`, `playerId`, `type`, `x` e `y`.
+    """
+
+    def __init__(self, shots, cell=CELL_FEET):
+        import pyarrow.compute as pc
+
+        shots = shots.filter(shots["x"].is_valid()).filter(shots["y"].is_valid())
+        self.cell = cell
+        self.columns = int(np.ceil((X_RANGE[1] - X_RANGE[0]) / cell))
+        self.rows = int(np.ceil((Y_RANGE[1] - Y_RANGE[0]) / cell))
+        self.size = self.rows * self.columns
+
+        x = shots["x"].to_numpy().astype(np.float32)
+        y = shots["y"].to_numpy().astype(np.float32)
+        column = np.clip(
+            ((x - X_RANGE[0]) / cell).astype(np.int32), 0, self.columns - 1
+        )
+        row = np.clip(((y - Y_RANGE[0]) / cell).astype(np.int32), 0, self.rows - 1)
+        cells = row * self.columns + column
+        goals = pc.equal(shots["type"], "goal").to_numpy(zero_copy_only=False)
+        goals = goals.astype(np.int8)
+
+        # Códigos de time e de jogador por hash (Arrow), sem ordenar textos
+        teams = pc.dictionary_encode(shots["team"].fill_null("")).combine_chunks()
+        self.teams = np.asarray(teams.dictionary.to_pylist(), dtype=object)
+        team_codes = teams.indices.to_numpy().astype(np.int64)
+        players = pc.dictionary_encode(shots["playerId"].fill_null(0)).combine_chunks()
+        player_ids = players.dictionary.to_numpy()
+        player_codes = players.indices.to_numpy().astype(np.int64)
+
+        # Grades por time: um bincount sobre (time, célula)
+        shape = (len(self.teams), self.rows, self.columns)
+        length = len(self.teams) * self.size
+        keys = team_codes * self.size + cells
+        self.team_shots = np.bincount(keys, minlength=length).reshape(shape)
+        self.team_goals = np.bincount(keys, weights=goals, minlength=length)
+        self.team_goals = self.team_goals.astype(np.int64).reshape(shape)
+        self.team_index = {team: code for code, team in enumerate(self.teams)}
+
+        # Chutes ordenados por jogador: cada jogador é uma fatia [início, fim)
+        order = np.argsort(player_codes, kind="stable")
+        self.player_cells = cells[order]
+        self.player_goals = goals[order]
+        ends = np.cumsum(np.bincount(player_codes, minlength=len(player_ids)))
+        starts = ends - np.bincount(player_codes, minlength=len(player_ids))
+        self.players = {
+            int(player): (int(start), int(end))
+            for player, start, end in zip(player_ids, starts, ends)
+            if player
+        }
+        self._player_grid = lru_cache(maxsize=PLAYER_CACHE_SIZE)(self._player_grid)
+
+        # Jogadores de cada time por número de chutes (matriz time × jogador)
+        counts = np.bincount(
+            team_codes * len(player_ids) + player_codes,
+            minlength=len(self.teams) * len(player_ids),
+        ).reshape(len(self.teams), len(player_ids))
+        self.rosters = {}
+        for code, team in enumerate(self.teams):
+            ranked = np.argsort(-counts[code], kind="stable")
+            ranked = ranked[(counts[code][ranked] > 0) & (player_ids[ranked] != 0)]
+            self.rosters[team] = player_ids[ranked].tolist()
+
+    @classmethod
+    def for_season(cls, season, cell=CELL_FEET):
+        """Índice dos chutes de uma temporada (lidos só os lances de chute)."""
+
+        shots = read_events(
+            [season], columns=["team", "playerId", "type", "x", "y"], types=SHOT_EVENTS
+        )
+        return cls(shots, cell)
+
+    def __len__(self):
+        return len(self.player_cells)
+
+    def x_centers(self):
+        return X_RANGE[0] + (np.arange(self.columns) + 0.5) * self.cell
+
+    def y_centers(self):
+        return Y_RANGE[0] + (np.arange(self.rows) + 0.5) * self.cell
+
+    def team(self, team=None):
+        """Grades `(chutes, gols)` de um time (`None` = liga inteira)."""
+
+        if team is None:
+            return self.team_shots.sum(axis=0), self.team_goals.sum(axis=0)
+        code = self.team_index.get(team)
+        if code is None:
+            shape = (self.rows, self.columns)
+            return np.zeros(shape, dtype=np.int64), np.zeros(shape, dtype=np.int64)
+        return self.team_shots[code], self.team_goals[code]
+
+    def player(self, player_id):
+        """Grades `(chutes, gols)` de um jogador (em cache LRU)."""
+
+        return self._player_grid(int(player_id))
+
+    def _player_grid(self, player_id):
+        start, end = self.players.get(player_id, (0, 0))
+        cells = self.player_cells[start:end]
+        shots = np.bincount(cells, minlength=self.size)
+        goals = np.bincount(
+            cells, weights=self.player_goals[start:end], minlength=self.size
+        )
+        return (
+            shots.reshape(self.rows, self.columns),
+            goals.astype(np.int64).reshape(self.rows, self.columns),
+        )
+
+    def team_players(self, team):
+        """IDs dos jogadores que chutaram pelo time, do que mais chutou ao que
+        menos chutou.
+        """
+
+        return self.rosters.get(team, [])
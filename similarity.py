@@ -0,0 +1,171 @@
+"""
+Jogadores semelhantes: vizinhos mais próximos sobre estatísticas por jogo.
+
+Cada jogador-temporada vira um vetor com as estatísticas por jogo (gols,
+assistências, chutes, pontos em power play e gols em prorrogação), a
+eficiência nos chutes e o número de jogos, padronizados (média 0, desvio 1)
+para que nenhuma estatística domine a distância.
+
+O índice é montado uma única vez por versão dos dados: a matriz padronizada
+(float32, contígua) e as normas das linhas ficam prontas, então uma consulta
+é um único produto matriz × vetor (`‖x - q‖² = ‖x‖² - 2·x·q + ‖q‖²`) e uma
+seleção parcial (`argpartition`) dos k menores — alguns milissegundos mesmo
+com centenas de milhares de jogador-temporadas, sem calcular distâncias
+entre todos os pares.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+
+# Estatísticas somadas na temporada → divididas pelos jogos
+PER_GAME_STATS = ["goals", "assists", "shots", "powerPlayPoints", "otGoals"]
+
+FEATURES = [f"{stat}PerGame" for stat in PER_GAME_STATS] + [
+    "shootingPctg",
+    "gamesPlayed",
+]
+
+# Jogos mínimos para uma temporada entrar como candidata (médias instáveis)
+MIN_GAMES = 10
+
+
+def feature_frame(players):
+    """Vetores (não padronizados) de cada linha: colunas de `FEATURES`."""
+
+    games = pd.to_numeric(players["gamesPlayed"], errors="coerce").fillna(0)
+    divisor = games.where(games > 0)
+    stats = {
+        stat: pd.to_numeric(players[stat], errors="coerce").fillna(0)
+        for stat in PER_GAME_STATS
+    }
+
+    features = pd.DataFrame(
+        {f"{stat}PerGame": stats[stat] / divisor for stat in PER_GAME_STATS},
+        index=players.index,
+    )
+    features["shootingPctg"] = stats["goals"] / stats["shots"].where(stats["shots"] > 0)
+    features["gamesPlayed"] = games
+    return features.fillna(0).astype(np.float32)
+
+
+def player_vector(player):
+    """Vetor (não padronizado) de uma única linha, sem passar pelo pandas."""
+
+    def number(column):
+        value = pd.to_numeric(player.get(column), errors="coerce")
+        return 0.0 if pd.isna(value) else float(value)
+
+    games, goals, shots = (number(c) for c in ("gamesPlayed", "goals", "shots"))
+    return np.array(
+        [number(stat) / games if games > 0 else 0.0 for stat in PER_GAME_STATS]
+        + [goals / shots if shots > 0 else 0.0, games],
+        dtype=np.float32,
+    )
+
+
+class SimilarityIndex:
+    """Índice de vizinhos mais próximos dos jogador-temporadas.
+
+    `players` precisa de `playerId`, `season`, `gamesPlayed` e das colunas de
+    `PER_GAME_STATS` (tabela de jogadores ou jogador-temporada). Só as linhas
+    com pelo menos `min_games` jogos entram no índice.
+    """
+
+    def __init__(self, players, min_games=MIN_GAMES):
+        players = players[
+            pd.to_numeric(players["gamesPlayed"], errors="coerce").fillna(0)
+            >= min_games
+        ]
+        features = feature_frame(players).to_numpy()
+
+        self.player_ids = players["playerId"].to_numpy(dtype=np.int64)
+        self.seasons = players["season"].astype(str).to_numpy()
+        self.values = np.ascontiguousarray(features)
+
+        # Padronização (estatísticas constantes ficam com desvio 1)
+        if len(features):
+            mean, scale = features.mean(axis=0), features.std(axis=0)
+        else:
+            mean, scale = np.zeros(len(FEATURES)), np.ones(len(FEATURES))
+        self.mean = mean.astype(np.float32)
+        self.scale = np.where(scale > 0, scale, 1).astype(np.float32)
+        self._prepare()
+
+    def _prepare(self):
+        """Matriz padronizada e normas das linhas (uma vez por índice)."""
+
+        self.matrix = np.ascontiguousarray((self.values - self.mean) / self.scale)
+        self.norms = np.einsum("ij,ij->i", self.matrix, self.matrix)
+
+    @classmethod
+    def from_table(cls, table):
+        """Reconstrói o índice a partir da tabela de `to_table` (snapshot)."""
+
+        index = cls.__new__(cls)
+        metadata = json.loads(table.schema.metadata[b"similarity"])
+        index.player_ids = table["playerId"].to_numpy()
+        index.seasons = np.asarray(table["season"].to_pylist(), dtype=object)
+        index.values = np.column_stack(
+            [table[feature].to_numpy() for feature in FEATURES]
+        ).astype(np.float32)
+        index.mean = np.array(metadata["mean"], dtype=np.float32)
+        index.scale = np.array(metadata["scale"], dtype=np.float32)
+        index._prepare()
+        return index
+
+    def to_table(self):
+        """Vetores do índice como tabela Arrow (para o snapshot)."""
+
+        import pyarrow as pa
+
+        table = pa.table(
+            {
+                "playerId": self.player_ids,
+                "season": self.seasons.astype(str),
+                **{
+                    feature: self.values[:, column]
+                    for column, feature in enumerate(FEATURES)
+                },
+            }
+        )
+        metadata = {"mean": self.mean.tolist(), "scale": self.scale.tolist()}
+        return table.replace_schema_metadata({"similarity": json.dumps(metadata)})
+
+    def __len__(self):
+        return len(self.player_ids)
+
+    def nearest(self, player, k=10):
+        """Os `k` jogador-temporadas mais próximos de `player` (uma linha).
+
+        Outras temporadas do próprio jogador ficam de fora. Retorna um
+        DataFrame com `playerId`, `season`, as colunas de `FEATURES` e a
+        `distance` (no espaço padronizado), da mais próxima à mais distante.
+        """
+
+        columns = ["playerId", "season", *FEATURES, "distance"]
+        if not len(self):
+            return pd.DataFrame(columns=columns)
+
+        query = (player_vector(player) - self.mean) / self.scale
+        distances = self.norms - 2 * (self.matrix @ query) + query @ query
+        distances[self.player_ids == int(player["playerId"])] = np.inf
+
+        k = min(k, int(np.isfinite(distances).sum()))
+        if k <= 0:
+            return pd.DataFrame(columns=columns)
+        rows = np.argpartition(distances, k - 1)[:k]
+        rows = rows[np.argsort(distances[rows], kind="stable")]
+
+        return pd.DataFrame(
+            {
+                "playerId": self.player_ids[rows],
+                "season": self.seasons[rows],
+                **{
+                    feature: self.values[rows, column]
+                    for column, feature in enumerate(FEATURES)
+                },
+                "distance": np.sqrt(np.maximum(distances[rows], 0)),
+            }
+        )
@@ -0,0 +1,364 @@
+"""
+Snapshot pré-calculado dos dados do app (warm start).
+
+Ao final da extração, as tabelas que o app usa (times, jogadores e goleiros
+com as métricas derivadas, resumo por temporada, histórico jogador-temporada e
+as estruturas do índice de busca) são gravadas em `data/snapshot/` como
+arquivos Arrow IPC sem compressão, junto com um `meta.json` com a versão dos
+dados.
+
+O app mapeia esses arquivos em memória (`pa.memory_map`) em vez de ler os CSVs
+e recalcular tudo a cada boot. Se o snapshot não existir ou for de outra
+versão dos dados, o app volta a montar as tabelas a partir das fontes com as
+mesmas funções `build_*` deste módulo.
+
+Uso:
+    python snapshot.py
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from functools import lru_cache
+
+import pandas as pd
+
+from config import (
+    PLAYER_ALL_PATH,
+    PLAYER_DIR,
+    PLAYER_RANKS_PATH,
+    PLAYER_SEASONS_PATH,
+    RACE_DIR,
+    SCHEDULE_DIR,
+    SNAPSHOT_DIR,
+    TEAMS_DIR,
+    USE_SNAPSHOT,
+)
+from metrics import (
+    add_goalie_metrics,
+    add_player_metrics,
+    add_team_metrics,
+    season_summary,
+)
+from roster import TeamRosterIndex
+from search import PlayerSearchIndex
+from similarity import SimilarityIndex
+from storage import file_hash, load_manifest, publish_file, temp_path_for
+
+# Versão do formato; snapshots de formatos antigos são ignorados
+SNAPSHOT_FORMAT = 3
+
+# Chave, nos metadados do schema de cada tabela, da versão dos dados
+VERSION_KEY = b"snapshot_version"
+
+SNAPSHOT_META_PATH = SNAPSHOT_DIR / "meta.json"
+
+
+def source_files():
+    """Arquivos de origem consumidos pelo app."""
+
+    files = sorted(TEAMS_DIR.glob("nhl_standings_*.csv")) + sorted(
+        PLAYER_DIR.glob("nhl_player_*.csv")
+    )
+    files += [
+        path for path in (PLAYER_SEASONS_PATH, PLAYER_RANKS_PATH) if path.exists()
+    ]
+    return (
+        files
+        + sorted(PLAYER_DIR.glob("nhl_goalies_*.parquet"))
+        + sorted(TEAMS_DIR.glob("nhl_ranks_*.parquet"))
+        + sorted(RACE_DIR.glob("nhl_race_*.parquet"))
+        + sorted(SCHEDULE_DIR.glob("nhl_schedule_*.csv"))
+    )
+
+
+@lru_cache(maxsize=256)
+def _source_hash(path, mtime_ns, size):
+    """Hash de uma fonte (recalculado só quando mtime ou tamanho mudam)."""
+
+    return file_hash(path)
+
+
+def source_version(manifest):
+    """Versão dos dados a partir do manifesto (ou do conteúdo das fontes).
+
+    Sem manifesto, usa o hash do conteúdo dos arquivos, que (ao contrário do
+    mtime) é o mesmo em qualquer checkout do repositório.
+    """
+
+    if manifest.get("version"):
+        return manifest["version"]
+
+    digest = hashlib.sha256()
+    for f in source_files():
+        stat = f.stat()
+        sha256 = _source_hash(str(f), stat.st_mtime_ns, stat.st_size)
+        digest.update(f"{f.as_posix()}:{sha256}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def build_team_table(data_dir=TEAMS_DIR):
+    """Carrega todas as temporadas dos times e calcula as métricas derivadas."""
+
+    frames = []
+    for file_path in sorted(data_dir.glob("nhl_standings_*.csv")):
+        try:
+            season = file_path.stem.replace("nhl_standings_", "")
+            df = pd.read_csv(file_path, sep=";")
+
+            # Adicionar coluna de temporada se não existir
+            if "season" not in df.columns:
+                df["season"] = season
+
+            frames.append(df)
+
+        except Exception as e:
+            print(f"Erro ao carregar {file_path}: {e}")
+
+    if not frames:
+        return pd.DataFrame()
+
+    teams = add_team_metrics(pd.concat(frames, ignore_index=True))
+    teams["season"] = teams["season"].astype(str)
+    return teams
+
+
+def build_player_table(file_path=PLAYER_ALL_PATH):
+    """Carrega os jogadores e calcula as métricas derivadas."""
+
+    try:
+        return add_player_metrics(pd.read_csv(file_path, sep=";"))
+    except Exception as e:
+        print(f"Erro ao carregar {file_path}: {e}")
+        return pd.DataFrame()
+
+
+def build_goalie_table(data_dir=PLAYER_DIR):
+    """Carrega os goleiros de todas as temporadas com as métricas derivadas."""
+
+    frames = [
+        pd.read_parquet(path) for path in sorted(data_dir.glob("nhl_goalies_*.parquet"))
+    ]
+    if not frames:
+        return pd.DataFrame()
+    return add_goalie_metrics(pd.concat(frames, ignore_index=True))
+
+
+def build_player_season_table(file_path=PLAYER_SEASONS_PATH):
+    """Carrega a tabela jogador-temporada (temporada regular da NHL).
+
+    Soma as passagens por times diferentes na mesma temporada.
+    """
+
+    if not file_path.exists():
+        return pd.DataFrame()
+
+    seasons = pd.read_parquet(file_path)
+    seasons = seasons[(seasons["leagueAbbrev"] == "NHL") & (seasons["gameTypeId"] == 2)]
+    seasons = seasons.groupby(["playerId", "season"], as_index=False)[
+        [
+            "gamesPlayed",
+            "goals",
+            "assists",
+            "points",
+            "shots",
+            "powerPlayPoints",
+            "otGoals",
+        ]
+    ].sum()
+    seasons["seasonLabel"] = (
+        seasons["season"]
+        .astype(str)
+        .str.replace(r"^(\d{4})(\d{4})$", r"\1-\2", regex=True)
+    )
+    return seasons
+
+
+def build_player_rank_table(file_path=PLAYER_RANKS_PATH):
+    """Posições e percentis dos jogadores (`ranks.py`), indexados por ID."""
+
+    if not file_path.exists():
+        return pd.DataFrame()
+    return pd.read_parquet(file_path)
+
+
+def build_team_rank_table(data_dir=TEAMS_DIR):
+    """Posições e percentis dos times de todas as temporadas (`ranks.py`)."""
+
+    frames = [
+        pd.read_parquet(path) for path in sorted(data_dir.glob("nhl_ranks_*.parquet"))
+    ]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def similarity_index(players, player_seasons):
+    """Índice de jogadores semelhantes (`similarity.py`).
+
+    Usa todas as jogador-temporadas do histórico quando disponíveis; senão,
+    a temporada atual da tabela de jogadores.
+    """
+
+    return SimilarityIndex(players if player_seasons.empty else player_seasons)
+
+
+class Snapshot:
+    def __init__(self, directory, meta):
+        self.directory = directory
+        self.version = meta["version"]
+        self.names = set(meta["tables"])
+        self.tables = {}
+        self.frames = {}
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def table(self, name):
+        """Tabela Arrow mapeada em memória (aberta na primeira leitura)."""
+
+        import pyarrow as pa
+
+        if name not in self.tables:
+            source = pa.memory_map(str(self.directory / f"{name}.arrow"))
+            self.tables[name] = pa.ipc.open_file(source).read_all()
+        return self.tables[name]
+
+    def frame(self, name):
+        """Tabela convertida para `pandas.DataFrame` (uma vez por snapshot).
+
+        O DataFrame é compartilhado por quem o pede e é somente leitura.
+        """
+
+        if name not in self.frames:
+            self.frames[name] = self.table(name).to_pandas()
+        return self.frames[name]
+
+    def is_consistent(self):
+        """Indica se todas as tabelas são da versão do `meta` lido.
+
+        O `write_snapshot` troca as tabelas antes do meta, então quem leu o
+        meta no meio de uma gravação poderia abrir tabelas de outra versão.
+        Todas as tabelas são abertas aqui, de uma vez, e conferidas pela
+        versão gravada no schema; o mapeamento continua válido mesmo que os
+        arquivos sejam trocados depois.
+        """
+
+        version = self.version.encode()
+        try:
+            return all(
+                (self.table(name).schema.metadata or {}).get(VERSION_KEY) == version
+                for name in self.names
+            )
+        except (OSError, ValueError):
+            return False
+
+
+def read_snapshot(version, directory=SNAPSHOT_DIR):
+    """Abre o snapshot da versão informada; `None` se ausente ou desatualizado."""
+
+    if not USE_SNAPSHOT:
+        return None
+
+    try:
+        with open(directory / "meta.json", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if meta.get("format") != SNAPSHOT_FORMAT or meta.get("version") != version:
+        return None
+
+    snapshot = Snapshot(directory, meta)
+    return snapshot if snapshot.is_consistent() else None
+
+
+def _write_table(table, filepath, version):
+    """Grava uma tabela em Arrow IPC (sem compressão) e publica se mudou.
+
+    A versão dos dados vai nos metadados do schema (`VERSION_KEY`).
+    """
+
+    import pyarrow as pa
+
+    metadata = {**(table.schema.metadata or {}), VERSION_KEY: version.encode()}
+    table = table.replace_schema_metadata(metadata)
+    tmp_path = temp_path_for(filepath)
+    with (
+        pa.OSFile(str(tmp_path), "wb") as sink,
+        pa.ipc.new_file(sink, table.schema) as writer,
+    ):
+        writer.write_table(table)
+    return publish_file(tmp_path, filepath)
+
+
+def build_tables():
+    """Monta todas as tabelas do snapshot a partir das fontes."""
+
+    import pyarrow as pa
+
+    frames = {
+        "teams": build_team_table(),
+        "players": build_player_table(),
+        "goalies": build_goalie_table(),
+        "player_seasons": build_player_season_table(),
+        "player_ranks": build_player_rank_table(),
+        "team_ranks": build_team_rank_table(),
+    }
+    if not frames["teams"].empty:
+        frames["season_summary"] = season_summary(frames["teams"]).reset_index()
+
+    tables = {
+        name: pa.Table.from_pandas(df, preserve_index=False)
+        for name, df in frames.items()
+        if not df.empty
+    }
+    if not frames["players"].empty:
+        tables.update(PlayerSearchIndex(frames["players"]).to_tables())
+        tables.update(TeamRosterIndex(frames["players"]).to_tables())
+        tables["similar_players"] = similarity_index(
+            frames["players"], frames["player_seasons"]
+        ).to_table()
+    return tables
+
+
+def write_snapshot(directory=SNAPSHOT_DIR):
+    """Gera o snapshot da versão atual dos dados. Retorna o `meta` gravado."""
+
+    version = source_version(load_manifest())
+    tables = build_tables()
+
+    directory.mkdir(parents=True, exist_ok=True)
+    entries = {}
+    for name, table in tables.items():
+        _, sha256 = _write_table(table, directory / f"{name}.arrow", version)
+        entries[name] = {"rows": table.num_rows, "sha256": sha256}
+
+    # O meta é gravado por último: só aponta para tabelas já publicadas
+    meta = {
+        "format": SNAPSHOT_FORMAT,
+        "version": version,
+        "built_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "tables": entries,
+    }
+    meta_path = directory / "meta.json"
+    tmp_path = temp_path_for(meta_path)
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2, sort_keys=True)
+        f.write("\n")
+    publish_file(tmp_path, meta_path)
+    return meta
+
+
+def main():
+    """Gera o snapshot a partir da linha de comando."""
+
+    meta = write_snapshot()
+    print(
+        f"📦 Snapshot salvo em {SNAPSHOT_DIR} "
+        f"(versão {meta['version']}, {len(meta['tables'])} tabelas)."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,421 @@
+"""
+Publicação atômica dos arquivos extraídos e manifesto dos datasets.
+
+Os extratores escrevem cada saída em um arquivo temporário no mesmo diretório,
+comparam o hash do conteúdo com o arquivo publicado e só fazem o `os.replace`
+quando os dados realmente mudaram. O manifesto (`data/manifest.json`) registra
+hash, número de linhas e horário de extração de cada dataset.
+
+As atualizações do manifesto (ler, alterar e regravar) são serializadas entre
+threads e também entre processos (ex.: shards da extração na mesma máquina)
+por um lock de arquivo ao lado dele (`data/.manifest.json.lock`).
+"""
+
+import csv
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from config import DATA_DIR
+from records import ColumnBuilder, fields_from_schema
+
+try:
+    import fcntl
+except ImportError:  # Windows: só o lock entre threads
+    fcntl = None
+
+MANIFEST_PATH = DATA_DIR / "manifest.json"
+
+_manifest_lock = threading.Lock()
+
+
+@contextmanager
+def manifest_lock(manifest_path=MANIFEST_PATH):
+    """Acesso exclusivo ao manifesto, entre threads e entre processos."""
+
+    manifest_path = Path(manifest_path)
+    with _manifest_lock:
+        if fcntl is None:
+            yield
+            return
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_path = manifest_path.with_name(f".{manifest_path.name}.lock")
+        with open(lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def file_hash(filepath):
+    """Calcula o hash SHA-256 do conteúdo de um arquivo."""
+
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def temp_path_for(filepath):
+    """Cria um arquivo temporário oculto ao lado do destino final."""
+
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp"
+    )
+    os.close(fd)
+    return Path(tmp_name)
+
+
+def publish_file(tmp_path, filepath):
+    """Publica o temporário no destino apenas se o conteúdo mudou.
+
+    Retorna uma tupla `(changed, sha256)`. O temporário é sempre consumido.
+    """
+
+    filepath = Path(filepath)
+    new_hash = file_hash(tmp_path)
+
+    if filepath.exists() and file_hash(filepath) == new_hash:
+        os.remove(tmp_path)
+        return False, new_hash
+
+    os.replace(tmp_path, filepath)
+    return True, new_hash
+
+
+class CSVRecordWriter:
+    """Escreve registros em CSV (sep=';') incrementalmente e publica ao final.
+
+    Os registros vão para um temporário ao lado do destino; `commit()` publica
+    o arquivo (só se o conteúdo mudou) e retorna `(changed, sha256, rows)`.
+    Se não houver registros nem `fieldnames`, nada é publicado e `sha256` é
+    `None`. Usado como context manager, descarta o temporário em caso de erro.
+    """
+
+    def __init__(self, filepath, fieldnames=None):
+        self.filepath = Path(filepath)
+        self.tmp_path = temp_path_for(self.filepath)
+        self.file = open(self.tmp_path, "w", newline="", encoding="utf-8")
+        self.writer = None
+        self.rows = 0
+        if fieldnames:
+            self._start(fieldnames)
+
+    def _start(self, fieldnames):
+        self.writer = csv.DictWriter(
+            self.file, fieldnames=fieldnames, delimiter=";", lineterminator="\n"
+        )
+        self.writer.writeheader()
+
+    def write(self, record):
+        if self.writer is None:
+            self._start(list(record))
+        self.writer.writerow(record)
+        self.rows += 1
+
+    def commit(self):
+        self.file.close()
+        if self.writer is None:
+            os.remove(self.tmp_path)
+            return False, None, 0
+
+        changed, sha256 = publish_file(self.tmp_path, self.filepath)
+        return changed, sha256, self.rows
+
+    def abort(self):
+        self.file.close()
+        if self.tmp_path.exists():
+            os.remove(self.tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.abort()
+
+
+class ParquetRecordWriter:
+    """Escreve registros em Parquet, em lotes colunares, e publica ao final.
+
+    `schema` é um `pyarrow.Schema`; os registros são acumulados coluna a coluna
+    em arrays tipados (`records.ColumnBuilder`) e cada lote de `batch_size`
+    registros vira um row group, então a memória usada não depende do total de
+    registros. Mesma interface do `CSVRecordWriter`.
+    """
+
+    def __init__(self, filepath, schema, batch_size=10_000):
+        import pyarrow.parquet as pq
+
+        self.filepath = Path(filepath)
+        self.tmp_path = temp_path_for(self.filepath)
+        self.schema = schema
+        self.batch_size = batch_size
+        self.builder = ColumnBuilder(fields_from_schema(schema))
+        self.rows = 0
+        self.writer = pq.ParquetWriter(self.tmp_path, schema, compression="zstd")
+
+    def write(self, record):
+        self.builder.append(record)
+        self.rows += 1
+        if len(self.builder) >= self.batch_size:
+            self._flush()
+
+    def write_table(self, table):
+        """Escreve uma `pyarrow.Table` inteira (nos mesmos lotes de `write`)."""
+
+        self._flush()
+        for batch in table.cast(self.schema).to_batches(max_chunksize=self.batch_size):
+            self.writer.write_batch(batch)
+            self.rows += batch.num_rows
+
+    def _flush(self):
+        if not len(self.builder):
+            return
+        table = self.builder.to_arrow().cast(self.schema)
+        self.writer.write_table(table)
+        self.builder.clear()
+
+    def commit(self):
+        self._flush()
+        self.writer.close()
+        if not self.rows:
+            os.remove(self.tmp_path)
+            return False, None, 0
+
+        changed, sha256 = publish_file(self.tmp_path, self.filepath)
+        return changed, sha256, self.rows
+
+    def abort(self):
+        self.writer.close()
+        if self.tmp_path.exists():
+            os.remove(self.tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.abort()
+
+
+def write_records(records, filepath, fieldnames=None):
+    """Salva uma sequência de dicionários em CSV (sep=';') de forma atômica.
+
+    Não depende do pandas: os registros são escritos um a um com o módulo
+    `csv`, então `records` pode ser um gerador. Retorna
+    `(changed, sha256, rows)`.
+    """
+
+    with CSVRecordWriter(filepath, fieldnames) as writer:
+        for record in records:
+            writer.write(record)
+        return writer.commit()
+
+
+def read_records(filepath):
+    """Lê um CSV (sep=';') como uma sequência de dicionários."""
+
+    with open(filepath, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f, delimiter=";")
+
+
+def write_dataframe(df, filepath):
+    """Salva um DataFrame em CSV (sep=';') de forma atômica.
+
+    Retorna `(changed, sha256)`.
+    """
+
+    tmp_path = temp_path_for(filepath)
+    try:
+        df.to_csv(tmp_path, index=False, sep=";")
+        return publish_file(tmp_path, filepath)
+    except BaseException:
+        if tmp_path.exists():
+            os.remove(tmp_path)
+        raise
+
+
+def dataset_key(filepath):
+    """Nome do dataset no manifesto (caminho relativo a `data/`)."""
+
+    filepath = Path(filepath)
+    try:
+        return filepath.relative_to(DATA_DIR).as_posix()
+    except ValueError:
+        return filepath.as_posix()
+
+
+def load_manifest(manifest_path=MANIFEST_PATH):
+    """Lê o manifesto; retorna um dicionário vazio se não existir."""
+
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"datasets": {}}
+
+
+def write_json(data, filepath):
+    """Grava um JSON de forma atômica (temporário + `os.replace`)."""
+
+    filepath = Path(filepath)
+    tmp_path = temp_path_for(filepath)
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True, ensure_ascii=False)
+        f.write("\n")
+    os.replace(tmp_path, filepath)
+
+
+def save_manifest(manifest, manifest_path=MANIFEST_PATH):
+    """Grava o manifesto de forma atômica."""
+
+    write_json(manifest, manifest_path)
+
+
+def record_dataset(filepath, sha256, rows, changed, manifest_path=MANIFEST_PATH):
+    """Registra no manifesto o resultado da extração de um dataset."""
+
+    now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    with manifest_lock(manifest_path):
+        manifest = load_manifest(manifest_path)
+        datasets = manifest.setdefault("datasets", {})
+        key = dataset_key(filepath)
+        entry = datasets.get(key, {})
+
+        entry.update(
+            {
+                "path": Path(filepath).as_posix(),
+                "sha256": sha256,
+                "rows": rows,
+                "extracted_at": now,
+            }
+        )
+        if changed or "changed_at" not in entry:
+            entry["changed_at"] = now
+
+        datasets[key] = entry
+        manifest["extracted_at"] = now
+        manifest["version"] = data_version(manifest)
+        save_manifest(manifest, manifest_path)
+
+    return entry
+
+
+def record_stage(name, info, manifest_path=MANIFEST_PATH):
+    """Registra no manifesto o resultado da execução de um estágio."""
+
+    with manifest_lock(manifest_path):
+        manifest = load_manifest(manifest_path)
+        manifest.setdefault("stages", {})[name] = info
+        save_manifest(manifest, manifest_path)
+
+
+def record_backfill(season, info, manifest_path=MANIFEST_PATH):
+    """Registra no manifesto uma temporada concluída pelo backfill."""
+
+    with manifest_lock(manifest_path):
+        manifest = load_manifest(manifest_path)
+        manifest.setdefault("backfill", {})[str(season)] = info
+        save_manifest(manifest, manifest_path)
+
+
+def directory_hash(directory):
+    """Hash combinado dos arquivos de um diretório (dataset particionado).
+
+    Temporários ocultos de escritas em andamento ficam de fora.
+    """
+
+    directory = Path(directory)
+    digest = hashlib.sha256()
+    for path in sorted(directory.rglob("*")):
+        if path.is_file() and not path.name.startswith("."):
+            name = path.relative_to(directory).as_posix()
+            digest.update(f"{name}:{file_hash(path)}\n".encode())
+    return digest.hexdigest()
+
+
+def dataset_hash(filepath):
+    """Hash atual de um dataset: arquivo ou diretório de partições (`None` se
+    não existir).
+    """
+
+    filepath = Path(filepath)
+    if filepath.is_dir():
+        return directory_hash(filepath)
+    if filepath.exists():
+        return file_hash(filepath)
+    return None
+
+
+def record_partitions(directory, manifest_path=MANIFEST_PATH):
+    """Registra no manifesto um dataset particionado (diretório de Parquet).
+
+    O hash combina o de todas as partições e as linhas vêm dos metadados dos
+    arquivos (sem ler os dados).
+    """
+    import pyarrow.parquet as pq
+
+    directory = Path(directory)
+    if not directory.exists():
+        return None
+
+    sha256 = directory_hash(directory)
+    rows = sum(
+        pq.ParquetFile(part).metadata.num_rows
+        for part in directory.rglob("*.parquet")
+        if not part.name.startswith(".")
+    )
+    stored = load_manifest(manifest_path).get("datasets", {})
+    changed = stored.get(dataset_key(directory), {}).get("sha256") != sha256
+    return record_dataset(directory, sha256, rows, changed, manifest_path)
+
+
+def data_version(manifest):
+    """Versão dos dados: hash combinado dos hashes de todos os datasets."""
+
+    digest = hashlib.sha256()
+    for key, entry in sorted(manifest.get("datasets", {}).items()):
+        digest.update(f"{key}:{entry.get('sha256')}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def commit_writer(writer):
+    """Publica um writer (`CSVRecordWriter`/`ParquetRecordWriter`) e atualiza o
+    manifesto. Retorna `(changed, rows)`.
+    """
+
+    changed, sha256, rows = writer.commit()
+    if sha256 is not None:
+        record_dataset(writer.filepath, sha256, rows, changed)
+    return changed, rows
+
+
+def save_records(records, filepath, fieldnames=None):
+    """Publica uma sequência de registros e atualiza o manifesto.
+
+    Retorna `(changed, rows)`.
+    """
+
+    changed, sha256, rows = write_records(records, filepath, fieldnames)
+    if sha256 is not None:
+        record_dataset(filepath, sha256, rows, changed)
+    return changed, rows
+
+
+def save_records_dataframe(df, filepath):
+    """Publica um DataFrame e atualiza o manifesto. Retorna `changed`."""
+
+    changed, sha256 = write_dataframe(df, filepath)
+    record_dataset(filepath, sha256, len(df), changed)
+    return changed
@@ -0,0 +1,777 @@
+"""
+API local de teste (sem rede) para os extratores.
+
+Serve, no mesmo formato da API da NHL:
+
+- `GET /player/{id}/landing`: do arquivo bruto (`data/raw/player_landing`, ver
+  `archive.py`) quando o jogador está arquivado;
+- `GET /standings-season`, `/schedule/{data}` e `/standings/{data}`: temporadas
+  de 1917-18 até a atual (sem 2004-05, como na API), para o `backfill.py`; o
+  calendário traz a semana de jogos (`gameWeek`) de um rodízio fixo da liga,
+  para o `schedule.py`;
+- `GET /gamecenter/{id}/boxscore`: o boxscore dos jogos desse rodízio (placar
+  igual ao do calendário, elencos fixos por time), para o `games.py`;
+- `GET /gamecenter/{id}/play-by-play`: os lances do mesmo jogo (chutes e gols
+  iguais aos do boxscore, com coordenadas na pista), para o `events.py`;
+- `GET /goalie/summary?...seasonId={temporada}`: o relatório dos goleiros da
+  temporada (os goleiros dos boxscores), para o `extract_goalie.py`.
+
+O que não vem do arquivo é gerado de forma determinística (a mesma resposta em
+toda requisição e em todo processo).
+
+Para apontar os extratores para ela:
+
+    python stub_api.py --port 8765 --latency 0.02 --fail-rate 0.02
+    NHL_API_BASE_URL=http://127.0.0.1:8765 python extract_player.py --shard 1/3
+    NHL_STATS_API_BASE_URL=http://127.0.0.1:8765 python extract_goalie.py
+
+`--fail-rate` responde 503 a uma fração das requisições (o limitador repete)
+e `--missing` responde 404 a uma fração fixa dos jogadores.
+"""
+
+import argparse
+import datetime
+import functools
+import json
+import math
+import random
+import re
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from archive import list_parts, read_part
+
+PLAYER_PATH = re.compile(r"^/player/(\d+)/landing$")
+SCHEDULE_PATH = re.compile(r"^/schedule/(\d{4}-\d{2}-\d{2})$")
+STANDINGS_PATH = re.compile(r"^/standings/(\d{4}-\d{2}-\d{2})$")
+BOXSCORE_PATH = re.compile(r"^/gamecenter/(\d+)/boxscore$")
+PLAY_BY_PLAY_PATH = re.compile(r"^/gamecenter/(\d+)/play-by-play$")
+GOALIE_SUMMARY_PATH = re.compile(r"^/goalie/summary\?.*seasonId=(\d{8})")
+
+# Temporadas sem a data final nos metadados (o backfill consulta o calendário)
+SCHEDULE_ONLY_BEFORE = 1930
+LOCKOUT_SEASONS = {2004}
+
+TEAMS = [
+    ("BOS", "Boston Bruins"),
+    ("EDM", "Edmonton Oilers"),
+    ("MTL", "Montréal Canadiens"),
+    ("NYR", "New York Rangers"),
+    ("TOR", "Toronto Maple Leafs"),
+    ("VAN", "Vancouver Canucks"),
+]
+
+
+def load_archived_players():
+    """Respostas arquivadas do `/player/{id}/landing` (ID → payload)."""
+
+    players = {}
+    for path in list_parts("player_landing"):
+        for entry in read_part(path):
+            players[int(entry["key"])] = entry["payload"]
+    return players
+
+
+def synthetic_player(player_id):
+    """Resposta fictícia (e determinística) do landing de um jogador."""
+
+    rng = random.Random(player_id)
+    abbrev, team_name = rng.choice(TEAMS)
+
+    def totals(season, games):
+        goals = rng.randint(0, games // 2)
+        assists = rng.randint(0, games)
+        shots = goals + rng.randint(0, games * 2)
+        return {
+            "season": season,
+            "gameTypeId": 2,
+            "leagueAbbrev": "NHL",
+            "sequence": 1,
+            "teamName": {"default": team_name},
+            "gamesPlayed": games,
+            "goals": goals,
+            "assists": assists,
+            "points": goals + assists,
+            "plusMinus": rng.randint(-20, 20),
+            "pim": rng.randint(0, 60),
+            "shots": shots,
+            "shootingPctg": round(goals / shots, 4) if shots else 0.0,
+            "powerPlayGoals": rng.randint(0, goals),
+            "powerPlayPoints": rng.randint(0, goals + assists),
+            "shorthandedGoals": 0,
+            "gameWinningGoals": rng.randint(0, goals),
+            "otGoals": 0,
+            "avgToi": f"{rng.randint(8, 24)}:{rng.randint(0, 59):02d}",
+            "faceoffWinningPctg": round(rng.random(), 4),
+        }
+
+    seasons = [
+        totals(20252026 - 10001 * offset, rng.randint(1, 82))
+        for offset in reversed(range(rng.randint(1, 5)))
+    ]
+    current = seasons[-1]
+    return {
+        "playerId": player_id,
+        "headshot": f"https://assets.nhle.com/mugs/nhl/{player_id}.png",
+        "firstName": {"default": f"Jogador{player_id % 1000}"},
+        "lastName": {"default": f"Teste{player_id}"},
+        "sweaterNumber": rng.randint(1, 98),
+        "fullTeamName": {"default": team_name},
+        "currentTeamAbbrev": abbrev,
+        "teamLogo": f"https://assets.nhle.com/logos/nhl/svg/{abbrev}_light.svg",
+        "position": rng.choice("CLRD"),
+        "featuredStats": {
+            "season": current["season"],
+            "regularSeason": {"subSeason": current},
+        },
+        "seasonTotals": seasons,
+    }
+
+
+def season_start(day):
+    """Ano de início da temporada que contém a data (AAAA-MM-DD)."""
+
+    year, month = int(day[:4]), int(day[5:7])
+    return year if month >= 10 else year - 1
+
+
+def season_dates(year):
+    """Início e fim (temporada regular) da temporada iniciada em `year`."""
+
+    return f"{year}-10-07", f"{year + 1}-04-15"
+
+
+def season_metadata():
+    """Resposta fictícia de `/standings-season`."""
+
+    today = datetime.date.today().isoformat()
+    seasons = []
+    for year in range(1917, season_start(today) + 1):
+        if year in LOCKOUT_SEASONS:
+            continue
+        start, end = season_dates(year)
+        season = {"id": int(f"{year}{year + 1}"), "standingsStart": start}
+        if year >= SCHEDULE_ONLY_BEFORE:
+            season["standingsEnd"] = end
+        seasons.append(season)
+    return {"currentDate": today, "seasons": seasons}
+
+
+def synthetic_games(year, number, games):
+    """Jogos fictícios de um time: (lado, resultado, gols pró, gols contra)."""
+
+    rng = random.Random(f"games-{year}-{number}")
+    strength = rng.uniform(0.35, 0.65)
+    results = []
+    for game in range(games):
+        side = "home" if game % 2 == 0 else "road"
+        goals = rng.randint(1, 5)
+        if rng.random() < strength:
+            results.append((side, "Wins", goals, rng.randint(0, goals - 1)))
+        elif year >= 1999 and rng.random() < 0.2:
+            results.append((side, "OtLosses", goals, goals + 1))
+        elif year < 2005 and rng.random() < 0.2:
+            results.append((side, "Ties", goals, goals))
+        else:
+            results.append((side, "Losses", goals - 1, goals + rng.randint(0, 2)))
+    return results
+
+
+def league_size(year):
+    """Número de times e de jogos por time da temporada iniciada em `year`."""
+
+    teams = 6 if year < 1967 else min(32, 12 + (year - 1967) // 3)
+    games = 82 if year >= 1995 else 48 if year < 1942 else 70
+    return teams, games
+
+
+@functools.lru_cache(maxsize=8)
+def league_schedule(year):
+    """Calendário fictício (e determinístico) da temporada: data → jogos.
+
+    Rodízio pelo método do círculo (com folga para número ímpar de times),
+    repetido até todos os times completarem os jogos da temporada; as rodadas
+    são espalhadas entre o início e o fim da temporada regular e o mando
+    alterna a cada volta.
+    """
+
+    teams, games = league_size(year)
+    slots = list(range(teams)) + ([None] if teams % 2 else [])
+    played = [0] * teams
+    rounds = []
+    while min(played) < games:
+        pairs = []
+        for index in range(len(slots) // 2):
+            first, second = slots[index], slots[-1 - index]
+            if first is None or second is None:
+                continue
+            if played[first] >= games or played[second] >= games:
+                continue
+            played[first] += 1
+            played[second] += 1
+            home_first = (len(rounds) // (len(slots) - 1) + index) % 2 == 0
+            pairs.append((first, second) if home_first else (second, first))
+        rounds.append(pairs)
+        slots = [slots[0], slots[-1], *slots[1:-1]]
+
+    start, end = (datetime.date.fromisoformat(value) for value in season_dates(year))
+    span = (end - start).days
+    rng = random.Random(f"schedule-{year}")
+    schedule = {}
+    number = 0
+    for index, pairs in enumerate(rounds):
+        day = start + datetime.timedelta(days=index * span // len(rounds))
+        for home, away in pairs:
+            number += 1
+            home_score, away_score = rng.randint(0, 6), rng.randint(0, 6)
+            if home_score == away_score:
+                home_score += rng.choice((-1, 1)) if home_score else 1
+            schedule.setdefault(day.isoformat(), []).append(
+                {
+                    "id": int(f"{year}02{number:04d}"),
+                    "season": int(f"{year}{year + 1}"),
+                    "gameType": 2,
+                    "home": (f"T{home:02d}", home_score),
+                    "away": (f"T{away:02d}", away_score),
+                }
+            )
+    return schedule
+
+
+@functools.lru_cache(maxsize=8)
+def league_games(year):
+    """Jogos do calendário fictício da temporada: ID → (data, jogo)."""
+
+    return {
+        game["id"]: (date, game)
+        for date, games in league_schedule(year).items()
+        for game in games
+    }
+
+
+# Elenco fictício de cada time: atacantes, defensores e goleiros
+ROSTER_SLOTS = [("forwards", "CLR")] * 12 + [("defense", "D")] * 6
+
+
+def synthetic_boxscore(game_id):
+    """Resposta fictícia (e determinística) de `/gamecenter/{id}/boxscore`.
+
+    Jogos de hoje em diante vêm sem estatísticas dos jogadores (`FUT`);
+    `None` se o jogo não existe.
+    """
+
+    year = int(str(game_id)[:4])
+    date, game = league_games(year).get(game_id, (None, None))
+    if game is None:
+        return None
+
+    final = date < datetime.date.today().isoformat()
+    rng = random.Random(f"boxscore-{game_id}")
+    box = {
+        "id": game_id,
+        "season": game["season"],
+        "gameType": game["gameType"],
+        "gameDate": date,
+        "gameState": "OFF" if final else "FUT",
+    }
+    if not final:
+        for side in ("home", "away"):
+            box[f"{side}Team"] = {"abbrev": game[side][0]}
+        return box
+
+    scores = {side: game[side][1] for side in ("home", "away")}
+    stats = {}
+    sog = {}
+    for side in ("home", "away"):
+        abbrev = game[side][0]
+        number = int(abbrev[1:])
+        skaters = []
+        for slot, (group, positions) in enumerate(ROSTER_SLOTS):
+            skaters.append(
+                {
+                    "playerId": 8_400_000 + number * 100 + slot,
+                    "sweaterNumber": slot + 2,
+                    "name": {"default": f"{abbrev} Jogador{slot}"},
+                    "position": positions[slot % len(positions)],
+                    "goals": 0,
+                    "assists": 0,
+                    "points": 0,
+                    "plusMinus": 0,
+                    "pim": rng.choice((0, 0, 0, 2, 4)),
+                    "hits": rng.randint(0, 5),
+                    "powerPlayGoals": 0,
+                    "sog": rng.randint(0, 4),
+                    "faceoffWinningPctg": (
+                        round(rng.random(), 4) if group == "forwards" else 0.0
+                    ),
+                    "toi": f"{rng.randint(8, 25)}:{rng.randint(0, 59):02d}",
+                    "blockedShots": rng.randint(0, 3),
+                    "shifts": rng.randint(12, 30),
+                    "giveaways": rng.randint(0, 2),
+                    "takeaways": rng.randint(0, 2),
+                    "_group": group,
+                }
+            )
+        for _ in range(scores[side]):
+            scorer, *helpers = rng.sample(skaters, 3)
+            scorer["goals"] += 1
+            scorer["sog"] += 1
+            scorer["powerPlayGoals"] += rng.random() < 0.2
+            for helper in helpers[: rng.randint(0, 2)]:
+                helper["assists"] += 1
+        for skater in skaters:
+            skater["points"] = skater["goals"] + skater["assists"]
+        stats[side] = skaters
+        sog[side] = sum(skater["sog"] for skater in skaters)
+
+    box["gameOutcome"] = {
+        "lastPeriodType": (
+            "OT"
+            if abs(scores["home"] - scores["away"]) == 1 and rng.random() < 0.23
+            else "REG"
+        )
+    }
+    box["playerByGameStats"] = {}
+    for side, other in (("home", "away"), ("away", "home")):
+        abbrev, number = game[side][0], int(game[side][0][1:])
+        box[f"{side}Team"] = {"abbrev": abbrev, "score": scores[side], "sog": sog[side]}
+        saves = sog[other] - scores[other]
+        goalies = [
+            {
+                "playerId": 8_400_000 + number * 100 + len(ROSTER_SLOTS) + slot,
+                "sweaterNumber": 30 + slot,
+                "name": {"default": f"{abbrev} Goleiro{slot}"},
+                "position": "G",
+                "saveShotsAgainst": f"{saves}/{sog[other]}",
+                "savePctg": round(saves / sog[other], 6) if sog[other] else 0.0,
+                "goalsAgainst": scores[other],
+                "shotsAgainst": sog[other],
+                "saves": saves,
+                "pim": 0,
+                "toi": "60:00",
+                "starter": True,
+            }
+            for slot in [rng.randint(0, 1)]
+        ]
+        groups = {"forwards": [], "defense": [], "goalies": goalies}
+        for skater in stats[side]:
+            groups[skater.pop("_group")].append(skater)
+        box["playerByGameStats"][f"{side}Team"] = groups
+    return box
+
+
+def synthetic_goalie_summary(season):
+    """Resposta fictícia do relatório `goalie/summary` de uma temporada.
+
+    Dois goleiros por time do rodízio (os mesmos IDs dos boxscores), que
+    dividem os jogos da temporada; vazia para temporadas que não começaram.
+    """
+
+    year = int(str(season)[:4])
+    if year > season_start(datetime.date.today().isoformat()):
+        return {"data": [], "total": 0}
+
+    teams, games = league_size(year)
+    goalies = []
+    for number in range(teams):
+        rng = random.Random(f"goalies-{season}-{number}")
+        starter = rng.randint(int(games * 0.55), int(games * 0.75))
+        for slot, played in enumerate((starter, games - starter)):
+            player_id = 8_400_000 + number * 100 + len(ROSTER_SLOTS) + slot
+            wins = rng.randint(int(played * 0.35), int(played * 0.6))
+            ot_losses = rng.randint(0, (played - wins) // 4)
+            shots = played * rng.randint(26, 32)
+            goals = round(shots * (1 - rng.uniform(0.885, 0.925)))
+            toi = played * 3600 - rng.randint(0, played * 60)
+            goalies.append(
+                {
+                    "playerId": player_id,
+                    "seasonId": int(season),
+                    "goalieFullName": f"T{number:02d} Goleiro{slot}",
+                    "lastName": f"Goleiro{slot}",
+                    "teamAbbrevs": f"T{number:02d}",
+                    "shootsCatches": rng.choice("LR"),
+                    "gamesPlayed": played,
+                    "gamesStarted": played,
+                    "wins": wins,
+                    "losses": played - wins - ot_losses,
+                    "otLosses": ot_losses,
+                    "ties": None,
+                    "shotsAgainst": shots,
+                    "saves": shots - goals,
+                    "goalsAgainst": goals,
+                    "goalsAgainstAverage": goals * 3600 / toi if toi else 0.0,
+                    "savePct": (shots - goals) / shots if shots else None,
+                    "shutouts": rng.randint(0, played // 12),
+                    "timeOnIce": toi,
+                    "goals": 0,
+                    "assists": rng.randint(0, 3),
+                    "points": 0,
+                    "penaltyMinutes": rng.choice((0, 0, 2, 4)),
+                }
+            )
+    goalies.sort(key=lambda goalie: goalie["wins"], reverse=True)
+    return {"data": goalies, "total": len(goalies)}
+
+
+# Códigos dos tipos de lance na API
+PLAY_TYPES = {
+    "faceoff": 502,
+    "hit": 503,
+    "goal": 505,
+    "shot-on-goal": 506,
+    "missed-shot": 507,
+    "blocked-shot": 508,
+}
+
+
+def synthetic_play_by_play(game_id):
+    """Resposta fictícia (e determinística) de `/gamecenter/{id}/play-by-play`.
+
+    Os chutes, gols e hits de cada jogador são os do boxscore; o mandante
+    defende o lado esquerdo nos períodos ímpares e as coordenadas (em pés,
+    centro da pista na origem) ficam do lado ofensivo de quem chuta.
+    """
+
+    box = synthetic_boxscore(game_id)
+    if box is None or "playerByGameStats" not in box:
+        return box
+
+    rng = random.Random(f"play-by-play-{game_id}")
+    team_ids = {
+        side: int(box[f"{side}Team"]["abbrev"][1:]) + 1 for side in ("home", "away")
+    }
+    roster, plays = [], []
+
+    def play(kind, side, details, x=None, y=None):
+        period = rng.randint(1, 3)
+        home_defends = "left" if period % 2 else "right"
+        if x is not None and (side == "home") != (home_defends == "left"):
+            # Ataca para o lado esquerdo (x negativo)
+            x, y = -x, -y
+        plays.append(
+            {
+                "periodDescriptor": {"number": period, "periodType": "REG"},
+                "timeInPeriod": f"{rng.randint(0, 19):02d}:{rng.randint(0, 59):02d}",
+                "situationCode": "1551",
+                "homeTeamDefendingSide": home_defends,
+                "typeCode": PLAY_TYPES[kind],
+                "typeDescKey": kind,
+                "details": {
+                    "eventOwnerTeamId": team_ids[side],
+                    **({"xCoord": x, "yCoord": y} if x is not None else {}),
+                    **details,
+                },
+            }
+        )
+
+    def location(goal):
+        # Distância até o gol (x = 89) e ângulo; gols saem mais perto
+        distance = rng.uniform(4, 25 if goal else 60)
+        angle = rng.uniform(-1.2, 1.2)
+        x = round(max(25, 89 - distance * math.cos(angle)))
+        y = round(max(-42, min(42, distance * math.sin(angle))))
+        return x, y
+
+    groups = {
+        side: box["playerByGameStats"][f"{side}Team"] for side in ("home", "away")
+    }
+    for side, other in (("home", "away"), ("away", "home")):
+        skaters = groups[side]["forwards"] + groups[side]["defense"]
+        goalie = groups[other]["goalies"][0]["playerId"]
+        blockers = groups[other]["forwards"] + groups[other]["defense"]
+        for player in skaters + groups[side]["goalies"]:
+            roster.append(
+                {
+                    "teamId": team_ids[side],
+                    "playerId": player["playerId"],
+                    "sweaterNumber": player["sweaterNumber"],
+                    "positionCode": player["position"],
+                }
+            )
+        for player in skaters:
+            shooter = player["playerId"]
+            for shot in range(player["sog"]):
+                goal = shot < player["goals"]
+                kind = "goal" if goal else "shot-on-goal"
+                shooter_key = "scoringPlayerId" if goal else "shootingPlayerId"
+                details = {
+                    shooter_key: shooter,
+                    "goalieInNetId": goalie,
+                    "shotType": rng.choice(("wrist", "snap", "slap", "backhand")),
+                    "zoneCode": "O",
+                }
+                play(kind, side, details, *location(goal))
+            for _ in range(rng.randint(0, 2)):
+                details = {"shootingPlayerId": shooter, "zoneCode": "O"}
+                play("missed-shot", side, details, *location(False))
+            for _ in range(rng.randint(0, 2)):
+                details = {
+                    "shootingPlayerId": shooter,
+                    "blockingPlayerId": rng.choice(blockers)["playerId"],
+                    "zoneCode": "O",
+                }
+                # Bloqueio: o dono do lance é o time que bloqueou
+                play("blocked-shot", side, details, *location(False))
+                plays[-1]["details"]["eventOwnerTeamId"] = team_ids[other]
+            for _ in range(player["hits"]):
+                details = {
+                    "hittingPlayerId": shooter,
+                    "hitteePlayerId": rng.choice(blockers)["playerId"],
+                }
+                play("hit", side, details, rng.randint(-99, 99), rng.randint(-42, 42))
+
+    centers = {
+        side: [p for p in groups[side]["forwards"] if p["position"] == "C"]
+        for side in ("home", "away")
+    }
+    for _ in range(rng.randint(45, 70)):
+        side, other = rng.choice((("home", "away"), ("away", "home")))
+        details = {
+            "winningPlayerId": rng.choice(centers[side])["playerId"],
+            "losingPlayerId": rng.choice(centers[other])["playerId"],
+        }
+        play("faceoff", side, details, rng.choice((-69, 0, 69)), rng.choice((-22, 22)))
+
+    plays.sort(key=lambda p: (p["periodDescriptor"]["number"], p["timeInPeriod"]))
+    for number, entry in enumerate(plays, start=1):
+        entry["eventId"] = number
+        entry["sortOrder"] = number
+
+    return {
+        "id": game_id,
+        "season": box["season"],
+        "gameType": box["gameType"],
+        "gameDate": box["gameDate"],
+        "gameState": box["gameState"],
+        **{
+            f"{side}Team": {"id": team_ids[side], **box[f"{side}Team"]}
+            for side in ("home", "away")
+        },
+        "rosterSpots": roster,
+        "plays": plays,
+    }
+
+
+def synthetic_schedule(day):
+    """Resposta fictícia de `/schedule/{data}`: a semana a partir de `day`.
+
+    Jogos de datas anteriores a hoje vêm encerrados (com placar); os demais,
+    futuros.
+    """
+
+    year = season_start(day)
+    start, end = season_dates(year)
+    today = datetime.date.today().isoformat()
+    schedule = {} if year in LOCKOUT_SEASONS else league_schedule(year)
+
+    first = datetime.date.fromisoformat(day)
+    week = []
+    for offset in range(7):
+        date = (first + datetime.timedelta(days=offset)).isoformat()
+        games = []
+        for game in schedule.get(date, []):
+            final = date < today
+            games.append(
+                {
+                    "id": game["id"],
+                    "season": game["season"],
+                    "gameType": game["gameType"],
+                    "gameState": "OFF" if final else "FUT",
+                    **{
+                        f"{side}Team": {
+                            "abbrev": game[side][0],
+                            **({"score": game[side][1]} if final else {}),
+                        }
+                        for side in ("home", "away")
+                    },
+                }
+            )
+        week.append({"date": date, "games": games})
+
+    return {
+        "nextStartDate": (first + datetime.timedelta(days=7)).isoformat(),
+        "regularSeasonStartDate": start,
+        "regularSeasonEndDate": end,
+        "gameWeek": week,
+    }
+
+
+def synthetic_standings(day):
+    """Resposta fictícia (e determinística) de `/standings/{data}`.
+
+    Cada time tem uma sequência fixa de jogos por temporada; a classificação
+    de uma data soma os jogos disputados até ela.
+    """
+
+    year = season_start(day)
+    if year in LOCKOUT_SEASONS:
+        return {"standings": []}
+
+    start, end = (datetime.date.fromisoformat(value) for value in season_dates(year))
+    progress = (datetime.date.fromisoformat(day) - start) / (end - start)
+    progress = min(1.0, max(0.0, progress))
+
+    teams, games = league_size(year)
+    standings = []
+    for number in range(teams):
+        abbrev = f"T{number:02d}"
+        jitter = (number % 3) - 1 if 0 < progress < 1 else 0
+        played = min(games, max(0, round(progress * games) + jitter))
+
+        sides = {
+            side: dict.fromkeys(
+                ["GamesPlayed", "Wins", "Losses", "OtLosses", "Ties"]
+                + ["GoalsFor", "GoalsAgainst"],
+                0,
+            )
+            for side in ("home", "road")
+        }
+        for side, result, goals_for, goals_against in synthetic_games(
+            year, number, games
+        )[:played]:
+            sides[side]["GamesPlayed"] += 1
+            sides[side][result] += 1
+            sides[side]["GoalsFor"] += goals_for
+            sides[side]["GoalsAgainst"] += goals_against
+
+        home, road = sides["home"], sides["road"]
+        wins = home["Wins"] + road["Wins"]
+        ot_losses = home["OtLosses"] + road["OtLosses"]
+        ties = home["Ties"] + road["Ties"]
+        points = 2 * wins + ot_losses + ties
+        standings.append(
+            {
+                "seasonId": int(f"{year}{year + 1}"),
+                "teamLogo": f"https://assets.nhle.com/logos/nhl/svg/{abbrev}_light.svg",
+                "teamName": {"default": f"Time {number:02d}"},
+                "teamAbbrev": {"default": abbrev},
+                "divisionName": ["Atlantic", "Metropolitan", "Central", "Pacific"][
+                    number % 4
+                ],
+                "gamesPlayed": played,
+                "wins": wins,
+                "losses": home["Losses"] + road["Losses"],
+                "ties": ties,
+                "otLosses": ot_losses,
+                "points": points,
+                "pointPctg": round(points / (2 * played), 6) if played else 0.0,
+                "goalFor": home["GoalsFor"] + road["GoalsFor"],
+                "goalAgainst": home["GoalsAgainst"] + road["GoalsAgainst"],
+                **{
+                    f"{side}{key}": value
+                    for side, values in sides.items()
+                    for key, value in values.items()
+                    if key != "Ties"
+                },
+            }
+        )
+    standings.sort(key=lambda team: team["points"], reverse=True)
+    return {"standings": standings}
+
+
+class StubAPI(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency=0.0, fail_rate=0.0, missing=0.0):
+        super().__init__(address, StubHandler)
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.missing = missing
+        self.archived = load_archived_players()
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def is_missing(self, player_id):
+        # Mesmo conjunto de jogadores ausentes em toda requisição
+        return (
+            zlib.crc32(f"missing-{player_id}".encode()) % 10_000 < self.missing * 10_000
+        )
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+
+        if server.latency:
+            time.sleep(server.latency)
+
+        if random.random() < server.fail_rate:
+            self.send_json(503, {"error": "unavailable"})
+            return
+
+        if self.path == "/standings-season":
+            self.send_json(200, season_metadata())
+            return
+        if match := SCHEDULE_PATH.match(self.path):
+            self.send_json(200, synthetic_schedule(match.group(1)))
+            return
+        if match := STANDINGS_PATH.match(self.path):
+            self.send_json(200, synthetic_standings(match.group(1)))
+            return
+        if match := GOALIE_SUMMARY_PATH.match(self.path):
+            self.send_json(200, synthetic_goalie_summary(match.group(1)))
+            return
+        for pattern, synthetic in (
+            (BOXSCORE_PATH, synthetic_boxscore),
+            (PLAY_BY_PLAY_PATH, synthetic_play_by_play),
+        ):
+            if match := pattern.match(self.path):
+                game = synthetic(int(match.group(1)))
+                if game is None:
+                    self.send_json(404, {"error": "game not found"})
+                else:
+                    self.send_json(200, game)
+                return
+
+        match = PLAYER_PATH.match(self.path)
+        if not match:
+            self.send_json(404, {"error": "not found"})
+            return
+
+        player_id = int(match.group(1))
+        if server.is_missing(player_id):
+            self.send_json(404, {"error": "player not found"})
+            return
+        payload = server.archived.get(player_id) or synthetic_player(player_id)
+        self.send_json(200, payload)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API local de teste")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="segundos")
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--missing", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = StubAPI(
+        ("127.0.0.1", args.port), args.latency, args.fail_rate, args.missing
+    )
+    print(f"🧪 API de teste em http://127.0.0.1:{args.port}")
+    print(f"📦 {len(server.archived)} jogadores do arquivo bruto")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"\n📊 {server.requests} requisições atendidas")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+"""
+Fixtures compartilhadas pelos testes.
+
+Os caminhos de `config.py` são relativos (`data/...`), então cada teste roda
+em um diretório temporário próprio: dados, manifesto e arquivo bruto nunca
+tocam o `data/` do repositório.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    """Diretório `data/` vazio e isolado do teste."""
+
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "data"
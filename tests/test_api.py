@@ -0,0 +1,151 @@
+"""API de dados: rotas, erros e ETag/304."""
+
+import http.client
+import json
+import threading
+
+import pandas as pd
+import pytest
+
+import extract_player
+from api import LEADER_FIELDS, DataAPI, filter_rows
+from config import PLAYER_ALL_PATH, PLAYER_SEASONS_PATH
+from extract_team import SimpleNHLExtractor
+from stub_api import synthetic_player, synthetic_standings
+
+
+def save_standings(day):
+    SimpleNHLExtractor().save_standings(synthetic_standings(day), day)
+
+
+def save_players(player_ids):
+    extractor = extract_player.SimpleNHLExtractor()
+    parsed = (extractor.parse_player(synthetic_player(i)) for i in player_ids)
+    extractor.save_data(parsed, PLAYER_ALL_PATH, PLAYER_SEASONS_PATH)
+
+
+@pytest.fixture
+def api():
+    """API servindo uma temporada de classificação e alguns jogadores, em uma
+    thread.
+    """
+
+    save_standings("2024-04-18")
+    save_players(range(8478400, 8478420))
+    server = DataAPI(("127.0.0.1", 0))
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def get(server, url, etag=None):
+    """GET na API; retorna `(status, cabeçalhos, corpo)`."""
+
+    connection = http.client.HTTPConnection(*server.server_address)
+    headers = {"If-None-Match": etag} if etag else {}
+    connection.request("GET", url, headers=headers)
+    response = connection.getresponse()
+    body = response.read()
+    connection.close()
+    return response.status, response.headers, body
+
+
+def test_routes(api):
+    status, _, body = get(api, "/seasons")
+    assert status == 200
+    assert json.loads(body)["data"] == ["20232024"]
+
+    status, _, body = get(api, "/standings/20232024?limit=5&fields=team_name,wins")
+    page = json.loads(body)
+    assert status == 200
+    assert page["total"] == len(synthetic_standings("2024-04-18")["standings"])
+    assert len(page["data"]) == 5
+    assert set(page["data"][0]) == {"team_name", "wins"}
+
+    status, _, body = get(api, "/standings/20232024?division=Pacific&limit=100")
+    divisions = {team["divisionName"] for team in json.loads(body)["data"]}
+    assert divisions == {"Pacific"}
+
+
+@pytest.mark.parametrize(
+    ("url", "status"),
+    [
+        ("/nope", 404),
+        ("/standings/19992000", 404),
+        ("/goalies", 404),
+        ("/standings/20232024?limit=abc", 400),
+        ("/standings/20232024?fields=nope", 400),
+        ("/standings/20232024?fields=wins,wins", 400),
+        ("/standings/20232024?sort=-wins,wins", 400),
+        ("/players?fields=goals,goals", 400),
+        ("/players?fields=-goals", 400),
+        ("/players/8478400?fields=-goals", 400),
+    ],
+)
+def test_errors(api, url, status):
+    response_status, headers, body = get(api, url)
+
+    assert response_status == status
+    assert "error" in json.loads(body)
+    assert headers["ETag"] is None
+
+
+def test_leaders_of_a_default_column(api):
+    status, _, body = get(api, "/leaders/gamesPlayed?limit=5")
+    page = json.loads(body)
+
+    assert status == 200
+    assert list(page["data"][0]) == ["rank", *LEADER_FIELDS]
+    games = [player["gamesPlayed"] for player in page["data"]]
+    assert games == sorted(games, reverse=True)
+
+
+def test_etag_and_not_modified(api):
+    status, headers, _ = get(api, "/seasons")
+    etag = headers["ETag"]
+    assert status == 200
+    assert etag == f'"{api.store.version}"'
+
+    status, headers, body = get(api, "/seasons", etag)
+    assert (status, body) == (304, b"")
+    assert headers["ETag"] == etag
+    assert get(api, "/seasons", f'W/{etag}, "outra"')[0] == 304
+    assert get(api, "/seasons", '"outra"')[0] == 200
+
+
+def test_not_modified_only_for_valid_routes(api):
+    etag = get(api, "/")[1]["ETag"]
+
+    assert get(api, "/nope", etag)[0] == 404
+    assert get(api, "/standings/20232024?limit=abc", etag)[0] == 400
+    assert get(api, "/nope", "*")[0] == 404
+
+
+def test_new_data_version_changes_the_etag(api):
+    etag = get(api, "/standings/20232024")[1]["ETag"]
+
+    save_standings("2024-01-15")
+
+    status, headers, body = get(api, "/standings/20232024", etag)
+    assert status == 200
+    assert headers["ETag"] != etag
+    final = {
+        team["gamesPlayed"] for team in synthetic_standings("2024-04-18")["standings"]
+    }
+    assert {team["gamesPlayed"] for team in json.loads(body)["data"]} != final
+
+
+def test_filter_rows_matches_traded_players_by_membership():
+    goalies = pd.DataFrame(
+        {"playerId": [1, 2, 3, 4], "teamAbbrevs": ["TOR,BOS", "BOS", "TOR", None]}
+    )
+
+    filtered = filter_rows(
+        goalies, {"team": "BOS"}, {"team": "teamAbbrevs"}, multi={"teamAbbrevs"}
+    )
+
+    assert filtered["playerId"].tolist() == [1, 2]
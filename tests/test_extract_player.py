@@ -0,0 +1,164 @@
+"""Extração em shards (`--shard i/N`) e junção (`merge_shards`)."""
+
+import argparse
+
+import pyarrow.parquet as pq
+import pytest
+
+import extract_player
+from config import (
+    PLAYER_ALL_PATH,
+    PLAYER_SEASONS_PATH,
+    player_id_path,
+    player_shard_paths,
+)
+from storage import read_records, save_records
+
+SEASON = "20252026"
+PLAYER_IDS = [8478402, 8477934, 8479318, 8480069, 8481533, 8476453, 8482116]
+
+
+def landing(player_id):
+    """Resposta mínima de `/player/{id}/landing`."""
+
+    return {
+        "playerId": player_id,
+        "firstName": {"default": "Jogador"},
+        "lastName": {"default": str(player_id)},
+        "position": "C",
+        "featuredStats": {
+            "season": int(SEASON),
+            "regularSeason": {
+                "subSeason": {"gamesPlayed": 10, "points": player_id % 40}
+            },
+        },
+        "seasonTotals": [
+            {"season": season, "gameTypeId": 2, "leagueAbbrev": "NHL", "points": 1}
+            for season in (20242025, 20252026)
+        ],
+    }
+
+
+@pytest.fixture(autouse=True)
+def offline(monkeypatch):
+    """Lista de IDs gravada e API substituída pelas respostas de `landing`."""
+
+    save_records(
+        ({"playerId": player_id} for player_id in PLAYER_IDS), player_id_path(SEASON)
+    )
+    monkeypatch.setattr(
+        extract_player.SimpleNHLExtractor,
+        "fetch_player_data",
+        lambda self, player_id: landing(player_id),
+    )
+
+
+def extract_shards(count, shards=None):
+    for index in shards or range(1, count + 1):
+        extract_player.main(SEASON, (index, count))
+
+
+def merged_ids():
+    return [int(record["playerId"]) for record in read_records(PLAYER_ALL_PATH)]
+
+
+def test_shards_partition_the_id_list():
+    count = 3
+    extract_shards(count)
+
+    extracted = []
+    for index in range(1, count + 1):
+        players_path, _ = player_shard_paths(index, count)
+        shard = [int(r["playerId"]) for r in read_records(players_path)]
+        assert all(extract_player.shard_of(p, count) == index for p in shard)
+        extracted += shard
+    assert sorted(extracted) == sorted(PLAYER_IDS)
+
+
+@pytest.mark.parametrize("value", ["1", "a/4", "0/4", "5/4", "1/2/3"])
+def test_parse_shard_rejects_invalid_values(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        extract_player.parse_shard(value)
+
+
+def test_merge_matches_the_id_list_order():
+    extract_shards(3)
+
+    assert extract_player.merge_shards(SEASON, 3) == len(PLAYER_IDS)
+
+    assert merged_ids() == PLAYER_IDS
+    seasons = pq.read_table(PLAYER_SEASONS_PATH)
+    assert seasons["playerId"].to_pylist() == [
+        player_id for player_id in PLAYER_IDS for _ in range(2)
+    ]
+
+
+def test_merge_keeps_the_first_shard_of_a_duplicated_player():
+    extract_shards(2)
+    # O mesmo jogador, com outros dados, também no shard 2
+    duplicate = next(p for p in PLAYER_IDS if extract_player.shard_of(p, 2) == 1)
+    players_path, _ = player_shard_paths(2, 2)
+    records = list(read_records(players_path))
+    save_records(
+        [*records, {**records[0], "playerId": duplicate, "points": 999}], players_path
+    )
+    extract_player.write_shard_stamp(SEASON, 2, 2)
+
+    extract_player.merge_shards(SEASON, 2)
+
+    merged = {int(r["playerId"]): r for r in read_records(PLAYER_ALL_PATH)}
+    assert merged_ids() == PLAYER_IDS
+    assert merged[duplicate]["points"] != "999"
+
+
+def test_merge_treats_a_shard_without_players_as_empty():
+    # Com muitos shards, algum não fica com nenhum jogador da lista
+    count = 50
+    owners = {extract_player.shard_of(player_id, count) for player_id in PLAYER_IDS}
+    empty = next(index for index in range(1, count + 1) if index not in owners)
+    extract_shards(count)
+
+    assert not any(path.exists() for path in player_shard_paths(empty, count))
+    assert extract_player.merge_shards(SEASON, count) == len(PLAYER_IDS)
+    assert merged_ids() == PLAYER_IDS
+
+
+def test_merge_requires_every_shard_to_finish():
+    extract_shards(3, shards=[1, 3])
+
+    with pytest.raises(FileNotFoundError, match="shard-2-of-3"):
+        extract_player.merge_shards(SEASON, 3)
+
+
+def test_merge_rejects_shards_from_another_id_list():
+    extract_shards(2)
+    save_records(
+        ({"playerId": player_id} for player_id in PLAYER_IDS[:-1]),
+        player_id_path(SEASON),
+    )
+
+    with pytest.raises(ValueError, match="outra lista de IDs"):
+        extract_player.merge_shards(SEASON, 2)
+
+
+def test_merge_rejects_a_shard_file_changed_after_the_stamp():
+    extract_shards(2)
+    players_path, _ = player_shard_paths(1, 2)
+    save_records(list(read_records(players_path))[:1], players_path)
+
+    with pytest.raises(ValueError, match="carimbo"):
+        extract_player.merge_shards(SEASON, 2)
+
+
+def test_rerun_without_players_discards_the_previous_shard_files(monkeypatch):
+    extract_shards(2)
+    monkeypatch.setattr(
+        extract_player.SimpleNHLExtractor, "fetch_player_data", lambda self, p: None
+    )
+    extract_shards(2, shards=[1])
+
+    assert not any(path.exists() for path in player_shard_paths(1, 2))
+    with pytest.raises(ValueError, match="sem dados"):
+        extract_player.merge_shards(SEASON, 2)
+    extract_player.merge_shards(SEASON, 2, allow_missing=True)
+    assert all(extract_player.shard_of(p, 2) == 2 for p in merged_ids())
@@ -0,0 +1,113 @@
+"""Simulação das chances de playoff (`PlayoffSimulator`)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from playoffs import SEASON_GAMES, PlayoffSimulator
+
+DIVISIONS = ["Atlantic", "Metropolitan", "Central", "Pacific"]
+
+
+def league(played=SEASON_GAMES):
+    """32 times, 8 por divisão; dentro de cada divisão os pontos caem de 1
+    em 1, e o Atlantic e o Central são mais fortes que as outras divisões.
+    """
+
+    teams = []
+    for number in range(32):
+        division = DIVISIONS[number // 8]
+        base = 120 if division in ("Atlantic", "Central") else 100
+        abbrev = f"T{number:02d}"
+        teams.append(
+            {
+                "team_logo": f"https://assets.nhle.com/logos/nhl/svg/{abbrev}_light.svg",
+                "team_name": f"Time {number:02d}",
+                "divisionName": division,
+                "gamesPlayed": played,
+                "wins": 40,
+                "team_points": base - number % 8,
+                "goalFor": 250,
+                "goalAgainst": 250,
+            }
+        )
+    return pd.DataFrame(teams)
+
+
+def test_final_standings_take_three_per_division_and_two_wild_cards():
+    odds = PlayoffSimulator(league()).run(simulations=200).set_index("team")
+
+    in_playoffs = set(odds.index[odds["playoffProb"] == 1])
+    assert set(odds.index[odds["playoffProb"] == 0]) == set(odds.index) - in_playoffs
+    # Top 3 de cada divisão
+    for first in (0, 8, 16, 24):
+        assert {f"T{first + n:02d}" for n in range(3)} <= in_playoffs
+    # Wild cards: 4º e 5º das divisões fortes, não o 4º das fracas
+    assert {"T03", "T04", "T19", "T20"} <= in_playoffs
+    assert not {"T05", "T11", "T21", "T27"} & in_playoffs
+    assert len(in_playoffs) == 16
+
+    assert set(odds.index[odds["divisionProb"] == 1]) == {"T00", "T08", "T16", "T24"}
+    assert odds["presidentsProb"].sum() == pytest.approx(1.0)
+    assert odds.loc[["T00", "T16"], "presidentsProb"].sum() == pytest.approx(1.0)
+
+
+def test_remaining_games_without_schedule():
+    teams = league(played=60)
+    teams.loc[0, "gamesPlayed"] = SEASON_GAMES + 2
+
+    simulator = PlayoffSimulator(teams)
+
+    expected = np.full(32, SEASON_GAMES - 60)
+    expected[0] = 0
+    assert simulator.remaining.tolist() == expected.tolist()
+    odds = simulator.run(simulations=100)
+    assert (odds["projectedPoints"] >= odds["team_points"]).all()
+
+
+def test_remaining_games_come_from_the_schedule():
+    games = pd.DataFrame(
+        {
+            "homeTeam": ["T00", "T01", "T00", "XXX"],
+            "awayTeam": ["T01", "T02", "T02", "T00"],
+        }
+    )
+
+    simulator = PlayoffSimulator(league(played=80), games)
+
+    # Jogo com time desconhecido (XXX) é ignorado
+    assert simulator.remaining[:4].tolist() == [2, 2, 2, 0]
+    assert simulator.away_games[:4].tolist() == [0, 1, 2, 0]
+    assert simulator.remaining[4:].sum() == 0
+    odds = simulator.run(simulations=500).set_index("team")
+    gained = odds["projectedPoints"] - odds["team_points"]
+    assert gained["T03"] == 0
+    assert 0 < gained["T00"] <= 2 * 2
+
+
+def test_probabilities_add_up_per_simulation_and_repeat_with_the_seed():
+    simulator = PlayoffSimulator(league(played=60))
+
+    odds = simulator.run(simulations=2_000, seed=7)
+
+    # Em cada simulação: 16 vagas, 4 campeões de divisão e 1 Presidents' Trophy
+    assert odds["playoffProb"].sum() == pytest.approx(16)
+    assert odds["divisionProb"].sum() == pytest.approx(4)
+    assert odds["presidentsProb"].sum() == pytest.approx(1)
+    assert (odds["divisionProb"] <= odds["playoffProb"]).all()
+    pd.testing.assert_frame_equal(odds, simulator.run(simulations=2_000, seed=7))
+
+
+def test_standings_without_the_simulation_columns_raise_value_error():
+    legacy = league()[["team_logo", "team_name", "gamesPlayed", "team_points"]]
+
+    with pytest.raises(ValueError, match="divisionName"):
+        PlayoffSimulator(legacy)
+
+
+def test_unknown_division_raises_value_error():
+    teams = league()
+    teams.loc[0, "divisionName"] = "Adams"
+
+    with pytest.raises(ValueError, match="Adams"):
+        PlayoffSimulator(teams)
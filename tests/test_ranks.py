@@ -0,0 +1,107 @@
+"""Posições e percentis (`ranks.py`)."""
+
+import numpy as np
+import pyarrow.parquet as pq
+
+from config import PLAYER_ALL_PATH, PLAYER_RANKS_PATH, team_path, team_ranks_path
+from ranks import group_ranks, rank_players, rank_teams
+from storage import save_records
+
+SEASON = "20242025"
+
+
+def test_group_ranks_ties_missing_values_and_direction():
+    values = np.array(
+        [[10.0, 3.0], [20.0, 1.0], [20.0, np.nan], [5.0, 2.0], [7.0, 9.0]]
+    )
+    groups = np.array([0, 0, 0, 0, 1])
+
+    rank, percentile = group_ranks(values, groups, np.array([False, True]))
+
+    # Competição (1, 1, 3, 4); sem valor fica de fora da posição e do total
+    assert rank[:4, 0].tolist() == [3, 1, 1, 4]
+    assert percentile[:4, 0].round(1).tolist() == [33.3, 100.0, 100.0, 0.0]
+    assert rank[[0, 1, 3], 1].tolist() == [3, 1, 2]
+    assert percentile[[0, 1, 3], 1].tolist() == [0.0, 100.0, 50.0]
+    assert np.isnan(rank[2, 1]) and np.isnan(percentile[2, 1])
+    # Único do grupo: primeiro e percentil 100
+    assert (rank[4].tolist(), percentile[4].tolist()) == ([1, 1], [100, 100])
+
+
+def standings(with_divisions=True):
+    teams = [
+        ("Bruins", "Atlantic", 110, 20),
+        ("Leafs", "Atlantic", 102, 25),
+        ("Oilers", "Pacific", 102, 22),
+        ("Kings", "Pacific", 99, 30),
+    ]
+    return [
+        {
+            "team_name": name,
+            **({"divisionName": division} if with_divisions else {}),
+            "team_points": points,
+            "losses": losses,
+        }
+        for name, division, points, losses in teams
+    ]
+
+
+def test_rank_teams_in_the_league_and_division():
+    save_records(standings(), team_path(SEASON))
+
+    assert rank_teams(SEASON) == 4
+
+    ranks = pq.read_table(team_ranks_path(SEASON)).to_pydict()
+    assert ranks["team_name"] == ["Bruins", "Leafs", "Oilers", "Kings"]
+    assert set(ranks["season"]) == {SEASON}
+    assert ranks["team_pointsRank"] == [1, 2, 2, 4]
+    assert ranks["team_pointsDivisionRank"] == [1, 2, 1, 2]
+    # Menos derrotas é melhor
+    assert ranks["lossesRank"] == [1, 3, 2, 4]
+    assert ranks["lossesDivisionPctl"] == [100.0, 0.0, 100.0, 0.0]
+
+
+def test_rank_teams_without_divisions_ranks_only_in_the_league():
+    save_records(standings(with_divisions=False), team_path(SEASON))
+
+    assert rank_teams(SEASON) == 4
+
+    ranks = pq.read_table(team_ranks_path(SEASON)).to_pydict()
+    assert ranks["team_pointsRank"] == [1, 2, 2, 4]
+    assert not any("Division" in column for column in ranks)
+
+
+def test_rank_teams_without_standings():
+    assert rank_teams(SEASON) == 0
+    assert not team_ranks_path(SEASON).exists()
+
+
+def test_rank_players_by_season_and_position():
+    players = [
+        (1, "20242025", "C", 20, 40),
+        (2, "20242025", "D", 30, 40),
+        (3, "20242025", "C", 25, 41),
+        (4, "20232024", "C", 5, 40),
+    ]
+    save_records(
+        (
+            {
+                "playerId": player_id,
+                "season": season,
+                "position": position,
+                "points": points,
+                "sweaterNumber": number,
+            }
+            for player_id, season, position, points, number in players
+        ),
+        PLAYER_ALL_PATH,
+    )
+
+    assert rank_players() == 4
+
+    ranks = pq.read_table(PLAYER_RANKS_PATH).to_pydict()
+    assert ranks["playerId"] == [1, 2, 3, 4]
+    assert ranks["pointsRank"] == [3, 1, 2, 1]
+    assert ranks["pointsPositionRank"] == [2, 1, 1, 1]
+    # Identificadores numéricos não são estatísticas
+    assert not any(column.startswith("sweaterNumber") for column in ranks)
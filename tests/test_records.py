@@ -0,0 +1,62 @@
+"""Construtor colunar de registros (`records.py`)."""
+
+import pytest
+
+from records import ColumnBuilder
+
+FIELDS = [("name", "string"), ("goals", "int16"), ("savePct", "double")]
+
+
+def test_missing_values_become_nulls():
+    builder = ColumnBuilder(FIELDS)
+    builder.append({"name": "A", "goals": 3, "savePct": None})
+    builder.append({"name": "B"})
+
+    table = builder.to_arrow()
+
+    assert table.to_pydict() == {
+        "name": ["A", "B"],
+        "goals": [3, None],
+        "savePct": [None, None],
+    }
+
+
+@pytest.mark.parametrize(
+    ("record", "column"),
+    [
+        ({"name": "A", "goals": 1.5}, "goals"),
+        ({"name": "A", "goals": 40_000}, "goals"),
+        ({"name": "A", "goals": 1, "savePct": "0.915"}, "savePct"),
+    ],
+)
+def test_invalid_value_names_the_column_and_drops_the_record(record, column):
+    builder = ColumnBuilder(FIELDS)
+    builder.append({"name": "A", "goals": 2, "savePct": 0.9})
+
+    with pytest.raises(ValueError, match=f"'{column}'"):
+        builder.append(record)
+
+    builder.append({"name": "B", "goals": None, "savePct": 0.8})
+    assert len(builder) == 2
+    assert builder.to_arrow().to_pydict() == {
+        "name": ["A", "B"],
+        "goals": [2, None],
+        "savePct": [0.9, 0.8],
+    }
+
+
+@pytest.mark.parametrize("export", [ColumnBuilder.to_arrow, ColumnBuilder.to_pandas])
+def test_append_after_export_is_refused_until_clear(export):
+    builder = ColumnBuilder(FIELDS)
+    builder.append({"name": "A", "goals": 2, "savePct": 0.9})
+    frame = export(builder)
+
+    with pytest.raises(RuntimeError, match="clear"):
+        builder.append({"name": "B", "goals": 1, "savePct": 0.8})
+    assert len(builder) == 1
+    assert {len(values) for values in builder.values.values()} == {1}
+    assert len(frame) == 1
+
+    builder.clear()
+    builder.append({"name": "B", "goals": 1, "savePct": 0.8})
+    assert builder.to_arrow().to_pydict()["name"] == ["B"]
@@ -0,0 +1,126 @@
+"""Reprocessamento do arquivo bruto: uma publicação por temporada, da data
+mais recente, e jogadores só com a lista de IDs completa.
+"""
+
+import gzip
+import json
+
+import pandas as pd
+import pytest
+
+import extract_team
+import reprocess
+from archive import RawArchive, list_all_parts, list_parts
+from config import PLAYER_ALL_PATH, RAW_DIR, player_id_path, team_path
+from storage import read_records, save_records
+from stub_api import synthetic_standings
+
+
+def standings(season, played):
+    return {"standings": [{"seasonId": season, "gamesPlayed": played}]}
+
+
+def test_newest_by_season_keeps_the_newest_date_of_each_season():
+    entries = [
+        ("2024-04-18", standings(20232024, 82)),
+        ("2023-04-14", standings(20222023, 82)),
+        ("2024-01-15", standings(20232024, 45)),
+        ("2023-11-01", {"standings": []}),
+    ]
+
+    newest = reprocess.newest_by_season(entries, reprocess._season_id("standings"))
+
+    assert list(newest) == ["20222023", "20232024"]
+    assert newest["20232024"][0] == "2024-04-18"
+    assert newest["20222023"][0] == "2023-04-14"
+
+
+def test_newest_by_season_prefers_the_last_archived_on_equal_keys():
+    entries = [
+        ("20242025", {"data": [{"seasonId": 20242025, "n": 1}]}),
+        ("20242025", {"data": [{"seasonId": 20242025, "n": 2}]}),
+    ]
+
+    newest = reprocess.newest_by_season(entries, reprocess._season_id("data"))
+
+    assert newest["20242025"][1]["data"][0]["n"] == 2
+
+
+def test_reprocess_teams_publishes_each_season_once(monkeypatch):
+    days = ["2024-04-18", "2023-04-14", "2024-01-15", "2023-12-01"]
+    with RawArchive() as archive:
+        for day in days:
+            archive.append("standings", day, synthetic_standings(day))
+
+    saved = []
+    save_standings = extract_team.SimpleNHLExtractor.save_standings
+
+    def record(self, data, date):
+        saved.append(date)
+        return save_standings(self, data, date)
+
+    monkeypatch.setattr(extract_team.SimpleNHLExtractor, "save_standings", record)
+
+    assert reprocess.reprocess_teams(list_parts("standings")) == 2
+
+    assert saved == ["2023-04-14", "2024-04-18"]
+    teams = pd.read_csv(team_path("20232024"), sep=";")
+    final = synthetic_standings("2024-04-18")["standings"]
+    assert teams["gamesPlayed"].tolist() == [team["gamesPlayed"] for team in final]
+
+
+def landing(player_id, points):
+    return {
+        "playerId": player_id,
+        "firstName": {"default": "Jogador"},
+        "lastName": {"default": str(player_id)},
+        "position": "C",
+        "featuredStats": {
+            "season": 20252026,
+            "regularSeason": {"subSeason": {"gamesPlayed": 10, "points": points}},
+        },
+        "seasonTotals": [],
+    }
+
+
+def archive_players(date, points):
+    """Grava uma parte de `player_landing` na data informada."""
+
+    directory = RAW_DIR / "player_landing" / date
+    directory.mkdir(parents=True)
+    with gzip.open(directory / "part-00000.jsonl.gz", "wt", encoding="utf-8") as f:
+        for player_id, value in points.items():
+            entry = {"key": player_id, "payload": landing(player_id, value)}
+            f.write(json.dumps(entry) + "\n")
+
+
+@pytest.fixture
+def player_ids():
+    ids = [8478402, 8477934, 8479318]
+    save_records(
+        ({"playerId": player_id} for player_id in ids), player_id_path("20252026")
+    )
+    return ids
+
+
+def test_reprocess_players_takes_the_newest_response_across_dates(player_ids):
+    # A extração de ontem terminou; a de hoje parou depois de um jogador
+    archive_players("2025-11-01", {player_id: 1 for player_id in player_ids})
+    archive_players("2025-11-02", {player_ids[1]: 9})
+
+    assert reprocess.reprocess_players(list_all_parts("player_landing"), 1) == 3
+
+    players = list(read_records(PLAYER_ALL_PATH))
+    assert [int(player["playerId"]) for player in players] == player_ids
+    assert [int(player["points"]) for player in players] == [1, 9, 1]
+
+
+def test_reprocess_players_refuses_a_partial_rebuild(player_ids):
+    archive_players("2025-11-02", {player_ids[1]: 9})
+    parts = list_all_parts("player_landing")
+
+    with pytest.raises(ValueError, match="2 jogadores"):
+        reprocess.reprocess_players(parts, 1)
+    assert not PLAYER_ALL_PATH.exists()
+
+    assert reprocess.reprocess_players(parts, 1, allow_missing=True) == 1
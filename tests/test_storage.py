@@ -0,0 +1,95 @@
+"""Publicação atômica (`save_records`) e manifesto dos datasets."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from config import DATA_DIR
+from storage import data_version, file_hash, load_manifest, save_records
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PLAYERS = [
+    {"playerId": 8478402, "lastName": "McDavid", "points": 132},
+    {"playerId": 8477934, "lastName": "Draisaitl", "points": 106},
+]
+
+
+def players_path():
+    return DATA_DIR / "player" / "players.csv"
+
+
+def test_save_records_publishes_and_records_manifest():
+    path = players_path()
+
+    assert save_records(PLAYERS, path) == (True, 2)
+
+    manifest = load_manifest()
+    entry = manifest["datasets"]["player/players.csv"]
+    assert entry["rows"] == 2
+    assert entry["sha256"] == file_hash(path)
+    assert entry["changed_at"] == entry["extracted_at"]
+    assert manifest["version"] == data_version(manifest)
+    # Nenhum temporário fica para trás
+    assert [p.name for p in path.parent.iterdir()] == ["players.csv"]
+
+
+def test_save_records_skips_unchanged_content():
+    path = players_path()
+    save_records(PLAYERS, path)
+    before = load_manifest()
+    mtime = path.stat().st_mtime_ns
+
+    assert save_records(iter(PLAYERS), path) == (False, 2)
+
+    after = load_manifest()
+    entry = after["datasets"]["player/players.csv"]
+    assert path.stat().st_mtime_ns == mtime
+    assert entry["changed_at"] == before["datasets"]["player/players.csv"]["changed_at"]
+    assert after["version"] == before["version"]
+    assert [p.name for p in path.parent.iterdir()] == ["players.csv"]
+
+
+def test_save_records_changed_content_updates_version():
+    path = players_path()
+    save_records(PLAYERS, path)
+    before = load_manifest()["version"]
+
+    assert save_records(PLAYERS[:1], path) == (True, 1)
+
+    manifest = load_manifest()
+    assert manifest["datasets"]["player/players.csv"]["rows"] == 1
+    assert manifest["version"] != before
+
+
+def test_save_records_without_records_keeps_published_file():
+    path = players_path()
+    save_records(PLAYERS, path)
+    content = path.read_bytes()
+    before = load_manifest()
+
+    assert save_records([], path) == (False, 0)
+
+    assert path.read_bytes() == content
+    assert load_manifest()["datasets"] == before["datasets"]
+
+
+def test_manifest_updates_from_parallel_processes_are_kept():
+    # Shards na mesma máquina: processos gravando datasets diferentes
+    script = (
+        "import sys\n"
+        "from storage import record_dataset\n"
+        "for n in range(25):\n"
+        "    record_dataset(f'data/shard/{sys.argv[1]}-{n}.csv', 'hash', 1, True)\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    processes = [
+        subprocess.Popen([sys.executable, "-c", script, str(index)], env=env)
+        for index in range(4)
+    ]
+    assert all(process.wait() == 0 for process in processes)
+
+    with open(DATA_DIR / "manifest.json", encoding="utf-8") as f:
+        assert len(json.load(f)["datasets"]) == 100
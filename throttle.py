@@ -0,0 +1,235 @@
+"""
+Controle adaptativo de concorrência (AIMD) para as requisições à API.
+
+Em vez de pausas fixas entre requisições, cada host da API tem um limitador
+que controla quantas requisições podem ficar em voo ao mesmo tempo:
+
+- aumento aditivo: cada resposta saudável soma `1 / limite` ao limite (cerca
+  de +1 a cada "rodada" de requisições bem-sucedidas);
+- redução multiplicativa: 429, 5xx, timeouts ou latência subindo acima de
+  `LATENCY_FACTOR` vezes a latência de base multiplicam o limite por
+  `DECREASE_FACTOR` (no máximo uma redução por janela de latência, para que
+  uma rajada de erros não derrube o limite de uma vez);
+- `Retry-After` (segundos ou data HTTP) pausa todas as requisições do host.
+
+Requisições com 429, 5xx ou timeout são repetidas até `MAX_RETRIES` vezes.
+Os extratores do mesmo processo (ex.: no orquestrador) compartilham o
+limitador do host via `limiter_for(url)`.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+
+INITIAL_CONCURRENCY = 2
+MIN_CONCURRENCY = 1
+MAX_CONCURRENCY = 16
+
+# Redução multiplicativa em sinais de sobrecarga
+DECREASE_FACTOR = 0.5
+
+# Latência (média móvel) acima de N vezes a base conta como sobrecarga
+LATENCY_FACTOR = 3.0
+
+MAX_RETRIES = 3
+
+# Espera (s) antes de repetir quando a API não informa `Retry-After`
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+
+
+def parse_retry_after(value):
+    """Converte o cabeçalho `Retry-After` em segundos (ou `None`)."""
+
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(0.0, (moment - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveLimiter:
+    def __init__(
+        self,
+        initial=INITIAL_CONCURRENCY,
+        min_limit=MIN_CONCURRENCY,
+        max_limit=MAX_CONCURRENCY,
+        retries=MAX_RETRIES,
+    ):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.retries = retries
+
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.last_decrease = 0.0
+        self.latency = None
+        self.base_latency = None
+        self.condition = threading.Condition()
+
+        self.stats = {
+            "requests": 0,
+            "ok": 0,
+            "throttled": 0,
+            "server_errors": 0,
+            "timeouts": 0,
+            "slow": 0,
+            "retries": 0,
+            "decreases": 0,
+            "peak_limit": self.limit,
+        }
+
+    @property
+    def concurrency(self):
+        """Número de requisições simultâneas permitidas agora."""
+        return max(self.min_limit, int(self.limit))
+
+    def _acquire(self):
+        with self.condition:
+            while True:
+                wait = self.paused_until - time.monotonic()
+                if wait > 0:
+                    self.condition.wait(wait)
+                elif self.in_flight >= self.concurrency:
+                    self.condition.wait()
+                else:
+                    self.in_flight += 1
+                    self.stats["requests"] += 1
+                    return
+
+    def _release(self):
+        with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+
+    def _on_success(self, latency):
+        with self.condition:
+            self.stats["ok"] += 1
+
+            # Média móvel da latência e base (mínimo que sobe devagar)
+            if self.latency is None:
+                self.latency = self.base_latency = latency
+            else:
+                self.latency += 0.2 * (latency - self.latency)
+                self.base_latency = min(
+                    latency, self.base_latency + 0.01 * (latency - self.base_latency)
+                )
+
+            if self.latency > LATENCY_FACTOR * self.base_latency:
+                self.stats["slow"] += 1
+                self._decrease()
+            else:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+                self.stats["peak_limit"] = max(self.stats["peak_limit"], self.limit)
+            self.condition.notify_all()
+
+    def _decrease(self):
+        # Uma redução por janela: erros das requisições já em voo não contam
+        now = time.monotonic()
+        if now - self.last_decrease < (self.latency or BACKOFF_BASE):
+            return
+        self.last_decrease = now
+        self.limit = max(self.min_limit, self.limit * DECREASE_FACTOR)
+        self.stats["decreases"] += 1
+
+    def _on_overload(self, kind, retry_after=None):
+        with self.condition:
+            self.stats[kind] += 1
+            self._decrease()
+            if retry_after is not None:
+                self.paused_until = max(
+                    self.paused_until, time.monotonic() + retry_after
+                )
+            self.condition.notify_all()
+
+    def get(self, session, url, **kwargs):
+        """GET com controle de concorrência, repetindo 429/5xx/timeouts.
+
+        Retorna a última resposta (os chamadores tratam o status) ou repassa
+        a exceção do último timeout/erro de conexão.
+        """
+
+        for attempt in range(self.retries + 1):
+            if attempt:
+                with self.condition:
+                    self.stats["retries"] += 1
+
+            self._acquire()
+            start = time.monotonic()
+            try:
+                response = session.get(url, **kwargs)
+            except (requests.Timeout, requests.ConnectionError):
+                self._release()
+                self._on_overload("timeouts")
+                if attempt == self.retries:
+                    raise
+                time.sleep(min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt))
+                continue
+            latency = time.monotonic() - start
+            self._release()
+
+            status = response.status_code
+            if status != 429 and status < 500:
+                self._on_success(latency)
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if status == 429:
+                # Sem `Retry-After`, pausa o host pelo backoff padrão
+                if retry_after is None:
+                    retry_after = min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt)
+                self._on_overload("throttled", retry_after)
+            else:
+                self._on_overload("server_errors", retry_after)
+                if attempt < self.retries and retry_after is None:
+                    time.sleep(min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt))
+
+            if attempt == self.retries:
+                return response
+
+    def summary(self):
+        """Resumo do limitador para o relatório da execução."""
+
+        stats = self.stats
+        latency = f"{self.latency * 1000:.0f} ms" if self.latency else "-"
+        return (
+            f"concorrência {self.concurrency} (pico {int(stats['peak_limit'])}, "
+            f"máx {self.max_limit}) | {stats['requests']} requisições, "
+            f"{stats['retries']} repetidas | 429: {stats['throttled']}, "
+            f"5xx: {stats['server_errors']}, timeouts: {stats['timeouts']}, "
+            f"lentas: {stats['slow']} | latência média {latency}"
+        )
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def limiter_for(url):
+    """Limitador compartilhado do host da URL."""
+
+    host = urlsplit(url).netloc
+    with _limiters_lock:
+        if host not in _limiters:
+            _limiters[host] = AdaptiveLimiter()
+        return _limiters[host]
+
+
+def limiters():
+    """Limitadores criados neste processo (host → limitador)."""
+
+    with _limiters_lock:
+        return dict(_limiters)